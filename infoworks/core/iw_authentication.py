@@ -1,5 +1,11 @@
 #!/usr/bin/env python
+import hashlib
+import json
+import os
+import threading
+import time
 import traceback
+import jwt
 import requests
 import logging
 import infoworks.error
@@ -62,3 +68,97 @@ def is_token_valid(client_config, http_client=None):
     except Exception as e:
         logging.error('Failed to check token validity: ' + str(e))
         return False
+
+
+# bearer tokens shared by all the clients of this process, keyed by host and refresh token
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+_token_refresh_locks = {}
+
+
+def get_token_expiry(token):
+    """
+    reads the expiry of a bearer token from its JWT payload, without verifying the signature
+    :param token: bearer token
+    :return: expiry as epoch seconds, None if the token has no readable exp claim
+    """
+    try:
+        claims = jwt.JWT().decode(token, do_verify=False, do_time_check=False)
+        return float(claims["exp"]) if "exp" in claims else None
+    except Exception:
+        return None
+
+
+def is_token_expiring(token, leeway=local_configurations.TOKEN_REFRESH_LEEWAY_IN_SEC):
+    """
+    checks locally whether the bearer token expires within the next leeway seconds
+    :param token: bearer token
+    :param leeway: seconds before the expiry at which the token is considered expiring
+    :return: True or False, None if the expiry cannot be read from the token
+    """
+    if not token:
+        return True
+    expiry = get_token_expiry(token)
+    if expiry is None:
+        return None
+    return expiry - leeway <= time.time()
+
+
+def _get_token_cache_key(protocol, ip, port, refresh_token):
+    return hashlib.sha256(f"{protocol}://{ip}:{port}|{refresh_token}".encode()).hexdigest()
+
+
+def _read_token_cache_file():
+    try:
+        with open(local_configurations.TOKEN_CACHE_LOCATION) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_token_cache_file(cache_key, token):
+    try:
+        cached_tokens = _read_token_cache_file()
+        cached_tokens = {key: value for key, value in cached_tokens.items() if is_token_expiring(value) is False}
+        cached_tokens[cache_key] = token
+        temp_path = f"{local_configurations.TOKEN_CACHE_LOCATION}.{os.getpid()}.tmp"
+        with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as cache_file:
+            json.dump(cached_tokens, cache_file)
+        os.replace(temp_path, local_configurations.TOKEN_CACHE_LOCATION)
+    except OSError as e:
+        logging.warning('Failed to write the bearer token cache: ' + str(e))
+
+
+def _get_token_refresh_lock(cache_key):
+    with _token_cache_lock:
+        return _token_refresh_locks.setdefault(cache_key, threading.Lock())
+
+
+def get_cached_bearer_token(protocol, ip, port, refresh_token, http_client=None, force_refresh=False, stale_token=None):
+    """
+    returns a bearer token for the refresh token, reusing a cached one until it is about to expire.
+    Tokens are cached in process and, if TOKEN_CACHE_LOCATION is set, in that file so that other processes reuse them.
+    Only one thread fetches a token for a host and refresh token at a time, the threads waiting for it reuse its token
+    :param force_refresh: fetch a new token even if the cached one looks valid
+    :param stale_token: token rejected by the server, a forced refresh reuses the cached token if it is a different one
+    :return: bearer token
+    """
+    cache_key = _get_token_cache_key(protocol, ip, port, refresh_token)
+    with _get_token_refresh_lock(cache_key):
+        token = _token_cache.get(cache_key)
+        if token is None and local_configurations.TOKEN_CACHE_LOCATION:
+            token = _read_token_cache_file().get(cache_key)
+        if token is not None:
+            if force_refresh:
+                # another thread has already replaced the rejected token while this one was waiting for the lock
+                reusable = stale_token is not None and token != stale_token and is_token_expiring(token) is not True
+            else:
+                reusable = is_token_expiring(token) is False
+            if reusable:
+                _token_cache[cache_key] = token
+                return token
+        token = get_bearer_token(protocol, ip, port, refresh_token, http_client)
+        _token_cache[cache_key] = token
+        if local_configurations.TOKEN_CACHE_LOCATION:
+            _write_token_cache_file(cache_key, token)
+        return token
@@ -44,3 +44,9 @@ class GenericError(Exception):
     def __init__(self, message):
         self.message = message
         super(GenericError, self).__init__(self.message)
+
+
+class PaginationError(GenericError):
+    def __init__(self, message, response=None):
+        self.response = response
+        super(PaginationError, self).__init__(message)
@@ -1,4 +1,4 @@
-from infoworks.error import AdminError
+from infoworks.error import AdminError, PaginationError
 from infoworks.sdk import url_builder
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.local_configurations import Response, ErrorCode
@@ -32,30 +32,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_users,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_users, response=response, pagination=pagination):
                     users_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing users",
-                                                            response=response
-                                                            )
 
                 response["result"] = users_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing users", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing users")
             raise AdminError("Error in listing users" + str(e))
@@ -231,19 +216,8 @@ class AdminClient(BaseClient):
                 if user_id is not None:
                     users_list.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_user_details, response=response, pagination=pagination):
                         users_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = users_list
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -491,7 +465,7 @@ class AdminClient(BaseClient):
             src_id, table_id = src_table_id.split(":")
             self.alation_compatible_lineage_for_source(src_id, table_id)
 
-    def get_environment_details(self, environment_id=None, params=None, pagination=True):
+    def get_environment_details(self, environment_id=None, params=None, pagination=True, use_cache=False):
         """
         Function to get environment details
         :param environment_id: Entity identifier of the environment
@@ -500,6 +474,8 @@ class AdminClient(BaseClient):
         :type params: Dict
         :param pagination: Boolean value to determine whether to return entire result set or only a portion of result defined by limit under params
         :type pagination: Boolean
+        :param use_cache: serve the first page from the response cache of the client, if one is set
+        :type use_cache: Boolean
         :return: Response Dict
         """
         if params is None and environment_id is None:
@@ -510,7 +486,8 @@ class AdminClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_environments,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=use_cache).content)
             if response is not None:
                 result = response.get("result", None)
                 if result is None:
@@ -524,19 +501,8 @@ class AdminClient(BaseClient):
                 if environment_id is not None:
                     env_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_environments, response=response, pagination=pagination):
                         env_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = env_details
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -613,7 +579,7 @@ class AdminClient(BaseClient):
             self.logger.error("Error in updating environment" + str(e))
             raise AdminError("Error in updating environment" + str(e))
 
-    def get_storage_details(self, environment_id, storage_id=None, params=None, pagination=True):
+    def get_storage_details(self, environment_id, storage_id=None, params=None, pagination=True, use_cache=False):
         """
         Function to get storage details
         :param environment_id: Entity identifier of the environment
@@ -624,6 +590,8 @@ class AdminClient(BaseClient):
         :type params: Dict
         :param pagination: Boolean value to determine whether to return entire result set or only a portion of result defined by 'limit' under params
         :type pagination: Boolean
+        :param use_cache: serve the first page from the response cache of the client, if one is set
+        :type use_cache: Boolean
         :return: Response Dict
         """
         if params is None and storage_id is None:
@@ -634,7 +602,8 @@ class AdminClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_storages,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=use_cache).content)
             if response is not None:
                 result = response.get("result", None)
                 if result is None:
@@ -648,19 +617,8 @@ class AdminClient(BaseClient):
                 if storage_id is not None:
                     storage_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_storages, response=response, pagination=pagination):
                         storage_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = storage_details
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -675,7 +633,7 @@ class AdminClient(BaseClient):
             raise AdminError("Error in getting storage details" + str(e))
 
     def get_compute_template_details(self, environment_id, compute_id=None, is_interactive=False, params=None,
-                                     pagination=True):
+                                     pagination=True, use_cache=False):
         """
          Function to get compute template details
          :param environment_id: Entity identifier of the environment
@@ -688,6 +646,8 @@ class AdminClient(BaseClient):
          :type params: Dict
          :param pagination: Boolean value to determine whether to return entire result set or only a portion of result defined by 'limit' under params
          :type pagination: Boolean
+         :param use_cache: serve the first page from the response cache of the client, if one is set
+         :type use_cache: Boolean
          :return: Response Dict
          """
         if params is None and compute_id is None:
@@ -704,7 +664,8 @@ class AdminClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_computes,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=use_cache).content)
             if response is not None and "result" in response:
                 result = response.get("result", None)
                 if result is None:
@@ -718,19 +679,8 @@ class AdminClient(BaseClient):
                 if compute_id is not None:
                     compute_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_computes, response=response, pagination=pagination):
                         compute_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = compute_details
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -752,7 +702,8 @@ class AdminClient(BaseClient):
         :type environment_name: String
         :return: Response Dict
         """
-        response = self.get_environment_details(environment_id=None, params={"filter": {"name": environment_name}})
+        response = self.get_environment_details(environment_id=None, params={"filter": {"name": environment_name}},
+                                                pagination=False, use_cache=True)
         if response.get("result", {}).get("status", "") == Response.Status.SUCCESS:
             result = response.get("result", {}).get("response", {}).get("result", {})
             if len(result) > 0:
@@ -828,7 +779,8 @@ class AdminClient(BaseClient):
         :return: Response Dict
         """
         response = self.get_compute_template_details(environment_id, compute_id=None, is_interactive=True,
-                                                     params={"filter": {"name": compute_name}})
+                                                     params={"filter": {"name": compute_name}}, pagination=False,
+                                                     use_cache=True)
         if response.get("result", {}).get("status", "") == Response.Status.SUCCESS:
             result = response.get("result", {}).get("response", {}).get("result", [])
             if len(result) > 0:
@@ -837,7 +789,8 @@ class AdminClient(BaseClient):
             else:
                 response_non_interactive = self.get_compute_template_details(environment_id, compute_id=None,
                                                                              is_interactive=False,
-                                                                             params={"filter": {"name": compute_name}})
+                                                                             params={"filter": {"name": compute_name}},
+                                                                             pagination=False, use_cache=True)
                 result_non_interactive = response_non_interactive.get("result", {}).get("response", {}).get("result",
                                                                                                             [])
                 if len(result_non_interactive) > 0:
@@ -863,7 +816,8 @@ class AdminClient(BaseClient):
         :return: Response Dict
         """
         response = self.get_storage_details(environment_id=environment_id,
-                                            params={"filter": {"name": storage_name}})
+                                            params={"filter": {"name": storage_name}}, pagination=False,
+                                            use_cache=True)
         if response.get("result", {}).get("status", "") == Response.Status.SUCCESS:
             result = response.get("result", {}).get("response", {}).get("result", [])
             if len(result) > 0:
@@ -898,30 +852,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_source_extensions,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_source_extensions, response=response, pagination=pagination):
                     source_extensions_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing secret store",
-                                                            response=response
-                                                            )
 
                 response["result"] = source_extensions_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing secret store", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing secret stores")
             raise AdminError("Error in listing secret store" + str(e))
@@ -1169,19 +1108,8 @@ class AdminClient(BaseClient):
                 if data_connection_id is not None:
                     dataconnection_list.append(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_get_data_connection, response=response, pagination=pagination):
                         dataconnection_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = dataconnection_list
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -1243,30 +1171,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_secret_stores,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_secret_stores, response=response, pagination=pagination):
                     secret_stores_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing secret store",
-                                                            response=response
-                                                            )
 
                 response["result"] = secret_stores_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing secret store", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing secret stores")
             raise AdminError("Error in listing secret store" + str(e))
@@ -1423,30 +1336,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_service_authentication,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_service_authentication, response=response, pagination=pagination):
                     secret_stores_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing service authentication",
-                                                            response=response
-                                                            )
 
                 response["result"] = secret_stores_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing service authentication", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing service authentication")
             raise AdminError("Error in listing service authentication" + str(e))
@@ -1619,30 +1517,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_secrets,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_secrets, response=response, pagination=pagination):
                     secret_stores_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing secrets",
-                                                            response=response
-                                                            )
 
                 response["result"] = secret_stores_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing secrets", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing secrets")
             raise AdminError("Error in listing secrets" + str(e))
@@ -1792,30 +1675,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_domains,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_domains, response=response, pagination=pagination):
                     users_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing domains",
-                                                            response=response
-                                                            )
 
                 response["result"] = users_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing domains", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing domains")
             raise AdminError("Error in listing domains" + str(e))
@@ -1962,29 +1830,14 @@ class AdminClient(BaseClient):
                 self.call_api("GET", accessible_sources_url,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(accessible_sources_url, response=response, pagination=pagination):
                     output_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing accessible sources",
-                                                            response=response
-                                                            )
 
                 response["result"] = output_list
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing accessible sources", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing accessible sources")
             raise AdminError("Error in listing accessible sources" + str(e))
@@ -2063,29 +1916,14 @@ class AdminClient(BaseClient):
                 self.call_api("GET", schedules_url,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(schedules_url, response=response, pagination=pagination):
                     output_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing schedules",
-                                                            response=response
-                                                            )
 
                 response["result"] = output_list
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing schedules", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing schedules")
             raise AdminError("Error in listing schedules" + str(e))
@@ -2111,29 +1949,14 @@ class AdminClient(BaseClient):
                 self.call_api("GET", job_hooks_url,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(job_hooks_url, response=response, pagination=pagination):
                     output_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing job_hooks",
-                                                            response=response
-                                                            )
 
                 response["result"] = output_list
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing job_hooks", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing job_hooks")
             raise AdminError("Error in listing job_hooks" + str(e))
@@ -2231,30 +2054,15 @@ class AdminClient(BaseClient):
                 self.call_api("GET", url_to_list_generic_source_types,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_generic_source_types, response=response, pagination=pagination):
                     generic_source_types_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing generic source types",
-                                                            response=response
-                                                            )
 
                 response["result"] = generic_source_types_list
 
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing generic source types", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing generic source types")
             raise AdminError("Error in listing generic source types" + str(e))
@@ -2347,20 +2155,8 @@ class AdminClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_custom_tags, response=response, pagination=pagination):
                     custom_tags_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get list of custom tags")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, response=response)
@@ -2384,7 +2180,8 @@ class AdminClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_builder.get_custom_tags_url(self.client_config, custom_tag_id),
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=True).content)
             result = response.get("result", None)
             if result is not None:
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -2419,18 +2216,8 @@ class AdminClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_custom_tags, response=response):
                     custom_tags_list.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get list of custom tags")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, response=response)
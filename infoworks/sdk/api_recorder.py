@@ -0,0 +1,139 @@
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import unquote, urlsplit
+
+from infoworks.sdk.response_cache import build_response
+
+
+def get_request_key(method, url, data=None):
+    """
+    :return: key of a request, independent of the host the client points to and of the dates in its filters (the
+    job listings are filtered on a time window that moves with the time of the call)
+    """
+    parts = urlsplit(url.replace("#", "%23"))
+    query = re.sub(r'\{"\$date":\s*"[^"]*"\}', '{"$date": ""}', unquote(parts.query))
+    request = f"{method.upper()} {parts.path}?{query}"
+    if data is not None:
+        request = request + " " + (data if isinstance(data, str) else json.dumps(data, sort_keys=True, default=str))
+    return hashlib.sha1(request.encode("utf-8")).hexdigest()
+
+
+class ApiRecorder(object):
+    """
+    Saves the responses of the api calls made by a client to a directory, one json file per request, so that they can
+    be served again by ApiReplayer without an Infoworks cluster.
+
+    ```
+    ApiRecorder("/tmp/iwx_fixtures").attach(iwx_client)
+    iwx_client.get_abc_job_metrics(time_range_for_jobs_in_mins=60)
+    ```
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: directory the responses are written to
+        :type directory: String
+        """
+        self.directory = os.path.expanduser(directory)
+        self.recorded = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def attach(self, client):
+        """
+        records the responses of the client from now on
+        :param client: InfoworksClientSDK or any of its client classes
+        :return: the client
+        """
+        call_api = client._call_api
+
+        def recording_call_api(method, url, headers=None, data=None):
+            response = call_api(method, url, headers, data)
+            self.save(method, url, data, response)
+            return response
+
+        client._call_api = recording_call_api
+        return client
+
+    def save(self, method, url, data, response):
+        try:
+            content = {"text": response.content.decode("utf-8")}
+        except UnicodeDecodeError:
+            content = {"base64": base64.b64encode(response.content).decode("ascii")}
+        fixture = dict(content, method=method.upper(), url=url, status_code=response.status_code,
+                       headers=dict(response.headers))
+        path = os.path.join(self.directory, get_request_key(method, url, data) + ".json")
+        with open(path + ".tmp", "w") as fixture_file:
+            json.dump(fixture, fixture_file)
+        os.replace(path + ".tmp", path)
+        with self._lock:
+            self.recorded = self.recorded + 1
+
+
+class ApiReplayer(object):
+    """
+    Serves the responses saved by ApiRecorder in place of the api, after a configurable latency.
+    Requests that were not recorded are passed to fallback (e.g. a synthetic api of a benchmark) or answered with 404.
+
+    ```
+    ApiReplayer("/tmp/iwx_fixtures", latency=0.05).attach(iwx_client)
+    ```
+    """
+
+    def __init__(self, directory=None, latency=0.0, fallback=None):
+        """
+        :param directory: directory written by ApiRecorder
+        :type directory: String
+        :param latency: seconds every call takes, a float or a function of (method, url) returning one
+        :type latency: Float
+        :param fallback: function of (method, url, data) returning (status_code, response dict) for the requests
+        that were not recorded
+        :type fallback: Function
+        """
+        self.latency = latency
+        self.fallback = fallback
+        self.calls = 0
+        self.misses = 0
+        self._fixtures = {}
+        self._lock = threading.Lock()
+        if directory is not None:
+            directory = os.path.expanduser(directory)
+            for file_name in os.listdir(directory):
+                if file_name.endswith(".json"):
+                    with open(os.path.join(directory, file_name), "r") as fixture_file:
+                        self._fixtures[file_name[:-len(".json")]] = json.load(fixture_file)
+
+    def attach(self, client):
+        """
+        serves the api calls of the client from the fixtures from now on
+        :param client: InfoworksClientSDK or any of its client classes
+        :return: the client
+        """
+        client._call_api = self.call_api
+        return client
+
+    def call_api(self, method, url, headers=None, data=None):
+        latency = self.latency(method, url) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        fixture = self._fixtures.get(get_request_key(method, url, data))
+        with self._lock:
+            self.calls = self.calls + 1
+            if fixture is None:
+                self.misses = self.misses + 1
+        if fixture is not None:
+            if "base64" in fixture:
+                content = base64.b64decode(fixture["base64"])
+            else:
+                content = fixture["text"].encode("utf-8")
+            return build_response(url, fixture["status_code"], fixture["headers"], content)
+        if self.fallback is not None:
+            status_code, body = self.fallback(method, url, data)
+        else:
+            status_code, body = 404, {"message": f"No recorded response for {method.upper()} {url}"}
+        return build_response(url, status_code, {"Content-Type": "application/json"}, json.dumps(body).encode("utf-8"))
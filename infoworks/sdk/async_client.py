@@ -0,0 +1,62 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from infoworks.sdk import local_configurations
+from infoworks.sdk.base_client import initialise_http_client
+from infoworks.sdk.client import InfoworksClientSDK
+
+
+class AsyncInfoworksClientSDK(object):
+    """
+    asyncio flavour of InfoworksClientSDK.
+    Every public method of InfoworksClientSDK is available with the same name and arguments, but returns a coroutine.
+    The api calls run on a bounded worker pool over one pooled http session, so many coroutines can be awaited
+    together (e.g. with asyncio.gather) without opening more than max_connections_per_host connections to Infoworks.
+
+    ```
+    async with AsyncInfoworksClientSDK(max_connections_per_host=20) as iwx_client:
+        await iwx_client.initialize_client_with_defaults(protocol, host, port, refresh_token)
+        responses = await asyncio.gather(*[iwx_client.list_tables_in_source(source_id) for source_id in source_ids])
+    ```
+    """
+
+    def __init__(self, max_connections_per_host=local_configurations.MAX_CONNECTIONS_PER_HOST,
+                 max_workers=local_configurations.ASYNC_MAX_WORKERS):
+        """
+        :param max_connections_per_host: maximum number of concurrent connections opened to the Infoworks host
+        :type max_connections_per_host: Integer
+        :param max_workers: maximum number of api methods executing at the same time
+        :type max_workers: Integer
+        """
+        self.client = InfoworksClientSDK()
+        # pool_block makes the requests wait for a free connection, which caps the concurrency per host
+        self.client.http = initialise_http_client(pool_maxsize=max_connections_per_host, pool_block=True)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="iwx_sdk_async")
+
+    def __getattr__(self, name):
+        attribute = getattr(self.client, name)
+        if name.startswith("_") or not inspect.ismethod(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def coroutine(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(attribute, *args, **kwargs))
+
+        return coroutine
+
+    async def close(self):
+        """
+        waits for the running api calls to finish and releases the worker pool and the http connections
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
+        self.client.http.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
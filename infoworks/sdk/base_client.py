@@ -1,9 +1,11 @@
 import logging.config
 import os
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from pathlib import Path
 import requests
-from infoworks.core.iw_authentication import is_token_valid, get_bearer_token
+from infoworks.error import PaginationError
+from infoworks.core.iw_authentication import is_token_valid, is_token_expiring, get_cached_bearer_token
 from infoworks.sdk import local_configurations
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -27,11 +29,19 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         return super().send(request, **kwargs)
 
 
-def initialise_http_client():
+def initialise_http_client(pool_maxsize=local_configurations.MAX_CONNECTIONS_PER_HOST, pool_block=False):
+    """
+    creates the http session shared by all the api calls of a client
+    :param pool_maxsize: maximum number of connections kept open per host
+    :type pool_maxsize: Integer
+    :param pool_block: if True, callers wait for a free connection instead of opening more than pool_maxsize per host
+    :type pool_block: Boolean
+    :return: requests Session
+    """
     retries = Retry(total=local_configurations.MAX_RETRIES, backoff_factor=1,
                     status_forcelist=[429, 500, 502, 503, 504])
     http = requests.Session()
-    adapter = TimeoutHTTPAdapter(max_retries=retries)
+    adapter = TimeoutHTTPAdapter(max_retries=retries, pool_maxsize=pool_maxsize, pool_block=pool_block)
     http.mount("https://", adapter)
     http.mount("http://", adapter)
     return http
@@ -53,6 +63,7 @@ class BaseClient(object):
         self.secrets_config = {"custom_secrets_read": False}
         self.mappings = {}
         self.http = initialise_http_client()
+        self.response_cache = None
         log_path = Path(local_configurations.LOG_LOCATION)
         if os.path.isdir(log_path.parent.absolute()):
             logging.basicConfig(filename=local_configurations.LOG_LOCATION, filemode='w',
@@ -100,7 +111,7 @@ class BaseClient(object):
         :param default_environment_id: Pass the default environment id to be used for all the artifacts to be created
         """
         self.client_config['refresh_token'] = refresh_token
-        self.client_config['bearer_token'] = get_bearer_token(protocol, ip, port, refresh_token)
+        self.client_config['bearer_token'] = get_cached_bearer_token(protocol, ip, port, refresh_token, self.http)
         self.initialize_client(protocol, ip, port)
         self.client_config[
             'default_environment_id'] = default_environment_id if default_environment_id is not None else None
@@ -115,20 +126,90 @@ class BaseClient(object):
         return self.client_config
 
     def regenerate_bearer_token_if_needed(self, headers):
-        if not is_token_valid(self.client_config, self.http):
-            self.client_config['bearer_token'] = get_bearer_token(protocol=self.client_config["protocol"],
-                                                                  ip=self.client_config["ip"],
-                                                                  port=self.client_config["port"],
-                                                                  refresh_token=self.client_config["refresh_token"])
-            headers = IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
-        return headers
-
-    def call_api(self, method, url, headers=None, data=None):
+        stale_token = self.get_bearer_token_from_headers(headers)
+        if stale_token is not None and stale_token != self.client_config['bearer_token']:
+            # another thread has refreshed the token while this request was in flight
+            return dict(headers, **IWUtils.get_default_header_for_v3(self.client_config['bearer_token']))
+        # the validate api is only called when the token expiry cannot be read locally or the token looks unexpired
+        if not is_token_expiring(self.client_config['bearer_token']) and is_token_valid(self.client_config, self.http):
+            return headers
+        return self.refresh_bearer_token(headers)
+
+    @staticmethod
+    def get_bearer_token_from_headers(headers):
+        authorization = (headers or {}).get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            return authorization[len("Bearer "):]
+        return None
+
+    def refresh_bearer_token(self, headers=None):
+        """
+        fetches a new bearer token for the client and returns the headers with the new token.
+        Concurrent callers share a single token request, see get_cached_bearer_token
+        :param headers: headers of the request being sent
+        :type headers: dict
+        :return: headers dict
+        """
+        stale_token = self.get_bearer_token_from_headers(headers) or self.client_config['bearer_token']
+        self.client_config['bearer_token'] = get_cached_bearer_token(protocol=self.client_config["protocol"],
+                                                                     ip=self.client_config["ip"],
+                                                                     port=self.client_config["port"],
+                                                                     refresh_token=self.client_config["refresh_token"],
+                                                                     http_client=self.http, force_refresh=True,
+                                                                     stale_token=stale_token)
+        if headers is None:
+            return IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
+        return dict(headers, **IWUtils.get_default_header_for_v3(self.client_config['bearer_token']))
+
+    def set_response_cache(self, response_cache):
+        """
+        sets the cache used for the GET calls made with use_cache=True, e.g. the name to id lookups.
+        Writes made by the client drop the cached responses of the resource they change.
+        :param response_cache: ResponseCache or SQLiteResponseCache from infoworks.sdk.response_cache, None disables caching
+        :type response_cache: ResponseCache
+        """
+        self.response_cache = response_cache
+
+    def call_api(self, method, url, headers=None, data=None, use_cache=False):
+        """
+        calls the Infoworks rest api
+        :param method: GET, POST, PUT, PATCH or DELETE
+        :type method: String
+        :param url: url of the api
+        :type url: String
+        :param headers: request headers
+        :type headers: dict
+        :param data: request body
+        :type data: dict
+        :param use_cache: serve a GET from the response cache of the client, if one is set
+        :type use_cache: Boolean
+        :return: requests Response
+        """
+        if self.response_cache is None:
+            return self._call_api(method, url, headers, data)
+        if method.upper() != "GET":
+            response = self._call_api(method, url, headers, data)
+            self.response_cache.invalidate(url)
+            return response
+        if use_cache:
+            response = self.response_cache.get(url)
+            if response is not None:
+                self.logger.info(f"Serving {url} from the response cache")
+                return response
+        response = self._call_api(method, url, headers, data)
+        if use_cache and response.status_code == 200:
+            self.response_cache.set(url, response)
+        return response
+
+    def _call_api(self, method, url, headers=None, data=None):
         # headers = self.regenerate_bearer_token_if_needed(headers)
         # adding the below code to encode the # in the url so it doesn't fragment the url
         import urllib.parse
         encoded_url = url.replace("#","%23")
         url = encoded_url
+        if headers is not None and "Authorization" in headers and self.client_config["refresh_token"] is not None \
+                and is_token_expiring(self.client_config['bearer_token']):
+            headers = self.refresh_bearer_token(headers)
         if method.upper() == "GET":
             self.logger.info(f"Calling {url}")
             response = self.http.get(url, headers=headers, timeout=local_configurations.REQUEST_TIMEOUT_IN_SEC,
@@ -180,6 +261,114 @@ class BaseClient(object):
             else:
                 return response
 
+    def iter_pages(self, url, response=None, pagination=True, items_key=None, method="GET", data=None):
+        """
+        yields the records of a paginated listing page by page, in order.
+        The page size is the limit of the request (query param of a GET, body of a POST). A first page shorter than
+        the limit ends the listing, after a full one the following pages are requested concurrently
+        (PAGINATION_PREFETCH_PAGES at a time) by offset and the listing stops at the first short page. Without a limit
+        the pages are requested one at a time, with the size of the first page, till an empty or shorter page.
+        :param url: url of the first page, including the query params built with get_query_params_string_from_dict
+        :type url: String
+        :param response: deserialized response of the first page, if the caller has already fetched it
+        :type response: dict
+        :param pagination: if False only the first page is returned
+        :type pagination: Boolean
+        :param items_key: key under 'result' holding the records, for listings that respond with {'result': {'items': []}}
+        :type items_key: String
+        :param method: GET, or POST for listings that take limit and offset in the request body
+        :type method: String
+        :param data: request body of the POST listings
+        :type data: dict
+        :return: generator of lists of records
+        :raises PaginationError: if a page after the first one has no result, with that page response
+        """
+
+        def get_records(page_response, first_page=False):
+            if first_page:
+                result = page_response.get("result", []) if page_response is not None else []
+            else:
+                result = page_response.get("result", None) if page_response is not None else None
+            if items_key is not None and isinstance(result, dict):
+                result = result.get(items_key, [] if first_page else None)
+            if result is None:
+                self.logger.error(f"Missing result in the page response of {url}: {page_response}")
+                if not first_page:
+                    raise PaginationError(f"Missing result in the page response of {url}", response=page_response)
+                return []
+            return result
+
+        def fetch_page(page_offset):
+            if method.upper() == "GET":
+                base_url, _, query = url.partition("?")
+                query_params = [param for param in query.split("&")
+                                if param and not param.startswith(("limit=", "offset="))]
+                query_params.extend([f"limit={page_size}", f"offset={page_offset}"])
+                page_url, page_data = base_url + "?" + "&".join(query_params), data
+            else:
+                page_url, page_data = url, dict(data or {}, limit=page_size, offset=page_offset)
+            return get_records(IWUtils.ejson_deserialize(
+                self.call_api(method, page_url, IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              data=page_data).content))
+
+        if response is None:
+            response = IWUtils.ejson_deserialize(
+                self.call_api(method, url, IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              data=data).content)
+        records = get_records(response, first_page=True)
+        if len(records) == 0:
+            return
+        yield records
+        if not pagination:
+            return
+        if method.upper() == "GET":
+            request_params = dict(param.split("=", 1) for param in url.partition("?")[2].split("&") if "=" in param)
+        else:
+            request_params = data if isinstance(data, dict) else {}
+        limit = str(request_params.get("limit") or "")
+        offset = str(request_params.get("offset") or "")
+        if limit.isdigit() and int(limit) > 0:
+            page_size = int(limit)
+            if len(records) < page_size:
+                return
+            prefetch_pages = max(1, local_configurations.PAGINATION_PREFETCH_PAGES)
+        else:
+            # the page size the server applied is not known, read on one page at a time
+            page_size = len(records)
+            prefetch_pages = 1
+        next_offset = (int(offset) if offset.isdigit() else 0) + len(records)
+        with ThreadPoolExecutor(max_workers=prefetch_pages) as executor:
+            while True:
+                page_offsets = [next_offset + page_size * i for i in range(prefetch_pages)]
+                for records in executor.map(fetch_page, page_offsets):
+                    if len(records) == 0:
+                        return
+                    yield records
+                    if len(records) < page_size:
+                        return
+                next_offset = page_offsets[-1] + page_size
+
+    def iter_records(self, url, error_class, error_message, items_key=None):
+        """
+        yields the records of a paginated listing one at a time. The iter_* methods check their arguments and build
+        the url before returning this generator, so that invalid calls fail when they are made.
+        :param url: url of the first page, see iter_pages
+        :type url: String
+        :param error_class: error raised, with error_message and the cause, if the listing fails
+        :type error_class: Exception class
+        :param error_message: message of the error raised
+        :type error_message: String
+        :param items_key: key under 'result' holding the records, see iter_pages
+        :type items_key: String
+        :return: generator of record dicts
+        """
+        try:
+            for records in self.iter_pages(url, items_key=items_key):
+                yield from records
+        except Exception as e:
+            self.logger.error(error_message + str(e))
+            raise error_class(error_message + str(e))
+
     def get_mappings_from_config_file(self, ini_config_file_path):
         config = ConfigParser()
         config.optionxform = str
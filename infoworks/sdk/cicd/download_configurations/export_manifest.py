@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import threading
+
+from infoworks.sdk.cicd.streaming_json import load_json_file
+from infoworks.sdk.url_builder import source_info, get_pipeline_url, create_workflow_url, list_tables_under_source
+from infoworks.sdk.utils import IWUtils
+
+EXPORT_MANIFEST_FILE_NAME = "export_manifest.json"
+
+
+def get_content_hash(content):
+    """
+    :return: sha256 of the bytes (or utf-8 encoded string) content
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_file_hash(file_path, chunk_size=1024 * 1024):
+    """
+    :return: sha256 of the bytes of the file, read chunk by chunk
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as file_obj:
+        for chunk in iter(lambda: file_obj.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def write_file_if_changed(file_path, content):
+    """
+    writes content to file_path unless the file already holds exactly these bytes, so that unchanged exports keep
+    their modification time and do not show up in git diffs
+    :return: True if the file was written
+    """
+    content = content.encode("utf-8") if isinstance(content, str) else content
+    if os.path.exists(file_path):
+        with open(file_path, "rb") as existing_file:
+            if existing_file.read() == content:
+                return False
+    with open(file_path + ".tmp", "wb") as new_file:
+        new_file.write(content)
+    os.replace(file_path + ".tmp", file_path)
+    return True
+
+
+class ExportManifest(object):
+    """
+    Remembers for every exported entity its server side modified_at, a version fingerprint and the sha256 of the file it
+    was exported to, in <config_file_dump_path>/export_manifest.json. An entity whose version did not move since the
+    last export, exported with the same options to a file that was not modified since, is not downloaded again.
+    The version of a source also covers the modified_at and watermarks of its tables, as the table configurations and
+    watermarks are part of its export.
+    """
+
+    def __init__(self, config_file_dump_path, options=None):
+        """
+        :param config_file_dump_path: directory the configurations are exported to
+        :type config_file_dump_path: String
+        :param options: export options (e.g. replace_words) the files depend on, entities exported with other options
+        are exported again
+        :type options: dict
+        """
+        self.config_file_dump_path = config_file_dump_path
+        self.path = os.path.join(config_file_dump_path, EXPORT_MANIFEST_FILE_NAME)
+        self.options_hash = get_content_hash(json.dumps(options or {}, sort_keys=True, default=str))
+        self.exported = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as manifest_file:
+                self.entries = json.load(manifest_file).get("entities", {})
+
+    @staticmethod
+    def get_entity_key(entity_type, entity_id):
+        return f"{entity_type}:{entity_id}"
+
+    def get_entity_version(self, cicd_client, entity_type, domain_id, entity_id):
+        """
+        :return: (modified_at, version) of the entity on the server, (None, None) if they could not be read
+        """
+        if entity_type == "source":
+            details_url = source_info(cicd_client.client_config, entity_id)
+        elif entity_type == "pipeline":
+            details_url = get_pipeline_url(cicd_client.client_config, domain_id, entity_id)
+        elif entity_type == "workflow":
+            details_url = create_workflow_url(cicd_client.client_config, domain_id) + f"/{entity_id}"
+        else:
+            return None, None
+        try:
+            response = cicd_client.call_api("GET", details_url, IWUtils.get_default_header_for_v3(
+                cicd_client.client_config['bearer_token']))
+            parsed_response = IWUtils.ejson_deserialize(response.content)
+            details = parsed_response.get("result") if response.status_code == 200 else None
+            if isinstance(details, list):
+                details = details[0] if details else None
+            if not details or details.get("modified_at") is None:
+                return None, None
+            modified_at = str(details["modified_at"])
+            version = [modified_at, details.get("active_version_id")]
+            if entity_type == "source":
+                tables_url = list_tables_under_source(cicd_client.client_config, entity_id) + \
+                    IWUtils.get_query_params_string_from_dict(params={"limit": 50, "offset": 0, "projections": {
+                        "id": 1, "modified_at": 1, "last_ingested_cdc_value": 1, "last_merged_watermark": 1,
+                        "row_count": 1, "full_load_performed": 1, "max_modified_timestamp": 1}})
+                tables = []
+                for result in cicd_client.iter_pages(tables_url):
+                    tables.extend(result)
+                version.append(sorted(json.dumps(table, sort_keys=True, default=str) for table in tables))
+            return modified_at, get_content_hash(json.dumps(version, default=str))
+        except Exception as error:
+            cicd_client.logger.error(f"Failed to get the version of {entity_type} {entity_id}: {error}")
+            return None, None
+
+    def get_unchanged_export(self, entity_type, entity_id, version):
+        """
+        :return: (file name, configuration) of the previous export of the entity if it is still up to date,
+        else (None, None)
+        """
+        with self._lock:
+            entry = self.entries.get(self.get_entity_key(entity_type, entity_id))
+        if version is None or entry is None or entry.get("version") != version or \
+                entry.get("options_hash") != self.options_hash:
+            return None, None
+        file_path = os.path.join(self.config_file_dump_path, entity_type, entry["file_name"])
+        if not os.path.exists(file_path):
+            return None, None
+        if get_file_hash(file_path) != entry.get("content_hash"):
+            return None, None
+        with self._lock:
+            self.skipped = self.skipped + 1
+        return entry["file_name"], load_json_file(file_path)
+
+    def record(self, entity_type, entity_id, modified_at, version, file_name):
+        """
+        records the export of an entity to <config_file_dump_path>/<entity_type>/<file_name>
+        """
+        content_hash = get_file_hash(os.path.join(self.config_file_dump_path, entity_type, file_name))
+        with self._lock:
+            self.exported = self.exported + 1
+            self.entries[self.get_entity_key(entity_type, entity_id)] = {
+                "entity_type": entity_type, "entity_id": entity_id, "modified_at": modified_at, "version": version,
+                "options_hash": self.options_hash, "file_name": file_name, "content_hash": content_hash}
+
+    def save(self):
+        with self._lock:
+            content = json.dumps({"entities": self.entries}, indent=4, sort_keys=True)
+        write_file_if_changed(self.path, content)
@@ -1,7 +1,10 @@
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from infoworks.sdk.cicd.download_configurations.get_pipeline_configuration import DownloadPipeline
-from infoworks.sdk.cicd.download_configurations.get_workflow_configuration import DownloadWorkflow
+from infoworks.sdk import local_configurations
+from infoworks.sdk.cicd.download_configurations.utils import Utils
 from infoworks.sdk.url_builder import create_pipeline_url, create_workflow_url
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.utils import IWUtils
@@ -23,64 +26,99 @@ class DownloadAllEntitiesFromDomain(BaseClient):
         except Exception as e:
             raise Exception("Unable to get response for url: {url}".format(url=nextUrl))
 
-    def cicd_get_all_configuration_dumps_from_domain(self, domain_ids, config_file_dump_path, files_overwrite=True,
-                                                     serviceaccountemail="admin@infoworks.io",
-                                                     replace_words=""):
-        if not os.path.exists(os.path.join(config_file_dump_path, "modified_files")):
-            os.makedirs(os.path.join(config_file_dump_path, "modified_files"))
-        if not os.path.exists(os.path.join(config_file_dump_path, "source")):
-            os.makedirs(os.path.join(config_file_dump_path, "source"))
-        if not os.path.exists(os.path.join(config_file_dump_path, "pipeline")):
-            os.makedirs(os.path.join(config_file_dump_path, "pipeline"))
-        if not os.path.exists(os.path.join(config_file_dump_path, "workflow")):
-            os.makedirs(os.path.join(config_file_dump_path, "workflow"))
-        for domain_id in domain_ids:
-            get_pipeline_url = create_pipeline_url(self.client_config, str(domain_id))
-            pipeline_ids = []
-            response = self.call_api("GET", get_pipeline_url,
+    def list_entity_ids_of_domain(self, domain_id):
+        """
+        :return: (pipeline ids, workflow ids) of the domain
+        """
+        entity_ids = []
+        for get_entities_url in [create_pipeline_url(self.client_config, str(domain_id)),
+                                 create_workflow_url(self.client_config, str(domain_id))]:
+            ids = []
+            response = self.call_api("GET", get_entities_url,
                                      IWUtils.get_default_header_for_v3(self.client_config['bearer_token']))
 
             parsed_response = IWUtils.ejson_deserialize(response.content)
             if response.status_code == 200:
-                result = parsed_response.get("result", [])
-                while len(result) > 0:
-                    pipeline_ids.extend([item["id"] for item in result])
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.json().get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = self.callurl(nextUrl)
-                    result = response.get("result", [])
-            get_workflow_url = create_workflow_url(self.client_config, str(domain_id))
-            workflow_ids = []
-            response = self.call_api("GET", get_workflow_url,
-                                     IWUtils.get_default_header_for_v3(self.client_config['bearer_token']))
+                for result in self.iter_pages(get_entities_url, response=parsed_response):
+                    ids.extend([item["id"] for item in result])
+            entity_ids.append(ids)
+        return entity_ids[0], entity_ids[1]
 
-            parsed_response = IWUtils.ejson_deserialize(response.content)
-            if response.status_code == 200:
-                result = parsed_response.get("result", [])
-                while len(result) > 0:
-                    workflow_ids.extend([item["id"] for item in result])
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.json().get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = self.callurl(nextUrl)
-                    result = response.get("result", [])
+    def cicd_get_all_configuration_dumps_from_domain(self, domain_ids, config_file_dump_path, files_overwrite=True,
+                                                     serviceaccountemail="admin@infoworks.io",
+                                                     replace_words="",
+                                                     max_workers=local_configurations.CICD_EXPORT_MAX_WORKERS):
+        """
+        Exports the configurations of all the pipelines and workflows of the domains. The entities of all the domains
+        are exported together by a pool of max_workers threads. The files are named after the domain and the entity
+        as with cicd_get_pipelineconfig_dumps/cicd_get_workflowconfig_dumps, and the list of exported files
+        (modified_files/pipeline.csv and workflow.csv) is written in the order of the domains and entities.
+        A summary of the export is written to domain_export_manifest.json.
+        :param domain_ids: list of Domain Identifiers
+        :type domain_ids: List
+        :param config_file_dump_path: directory the configurations are exported to
+        :type config_file_dump_path: String
+        :param files_overwrite: overwrite the lists of exported files instead of appending to them
+        :type files_overwrite: Boolean
+        :param serviceaccountemail: Service account email
+        :type serviceaccountemail: String
+        :param replace_words: Words to replace in the configuration
+        :type replace_words: String
+        :param max_workers: number of entities exported concurrently
+        :type max_workers: Integer
+        :return: the manifest dict
+        """
+        for directory in ["modified_files", "source", "pipeline", "workflow"]:
+            if not os.path.exists(os.path.join(config_file_dump_path, directory)):
+                os.makedirs(os.path.join(config_file_dump_path, directory))
+        utils_obj = Utils(serviceaccountemail)
+        started_at = time.time()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            domain_entity_ids = list(executor.map(self.list_entity_ids_of_domain, domain_ids))
+        entities = []
+        for domain_id, (pipeline_ids, workflow_ids) in zip(domain_ids, domain_entity_ids):
+            if len(pipeline_ids) == 0:
+                print(f"No pipelines available to dump the configurations in domain {domain_id}")
+            if len(workflow_ids) == 0:
+                print(f"No workflow available to dump the configurations in domain {domain_id}")
+            entities.extend([("pipeline", domain_id, pipeline_id) for pipeline_id in pipeline_ids])
+            entities.extend([("workflow", domain_id, workflow_id) for workflow_id in workflow_ids])
+
+        def export_entity(entity):
+            entity_type, domain_id, entity_id = entity
+            entity_started_at = time.time()
+            error = None
+            try:
+                filename, configuration_obj = utils_obj.dump_to_file(self, entity_type, domain_id, entity_id,
+                                                                     replace_words, config_file_dump_path)
+                if filename is None:
+                    error = "Failed to export the configurations, see the logs"
+            except Exception as e:
+                filename = None
+                error = str(e)
+                self.logger.error(f"Unable to export configurations for {entity_type} {entity_id} due to {error}")
+            return {"entity_type": entity_type, "domain_id": domain_id, "entity_id": entity_id, "file_name": filename,
+                    "status": "FAILED" if error else "SUCCESS", "error": error,
+                    "seconds": round(time.time() - entity_started_at, 3)}
 
-            if len(pipeline_ids) > 0:
-                pipeline_obj = DownloadPipeline()
-                pipeline_obj.cicd_get_pipelineconfig_dumps(pipeline_ids, config_file_dump_path, files_overwrite,
-                                                           serviceaccountemail,
-                                                           replace_words)
-            else:
-                print("No pipelines available to dump the configurations ")
-            if len(workflow_ids) > 0:
-                wf_obj = DownloadWorkflow()
-                wf_obj.cicd_get_workflowconfig_dumps(workflow_ids, config_file_dump_path, files_overwrite,
-                                                     serviceaccountemail,
-                                                     replace_words)
-            else:
-                print("No workflow available to dump the configurations ")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(export_entity, entities))
+        for entity_type in ["pipeline", "workflow"]:
+            target_file_path = os.path.join(config_file_dump_path, "modified_files", f"{entity_type}.csv")
+            with open(target_file_path, "w" if files_overwrite else "a") as f:
+                for result in results:
+                    if result["entity_type"] == entity_type and result["file_name"] is not None:
+                        f.write(result["file_name"])
+                        f.write("\n")
+        manifest = {"domain_ids": list(domain_ids),
+                    "summary": {"entities": len(results),
+                                "exported": len([result for result in results if result["status"] == "SUCCESS"]),
+                                "failed": len([result for result in results if result["status"] == "FAILED"]),
+                                "seconds": round(time.time() - started_at, 3)},
+                    "entities": results}
+        with open(os.path.join(config_file_dump_path, "domain_export_manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=4)
+        self.logger.info(f"Domain export summary: {manifest['summary']}")
+        print(f"Exported {manifest['summary']['exported']} of {manifest['summary']['entities']} entities, "
+              f"{manifest['summary']['failed']} failed")
+        return manifest
@@ -1,5 +1,6 @@
 import os
 
+from infoworks.sdk.cicd.download_configurations.export_manifest import ExportManifest
 from infoworks.sdk.cicd.download_configurations.get_source_configuration import DownloadSource
 from infoworks.sdk.cicd.download_configurations.lineage import get_lineage_dump
 from infoworks.sdk.cicd.download_configurations.utils import Utils
@@ -14,7 +15,14 @@ class DownloadEntityWithLineage(BaseClient):
                                    files_overwrite=True,
                                    only_wf_pl=False,
                                    maintain_lineage=True,
-                                   serviceaccountemail="admin@infoworks.io", replace_words=""):
+                                   serviceaccountemail="admin@infoworks.io", replace_words="", incremental=False):
+        """
+        Exports the configurations of the workflows, pipelines and sources along with the entities they depend on
+        :param incremental: export only the entities that changed on the server since the files of the previous export
+        written to config_file_dump_path, as recorded in its export_manifest.json. The lineage is still read from the
+        files of the unchanged entities.
+        :type incremental: Boolean
+        """
         if not os.path.exists(os.path.join(config_file_dump_path, "modified_files")):
             os.makedirs(os.path.join(config_file_dump_path, "modified_files"))
         if not os.path.exists(os.path.join(config_file_dump_path, "source")):
@@ -24,6 +32,10 @@ class DownloadEntityWithLineage(BaseClient):
         if not os.path.exists(os.path.join(config_file_dump_path, "workflow")):
             os.makedirs(os.path.join(config_file_dump_path, "workflow"))
         utils_obj = Utils(serviceaccountemail)
+        export_manifest = None
+        if incremental:
+            export_manifest = ExportManifest(config_file_dump_path, options={
+                "serviceaccountemail": serviceaccountemail, "replace_words": replace_words})
         sources_to_dump = []
         pipelines_to_dump = []
         if workflows_to_dump is not None:
@@ -34,7 +46,8 @@ class DownloadEntityWithLineage(BaseClient):
                 domain_id = utils_obj.get_domain_id(self, json_obj)
                 if domain_id:
                     filename, configuration_obj = utils_obj.dump_to_file(self, "workflow", domain_id, workflow_id,
-                                                                         replace_words, config_file_dump_path)
+                                                                         replace_words, config_file_dump_path,
+                                                                         export_manifest=export_manifest)
                     files_dumped[workflow_id] = filename
                     for task in configuration_obj["configuration"]["workflow"]["workflow_graph"]["tasks"]:
                         if task["task_type"] == "ingest_table_group" and not only_wf_pl:
@@ -80,7 +93,8 @@ class DownloadEntityWithLineage(BaseClient):
                 domain_id = utils_obj.get_domain_id(self, json_obj)
                 if domain_id:
                     filename, configuration_obj = utils_obj.dump_to_file(self, "pipeline", domain_id, pipeline_id,
-                                                                         replace_words, config_file_dump_path)
+                                                                         replace_words, config_file_dump_path,
+                                                                         export_manifest=export_manifest)
                     files_dumped[pipeline_id] = filename
                     for node in configuration_obj["configuration"]["pipeline_configs"]["model"].get("nodes", []):
                         req_dict = configuration_obj["configuration"]["pipeline_configs"]["model"]["nodes"][node]
@@ -114,10 +128,13 @@ class DownloadEntityWithLineage(BaseClient):
             sources_to_dump.extend(sources)
             sources_to_dump = list(set(sources_to_dump))
 
+        if export_manifest is not None:
+            # saved before the sources are exported, their export updates the same manifest
+            export_manifest.save()
         if len(sources_to_dump) > 0:
             src_obj = DownloadSource()
             src_obj.cicd_get_sourceconfig_dumps(sources_to_dump, config_file_dump_path, files_overwrite,
                                                 serviceaccountemail,
-                                                replace_words)
+                                                replace_words, incremental=incremental)
         else:
             print("No sources available to dump the configurations ")
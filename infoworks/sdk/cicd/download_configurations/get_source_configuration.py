@@ -2,6 +2,7 @@ import os
 import traceback
 
 from infoworks.sdk.base_client import BaseClient
+from infoworks.sdk.cicd.download_configurations.export_manifest import ExportManifest
 from infoworks.sdk.cicd.download_configurations.utils import Utils
 
 
@@ -18,9 +19,20 @@ class DownloadSource(BaseClient):
 
     def cicd_get_sourceconfig_dumps(self, source_ids, config_file_dump_path, files_overwrite=True,
                                     serviceaccountemail="admin@infoworks.io",
-                                    replace_words="", dump_watermarks=True,custom_tag_id=None):
+                                    replace_words="", dump_watermarks=True,custom_tag_id=None, incremental=False):
+        """
+        Exports the configurations of the sources to config_file_dump_path/source
+        :param incremental: export only the sources that changed on the server since the files of the previous export
+        written to config_file_dump_path, as recorded in its export_manifest.json
+        :type incremental: Boolean
+        """
         # replace_words = "DEV->PROD;dev->prod"
         utils_obj = Utils(serviceaccountemail)
+        export_manifest = None
+        if incremental:
+            export_manifest = ExportManifest(config_file_dump_path, options={
+                "serviceaccountemail": serviceaccountemail, "replace_words": replace_words,
+                "dump_watermarks": dump_watermarks, "custom_tag_id": custom_tag_id})
         if not os.path.exists(os.path.join(config_file_dump_path, "modified_files")):
             os.makedirs(os.path.join(config_file_dump_path, "modified_files"))
         if not os.path.exists(os.path.join(config_file_dump_path, "source")):
@@ -36,7 +48,8 @@ class DownloadSource(BaseClient):
             try:
                 filename, configuration_obj = utils_obj.dump_to_file(self, "source", None,
                                                                      source_id, replace_words,
-                                                                     config_file_dump_path, dump_watermarks,custom_tag_id=custom_tag_id)
+                                                                     config_file_dump_path, dump_watermarks,custom_tag_id=custom_tag_id,
+                                                                     export_manifest=export_manifest)
                 if filename is not None:
                     f.write(filename)
                     f.write("\n")
@@ -45,3 +58,6 @@ class DownloadSource(BaseClient):
                 print(f"Unable to export configurations for source {source_id} due to {str(e)}")
                 print(traceback.format_exc())
         f.close()
+        if export_manifest is not None:
+            export_manifest.save()
+            print(f"Exported {export_manifest.exported} sources, {export_manifest.skipped} unchanged")
@@ -1,14 +1,19 @@
 import copy
 import os
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 import json
+from infoworks.sdk import local_configurations
+from infoworks.error import PaginationError
 from infoworks.sdk.utils import IWUtils
 from infoworks.sdk.url_builder import get_parent_entity_url, list_domains_url, configure_pipeline_url, \
     configure_workflow_url, configure_source_url, get_environment_details, get_environment_storage_details, \
     get_environment_compute_details, get_environment_interactive_compute_details, get_source_configurations_url, \
     get_pipeline_url, get_data_connection, source_info, list_users_url, list_secrets_url, get_pipeline_group_base_url, \
-    list_pipelines_url, create_domain_url, get_table_configuration, list_tables_under_source, create_table_group_url
+    list_pipelines_url, create_domain_url, get_table_configuration, list_tables_under_source, create_table_group_url, \
+    get_custom_tags_url
 from infoworks.sdk.cicd.cicd_response import CICDResponse
+from infoworks.sdk.cicd.streaming_json import write_json_file_if_changed
 
 class Utils:
     def __init__(self, serviceaccountemail):
@@ -219,56 +224,183 @@ class Utils:
                 cicd_client.call_api("GET", url_to_list_pipelines,
                                      IWUtils.get_default_header_for_v3(cicd_client.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in cicd_client.iter_pages(url_to_list_pipelines, response=response):
                     pipelines_list.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(
-                        next=response.get('links')['next'], ip=cicd_client.client_config['ip'],
-                        port=cicd_client.client_config['port'], protocol=cicd_client.client_config['protocol'])
-                    response = IWUtils.ejson_deserialize(
-                        cicd_client.call_api("GET", nextUrl,
-                                             IWUtils.get_default_header_for_v3(cicd_client.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return response
                 response["result"] = pipelines_list
                 response["message"] = initial_msg
             return response
+        except PaginationError as error:
+            # the response of the page that failed, as returned before the listing was paginated by iter_pages
+            return error.response
         except Exception as e:
             cicd_client.logger.error(f"Error in listing pipelines: {str(e)}")
             raise Exception(f"Error in listing pipelines: {str(e)}")
 
-    def add_secret_name_to_id(self, data, cicd_client):
-        for key, value in data.items():
-            if isinstance(value, dict):
-                secret_name = self.add_secret_name_to_id(value, cicd_client)
-                if secret_name:
-                    return secret_name
-            elif key == "secret_id":
-                secret_name = self.get_secret_name_from_id(cicd_client=cicd_client, secret_id=value)
-                if secret_name:
-                    data["secret_name"] = secret_name
-                return value
-
-    def add_custom_tags_to_id(self, data, cicd_client):
+    def get_dicts_with_key(self, data, key):
+        """
+        :return: list of the dicts nested anywhere in data (dicts and lists) that have the key
+        """
+        found = []
+        pending = [data]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, dict):
+                if key in item:
+                    found.append(item)
+                pending.extend(item.values())
+            elif isinstance(item, list):
+                pending.extend(item)
+        return found
+
+    def get_secret_names_from_ids(self, cicd_client, secret_ids):
+        """
+        looks the secrets up with one secrets list query per CICD_LOOKUP_BATCH_SIZE ids
+        :return: dict of secret id to secret name
+        """
+        secret_ids = sorted(set(secret_id for secret_id in secret_ids if isinstance(secret_id, str)))
+        secret_names = {}
+        for i in range(0, len(secret_ids), local_configurations.CICD_LOOKUP_BATCH_SIZE):
+            batch_ids = secret_ids[i:i + local_configurations.CICD_LOOKUP_BATCH_SIZE]
+            try:
+                list_secrets_in_batch_url = list_secrets_url(cicd_client.client_config) + \
+                    IWUtils.get_query_params_string_from_dict(
+                        params={"filter": {"_id": {"$in": batch_ids}}, "limit": len(batch_ids), "offset": 0})
+                for result in cicd_client.iter_pages(list_secrets_in_batch_url):
+                    for secret in result:
+                        if secret.get("id") in batch_ids:
+                            secret_names[secret["id"]] = secret["name"]
+            except Exception as error:
+                cicd_client.logger.error(f"Failed to list secrets {batch_ids}: {error}")
+                print(f"Failed to list secrets: {error}")
+        cicd_client.logger.info(f"Found {len(secret_names)} of {len(secret_ids)} secret names")
+        return secret_names
+
+    def get_custom_tags_from_ids(self, cicd_client, tag_ids):
+        """
+        looks the custom tags up with one custom tags list query per CICD_LOOKUP_BATCH_SIZE ids
+        :return: dict of custom tag id to (key, value)
+        """
+        tag_ids = sorted(set(tag_id for tag_id in tag_ids if isinstance(tag_id, str)))
+        custom_tags = {}
+        for i in range(0, len(tag_ids), local_configurations.CICD_LOOKUP_BATCH_SIZE):
+            batch_ids = tag_ids[i:i + local_configurations.CICD_LOOKUP_BATCH_SIZE]
+            try:
+                list_custom_tags_in_batch_url = get_custom_tags_url(cicd_client.client_config) + \
+                    IWUtils.get_query_params_string_from_dict(
+                        params={"filter": {"_id": {"$in": batch_ids}}, "limit": len(batch_ids), "offset": 0})
+                for result in cicd_client.iter_pages(list_custom_tags_in_batch_url):
+                    for custom_tag in result:
+                        if custom_tag.get("id") in batch_ids:
+                            custom_tags[custom_tag["id"]] = (custom_tag["key"], custom_tag["value"])
+            except Exception as error:
+                cicd_client.logger.error(f"Failed to get custom tags {batch_ids}: {error}")
+                print(f"Failed to get custom tags: {error}")
+        return custom_tags
+
+    @staticmethod
+    def get_watermark_mapping(table):
+        """
+        :return: the watermark fields of a table document, as exported under table_watermark_mappings
+        """
+        watermark_mapping = {
+            "last_ingested_cdc_value": table.get("last_ingested_cdc_value"),
+            "last_merged_watermark": table.get("last_merged_watermark"),
+            "row_count": table.get("row_count"),
+            "full_load_performed": table.get("full_load_performed"),
+        }
+        if table.get("max_modified_timestamp"):
+            watermark_mapping["max_modified_timestamp"] = table["max_modified_timestamp"]
+        return watermark_mapping
+
+    def get_table_watermark(self, cicd_client, source_id, table_id):
+        """
+        :return: the watermark mapping of one table read from its configuration, None if it could not be read
+        """
+        get_tbl_details_url = get_table_configuration(cicd_client.client_config, source_id, table_id)
+        resp_tbl = cicd_client.call_api(
+            "GET",
+            get_tbl_details_url,
+            IWUtils.get_default_header_for_v3(cicd_client.client_config['bearer_token'])
+        )
+        parsed_tbl = IWUtils.ejson_deserialize(resp_tbl.content)
+        cicd_client.logger.debug(f"Table config response for {table_id}: {parsed_tbl}")
+        if resp_tbl.status_code == 200:
+            return self.get_watermark_mapping(parsed_tbl.get("result", {}) or {})
+        print(f"Get Table Config Failed: {json.dumps(parsed_tbl)}")
+        cicd_client.logger.error(f"Get Table Config Failed: {json.dumps(parsed_tbl)}")
+        return None
+
+    def get_table_watermarks(self, cicd_client, source_id, table_ids,
+                             max_workers=local_configurations.CICD_WATERMARK_MAX_WORKERS):
+        """
+        Reads the watermarks of the tables of a source from one paginated listing of its tables, projected on the
+        watermark fields. The tables missing from the listing (or all of them if it fails) are read from their
+        configurations by a pool of max_workers threads.
+        :return: dict of table id to watermark mapping, in the order of table_ids
+        """
+        watermark_fields = ["last_ingested_cdc_value", "last_merged_watermark", "row_count", "full_load_performed",
+                            "max_modified_timestamp"]
+        listed_tables = {}
+        wanted_table_ids = set(table_ids)
+        list_tables_url = list_tables_under_source(cicd_client.client_config, source_id) + \
+            IWUtils.get_query_params_string_from_dict(
+                params={"limit": 50, "offset": 0,
+                        "projections": dict([("id", 1)] + [(field, 1) for field in watermark_fields])})
+        try:
+            for tables in cicd_client.iter_pages(list_tables_url):
+                for table in tables:
+                    # tables listed without any of the fields are read from their configurations
+                    if table.get("id") in wanted_table_ids and any(field in table for field in watermark_fields):
+                        listed_tables[table["id"]] = self.get_watermark_mapping(table)
+        except Exception as error:
+            cicd_client.logger.error(f"Failed to list the table watermarks of source {source_id}: {error}")
+        missing_table_ids = [table_id for table_id in table_ids if table_id not in listed_tables]
+        if missing_table_ids:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                read_tables = executor.map(lambda table_id: self.get_table_watermark(cicd_client, source_id, table_id),
+                                           missing_table_ids)
+                listed_tables.update(zip(missing_table_ids, read_tables))
+        cicd_client.logger.info(f"Read the watermarks of {len(table_ids)} tables of source {source_id}, "
+                                f"{len(missing_table_ids)} of them from their configurations")
+        return dict((table_id, listed_tables[table_id]) for table_id in table_ids
+                    if listed_tables.get(table_id) is not None)
+
+    def add_secret_name_to_id(self, data, cicd_client, secret_names=None):
+        """
+        adds the secret_name next to every secret_id found in data
+        :param secret_names: dict of secret id to name, looked up with get_secret_names_from_ids if not given
+        """
+        holders = self.get_dicts_with_key(data, "secret_id")
+        if secret_names is None:
+            secret_names = self.get_secret_names_from_ids(cicd_client, [holder["secret_id"] for holder in holders])
+        for holder in holders:
+            secret_name = secret_names.get(holder["secret_id"]) if isinstance(holder["secret_id"], str) else None
+            if secret_name:
+                holder["secret_name"] = secret_name
+
+    def add_custom_tags_to_id(self, data, cicd_client, custom_tags=None):
+        """
+        sets custom_tag_key_values of data from the ids in its custom_tags
+        :param custom_tags: dict of custom tag id to (key, value), looked up with get_custom_tags_from_ids if not given
+        """
         data["custom_tag_key_values"] = {}
-        for key, value in data.items():
-            if key == "custom_tags":
-                for tag_id in value:
-                    try:
-                        response = cicd_client.get_custom_tag(custom_tag_id=tag_id)
-                        custom_tag_key = response['result']['response']['result']['key']
-                        custom_tag_value = response['result']['response']['result']['value']
-                        data["custom_tag_key_values"][custom_tag_key] = custom_tag_value
-                    except Exception as error:
-                        cicd_client.logger.error(f"Failed to get custom tag: {error}")
-                        print(f"Failed to get custom tag: {error}")
+        tag_ids = data.get("custom_tags") or []
+        if custom_tags is None:
+            custom_tags = self.get_custom_tags_from_ids(cicd_client, tag_ids)
+        for tag_id in tag_ids:
+            if tag_id in custom_tags:
+                custom_tag_key, custom_tag_value = custom_tags[tag_id]
+                data["custom_tag_key_values"][custom_tag_key] = custom_tag_value
+            else:
+                cicd_client.logger.error(f"Failed to get custom tag: {tag_id}")
+                print(f"Failed to get custom tag: {tag_id}")
 
     def dump_to_file(self, cicd_client, entity_type, domain_id, entity_id, replace_words, target_file_path,
-                     dump_watermarks=True, custom_tag_id=None, version_id=None):
+                     dump_watermarks=True, custom_tag_id=None, version_id=None, export_manifest=None):
         """
-        Dump entity configuration to a file.
+        Dump entity configuration to a file. The configuration is streamed to the file item by item (see
+        streaming_json.write_json) and the file is rewritten only if its content changed.
         :param cicd_client: Infoworks SDK client
         :param entity_type: Type of entity (e.g., 'workflow')
         :param domain_id: Domain ID
@@ -278,12 +410,22 @@ class Utils:
         :param dump_watermarks: Whether to dump table watermarks (for sources)
         :param custom_tag_id: Custom tag ID for filtering
         :param version_id: Optional version ID for workflows
+        :param export_manifest: Optional ExportManifest, entities unchanged since their last export are not exported
         :return: Tuple of (filename, configuration_obj)
         """
         response_to_return = {}
         filename = None
         environment_id, environment_compute_template_id, environment_storage_id = None, None, None
         try:
+            if export_manifest is not None and version_id is None:
+                modified_at, entity_version = export_manifest.get_entity_version(cicd_client, entity_type, domain_id,
+                                                                                 entity_id)
+                filename, configuration_obj = export_manifest.get_unchanged_export(entity_type, entity_id,
+                                                                                   entity_version)
+                if filename is not None:
+                    cicd_client.logger.info(f"{entity_type} {entity_id} is unchanged since its export to {filename}")
+                    print(f"{entity_type} {entity_id} is unchanged since its export to {filename}, skipping it")
+                    return filename, configuration_obj
             if entity_type == "pipeline":
                 url_to_config = configure_pipeline_url(cicd_client.client_config, domain_id, entity_id)
             elif entity_type == "workflow":
@@ -367,20 +509,16 @@ class Utils:
                 if source_connection_objects:
                     self.add_secret_name_to_id(data=source_connection_objects, cicd_client=cicd_client)
 
-                # Custom tags
-                self.add_custom_tags_to_id(data=cfg, cicd_client=cicd_client)
-
-                # Table + table group configs may be missing; guard loops
+                # Custom tags of the source, tables and table groups (configs may be missing), looked up together
+                tag_holders = [cfg]
                 for table in configuration_obj.get("configuration", {}).get("table_configs", []):
-                    self.add_custom_tags_to_id(
-                        data=table.get("configuration", {}).get("configuration", {}),
-                        cicd_client=cicd_client
-                    )
+                    tag_holders.append(table.get("configuration", {}).get("configuration", {}))
                 for table_group in configuration_obj.get("configuration", {}).get("table_group_configs", []):
-                    self.add_custom_tags_to_id(
-                        data=table_group.get("configuration", {}),
-                        cicd_client=cicd_client
-                    )
+                    tag_holders.append(table_group.get("configuration", {}))
+                custom_tags = self.get_custom_tags_from_ids(
+                    cicd_client, [tag_id for holder in tag_holders for tag_id in holder.get("custom_tags") or []])
+                for holder in tag_holders:
+                    self.add_custom_tags_to_id(data=holder, cicd_client=cicd_client, custom_tags=custom_tags)
 
                 # Associated domains
                 if cfg.get("associated_domains") is None:
@@ -396,36 +534,14 @@ class Utils:
                             if "connection" in exp_cfg and isinstance(exp_cfg["connection"], dict):
                                 exp_cfg["connection"]["password"] = None
 
-                # 4) Watermarks (unchanged except safer gets)
-                table_watermark_mappings = {}
-                if dump_watermarks:
-                    for table_config in configuration_obj.get("configuration", {}).get("table_configs", []):
-                        table_id = table_config.get("entity_id")
-                        if entity_id and table_id:
-                            get_tbl_details_url = get_table_configuration(cicd_client.client_config, entity_id,
-                                                                          table_id)
-                            resp_tbl = cicd_client.call_api(
-                                "GET",
-                                get_tbl_details_url,
-                                IWUtils.get_default_header_for_v3(cicd_client.client_config['bearer_token'])
-                            )
-                            parsed_tbl = IWUtils.ejson_deserialize(resp_tbl.content)
-                            cicd_client.logger.debug(f"Table config response for {table_id}: {parsed_tbl}")
-                            if resp_tbl.status_code == 200:
-                                tbl_res = parsed_tbl.get("result", {}) or {}
-                                table_watermark_mappings[table_id] = {
-                                    "last_ingested_cdc_value": tbl_res.get("last_ingested_cdc_value"),
-                                    "last_merged_watermark": tbl_res.get("last_merged_watermark"),
-                                    "row_count": tbl_res.get("row_count"),
-                                    "full_load_performed": tbl_res.get("full_load_performed"),
-                                }
-                                if tbl_res.get("max_modified_timestamp"):
-                                    table_watermark_mappings[table_id]["max_modified_timestamp"] = tbl_res[
-                                        "max_modified_timestamp"]
-                                configuration_obj["table_watermark_mappings"] = table_watermark_mappings
-                            else:
-                                print(f"Get Table Config Failed: {json.dumps(parsed_tbl)}")
-                                cicd_client.logger.error(f"Get Table Config Failed: {json.dumps(parsed_tbl)}")
+                # 4) Watermarks
+                if dump_watermarks and entity_id:
+                    table_ids = [table_config.get("entity_id") for table_config in
+                                 configuration_obj.get("configuration", {}).get("table_configs", [])]
+                    table_watermark_mappings = self.get_table_watermarks(
+                        cicd_client, entity_id, [table_id for table_id in table_ids if table_id])
+                    if table_watermark_mappings:
+                        configuration_obj["table_watermark_mappings"] = table_watermark_mappings
 
                 # 5) Custom-tag filtering (unchanged, just variable names fixed)
                 if custom_tag_id:
@@ -554,8 +670,7 @@ class Utils:
                 # 9) Finally write
                 cicd_client.logger.info(f"Exporting {filename} to {target_file_path}")
                 print(f"Exporting configurations file to {target_file_path}")
-                with open(target_file_path, 'w') as fh:
-                    json.dump(configuration_obj, fh, indent=4)
+                write_json_file_if_changed(target_file_path, configuration_obj)
                 cicd_client.logger.info("Configurations exported successfully")
                 print("Configurations exported successfully")
             else:
@@ -697,8 +812,7 @@ class Utils:
                     if filename is not None and target_file_path is not None:
                         cicd_client.logger.info(f"Exporting {filename} to {target_file_path}")
                         print(f"Exporting configurations file to {target_file_path}")
-                        with open(target_file_path, 'w') as file_ptr:
-                            json.dump(configuration_obj, file_ptr, indent=4)
+                        write_json_file_if_changed(target_file_path, configuration_obj)
                         cicd_client.logger.info("Configurations exported successfully")
                         print("Configurations exported successfully")
                 except Exception as e:
@@ -706,6 +820,8 @@ class Utils:
                     print(error_msg)
                     cicd_client.logger.error(error_msg)
                     raise Exception(error_msg)
+            if export_manifest is not None and version_id is None and filename is not None:
+                export_manifest.record(entity_type, entity_id, modified_at, entity_version, filename)
             return filename, configuration_obj
         except Exception as e:
             error_msg = f"Failed to process {entity_type} {entity_id}: {str(e)}"
@@ -0,0 +1,208 @@
+import filecmp
+import json
+import os
+import re
+
+from infoworks.sdk import local_configurations
+from infoworks.sdk.utils import IWUtils
+
+# arrays of a source export with one item per table, written and read item by item
+SOURCE_EXPORT_STREAMED_PATHS = [("configuration", "table_configs"), ("configuration", "iw_mappings")]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_PART = re.compile(r"[0-9eE.+\-]*")
+_DECODER = json.JSONDecoder()
+
+
+def _get_key_text(key):
+    # json.dump converts the keys that are not strings the same way
+    return json.dumps(key if isinstance(key, str) else json.dumps(key))
+
+
+def write_json(file_obj, value, indent=4, level=0):
+    """
+    Writes value to file_obj exactly as json.dump(value, file_obj, indent=indent) would, but item by item: the items of
+    the lists (and generators) are serialized one at a time, so the whole document is never held as one string.
+    """
+    if isinstance(value, dict) and value:
+        separator = "{"
+        for key, item in value.items():
+            file_obj.write(f"{separator}\n{' ' * (indent * (level + 1))}{_get_key_text(key)}: ")
+            write_json(file_obj, item, indent, level + 1)
+            separator = ","
+        file_obj.write(f"\n{' ' * (indent * level)}}}")
+    elif isinstance(value, (list, tuple)) or hasattr(value, "__next__"):
+        separator = "["
+        item_indent = "\n" + " " * (indent * (level + 1))
+        for item in value:
+            # strings are escaped by json.dumps, the only new lines are those of the indentation
+            file_obj.write(separator + item_indent + json.dumps(item, indent=indent).replace("\n", item_indent))
+            separator = ","
+        file_obj.write("[]" if separator == "[" else f"\n{' ' * (indent * level)}]")
+    else:
+        file_obj.write(json.dumps(value))
+
+
+def write_json_file_if_changed(file_path, value, indent=4):
+    """
+    streams value to file_path with write_json, unless the file already holds exactly the same bytes
+    :return: True if the file was written
+    """
+    temporary_file_path = file_path + ".tmp"
+    with open(temporary_file_path, "w") as file_obj:
+        write_json(file_obj, value, indent=indent)
+    if os.path.exists(file_path) and filecmp.cmp(temporary_file_path, file_path, shallow=False):
+        os.remove(temporary_file_path)
+        return False
+    os.replace(temporary_file_path, file_path)
+    return True
+
+
+class JSONStreamReader(object):
+    """
+    Reads a json document from a file chunk by chunk. The values of the document are decoded one at a time, so that the
+    arrays at streamed paths can be iterated item by item without reading the whole file.
+    """
+
+    def __init__(self, file_obj, replace_words="", chunk_size=local_configurations.JSON_STREAM_CHUNK_SIZE):
+        """
+        :param file_obj: file opened in text mode
+        :param replace_words: strings to replace in the text of every value, e.g. DEV->PROD;dev->prod
+        :type replace_words: String
+        :param chunk_size: number of characters read at once
+        :type chunk_size: Integer
+        """
+        self.file_obj = file_obj
+        self.chunk_size = chunk_size
+        self.replacements = [item.split("->") for item in replace_words.split(";")] if replace_words else []
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read_more(self, size):
+        if self.eof:
+            return False
+        chunk = self.file_obj.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """
+        :return: the next character that is not a whitespace, "" at the end of the file
+        """
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read_more(self.chunk_size):
+                return ""
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(f"Expected {character!r} at {self.buffer[self.position:self.position + 40]!r}")
+        self.position = self.position + 1
+
+    def read_value(self):
+        """
+        :return: the next json value of the document, with the words replaced and the extended json decoded
+        """
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.position)
+                # a value followed only by the characters of a number till the end of the buffer may be a number cut
+                # by the chunk
+                if self.eof or not _NUMBER_PART.fullmatch(self.buffer, end):
+                    break
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._read_more(size)
+            size = size * 2
+        text = self.buffer[self.position:end]
+        self.position = end
+        for key, replacement in self.replacements:
+            text = text.replace(key, replacement)
+        if self.replacements or "$" in text:
+            value = IWUtils.ejson_deserialize(text)
+        return value
+
+    def iter_items(self):
+        """
+        yields the items of the array starting at the current position
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.position = self.position + 1
+            return
+        while True:
+            yield self.read_value()
+            if self.peek() == ",":
+                self.position = self.position + 1
+            else:
+                self.expect("]")
+                return
+
+    def iter_members(self):
+        """
+        yields the keys of the object starting at the current position, its value must be read before the next key
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.position = self.position + 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.position = self.position + 1
+            else:
+                self.expect("}")
+                return
+
+    def read_document(self, streamed_paths=(), path=()):
+        """
+        :param streamed_paths: paths (tuples of keys) of the arrays read item by item
+        :return: the value starting at the current position
+        """
+        if path in streamed_paths and self.peek() == "[":
+            return list(self.iter_items())
+        if self.peek() == "{" and any(streamed_path[:len(path)] == path for streamed_path in streamed_paths):
+            return dict((key, self.read_document(streamed_paths, path + (key,))) for key in self.iter_members())
+        return self.read_value()
+
+
+def load_json_file(file_path, replace_words="", streamed_paths=SOURCE_EXPORT_STREAMED_PATHS):
+    """
+    Loads a json (extended json) file without reading it into a single string, its arrays at streamed_paths being
+    decoded item by item. The words are replaced in the text of every value as they would be in the whole text.
+    :return: the document
+    """
+    with open(file_path, "r") as file_obj:
+        return JSONStreamReader(file_obj, replace_words=replace_words).read_document(streamed_paths)
+
+
+def iter_json_file_items(file_path, key_path, replace_words=""):
+    """
+    yields the items of the array at key_path (e.g. ("configuration", "table_configs")) of a json file one at a time,
+    reading only the parts of the file before and in the array
+    """
+    with open(file_path, "r") as file_obj:
+        reader = JSONStreamReader(file_obj, replace_words=replace_words)
+        depth = 0
+        while depth < len(key_path):
+            for key in reader.iter_members():
+                if key == key_path[depth]:
+                    break
+                reader.read_value()
+            else:
+                return
+            depth = depth + 1
+        if reader.peek() == "[":
+            yield from reader.iter_items()
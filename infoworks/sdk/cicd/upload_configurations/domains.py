@@ -150,16 +150,8 @@ class Domain:
                     response = requests.request("GET", url_to_add_source_to_domain,
                                                 headers=headers, verify=False)
                 if response is not None:
-                    result = response.json().get("result", [])
-                    while len(result) > 0:
+                    for result in client.iter_pages(url_to_add_source_to_domain, response=response.json()):
                         source_ids_existing.extend([item["id"] for item in result])
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.json().get('links')['next'],
-                                                                          ip=client.client_config['ip'],
-                                                                          port=client.client_config['port'],
-                                                                          protocol=client.client_config['protocol'],
-                                                                          )
-                        response = self.callurl(client, nextUrl)
-                        result = response.json().get("result", [])
                 missing_srcs = set(source_ids) - set(source_ids_existing)
                 json_string = IWUtils.ejson_serialize({"entity_ids": list(missing_srcs)})
                 response = requests.post(url_to_add_source_to_domain, data=json_string,
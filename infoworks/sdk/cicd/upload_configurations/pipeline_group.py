@@ -5,6 +5,7 @@ import configparser
 import requests
 import yaml
 from infoworks.core.iw_authentication import get_bearer_token
+from infoworks.error import PaginationError
 from infoworks.sdk.utils import IWUtils
 from infoworks.sdk.url_builder import get_pipeline_group_base_url,list_domains_url,list_pipelines_url
 from infoworks.sdk.cicd.upload_configurations.update_configurations import InfoworksDynamicAccessNestedDict
@@ -72,28 +73,15 @@ class PipelineGroup:
                 response = requests.request("GET", url_to_list_pipelines, headers=headers, verify=False)
             if response.status_code==200:
                 response = response.json()
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in pipeline_group_obj.iter_pages(url_to_list_pipelines, response=response):
                     pipelines_list.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=pipeline_group_obj.client_config['ip'],
-                                                                      port=pipeline_group_obj.client_config['port'],
-                                                                      protocol=pipeline_group_obj.client_config['protocol'],
-                                                                      )
-                    response = requests.request("GET", nextUrl, headers=headers,verify=False)
-                    if response.status_code == 406:
-                        headers = pipeline_group_obj.regenerate_bearer_token_if_needed(
-                            {'Authorization': 'Bearer ' + pipeline_group_obj.client_config["bearer_token"],
-                             'Content-Type': 'application/json'})
-                        response = requests.request("GET", nextUrl, headers=headers, verify=False)
-                    response = response.json()
-                    result = response.get("result", None)
-                    if result is None:
-                        return response
                 response["result"] = pipelines_list
                 response["message"] = initial_msg
             return response
+        except PaginationError as error:
+            # the response of the page that failed, as returned before the listing was paginated by iter_pages
+            return error.response
         except Exception as e:
             pipeline_group_obj.logger.error("Error in listing pipelines")
             raise Exception("Error in listing pipelines" + str(e))
@@ -9,6 +9,7 @@ import yaml
 from infoworks.sdk.url_builder import get_source_details_url, list_secrets_url, create_domain_url, \
     get_environment_interactive_compute_details, restart_persistent_cluster_url
 from infoworks.sdk.utils import IWUtils
+from infoworks.sdk.cicd.streaming_json import load_json_file
 from infoworks.sdk.source_response import SourceResponse
 from infoworks.sdk.local_configurations import Response
 import configparser
@@ -25,16 +26,14 @@ class RDBMSSource:
         self.storage_id = None
         self.secrets = None
 
-    def set_variables(self, environment_id, storage_id, source_config_path, secrets=None, replace_words=""):
+    def set_variables(self, environment_id, storage_id, source_config_path, secrets=None, replace_words="",
+                      configuration_obj=None):
         self.storage_id = storage_id
         self.environment_id = environment_id
         self.source_config_path = source_config_path
-        with open(self.source_config_path, 'r') as file:
-            json_string = file.read()
-            if replace_words != "":
-                for key, value in [item.split("->") for item in replace_words.split(";")]:
-                    json_string = json_string.replace(key, value)
-        self.configuration_obj = IWUtils.ejson_deserialize(json_string)
+        if configuration_obj is None:
+            configuration_obj = load_json_file(self.source_config_path, replace_words=replace_words)
+        self.configuration_obj = configuration_obj
         self.secrets = secrets
 
     def get_secret_id_from_name(self, cicd_client, secret_name):
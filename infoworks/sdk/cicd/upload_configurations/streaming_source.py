@@ -3,6 +3,7 @@ import requests
 import yaml
 from infoworks.sdk.url_builder import get_source_details_url, list_secrets_url, create_domain_url
 from infoworks.sdk.utils import IWUtils
+from infoworks.sdk.cicd.streaming_json import load_json_file
 from infoworks.sdk.source_response import SourceResponse
 from infoworks.sdk.local_configurations import Response
 from infoworks.sdk.cicd.upload_configurations.utils import Utils
@@ -11,17 +12,15 @@ from infoworks.sdk.cicd.upload_configurations.local_configurations import PRE_DE
 import configparser
 
 class StreamingSource:
-    def __init__(self, environment_id, storage_id, source_config_path, secrets=None, replace_words=""):
+    def __init__(self, environment_id, storage_id, source_config_path, secrets=None, replace_words="",
+                 configuration_obj=None):
         self.storage_id = storage_id
         self.environment_id = environment_id
         self.source_config_path = source_config_path
         self.secrets = secrets
-        with open(self.source_config_path, 'r') as file:
-            json_string = file.read()
-            if replace_words != "":
-                for key, value in [item.split("->") for item in replace_words.split(";")]:
-                    json_string = json_string.replace(key, value)
-        self.configuration_obj = IWUtils.ejson_deserialize(json_string)
+        if configuration_obj is None:
+            configuration_obj = load_json_file(self.source_config_path, replace_words=replace_words)
+        self.configuration_obj = configuration_obj
 
     def replace_secret_name_with_mapping(self,data,src_client_obj):
         for key, value in data.items():
@@ -33,17 +33,8 @@ class WrapperPipeline(BaseClient):
                 if environment_id is not None:
                     env_details.extend(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_environments, response=response):
                         env_details.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=env_details)
         except Exception as e:
             self.logger.error("Error in getting environment details")
@@ -63,17 +54,8 @@ class WrapperPipeline(BaseClient):
                 if storage_id is not None:
                     storage_details.extend(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_storages, response=response):
                         storage_details.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=storage_details)
         except Exception as e:
             self.logger.error("Error in getting storage details")
@@ -100,17 +82,8 @@ class WrapperPipeline(BaseClient):
                 if compute_id is not None:
                     compute_details.extend(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_computes, response=response):
                         compute_details.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=compute_details)
         except Exception as e:
             self.logger.error("Error in getting compute template details")
@@ -3,6 +3,7 @@ import traceback
 
 from infoworks.sdk import url_builder
 from infoworks.sdk.base_client import BaseClient
+from infoworks.sdk.cicd.streaming_json import load_json_file
 from infoworks.sdk.cicd.upload_configurations.cdata_source import CdataSource
 from infoworks.sdk.cicd.upload_configurations.csv_source import CSVSource
 from infoworks.sdk.cicd.upload_configurations.rdbms_source import RDBMSSource
@@ -38,17 +39,8 @@ class WrapperSource(BaseClient):
                 if environment_id is not None:
                     env_details.extend(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_environments, response=response):
                         env_details.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=env_details)
         except Exception as e:
             self.logger.error("Error in getting environment details")
@@ -70,17 +62,8 @@ class WrapperSource(BaseClient):
                 if storage_id is not None:
                     storage_details.extend(result)
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_storages, response=response):
                         storage_details.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=storage_details)
         except Exception as e:
             self.logger.error("Error in getting storage details")
@@ -107,9 +90,8 @@ class WrapperSource(BaseClient):
             env_id = self.client_config.get("default_environment_id", None)
             storage_id = self.client_config.get("default_storage_id", None)
             compute_id = self.client_config.get("default_compute_id", None)
-            with open(configuration_file_path, 'r') as file:
-                json_string = file.read()
-            configuration_obj = IWUtils.ejson_deserialize(json_string)
+            # read item by item, the table_configs and iw_mappings of large sources do not fit in one string
+            configuration_obj = load_json_file(configuration_file_path)
             environment_configurations = configuration_obj["environment_configurations"]
             if env_id is None and "environment_mappings" in self.mappings:
                 env_name = self.mappings["environment_mappings"].get(environment_configurations["environment_name"],
@@ -150,9 +132,9 @@ class WrapperSource(BaseClient):
             source_sub_type = configuration_obj["configuration"]["source_configs"]["sub_type"]
             if source_type == "file" and (source_sub_type == "structured" or source_sub_type == "fixedwidth"):
                 overall_steps_status = []
-                source_obj = CSVSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words)
-                # adding below line to prevent missing out mappings done above (compute_mappings,environment_mappings etc
-                source_obj.configuration_obj=configuration_obj
+                # passing configuration_obj to prevent missing out mappings done above (compute_mappings,environment_mappings etc
+                source_obj = CSVSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words,
+                                       configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 create_source_response = source_obj.create_csv_source(self)
                 print("create_source_response:",create_source_response)
@@ -250,9 +232,9 @@ class WrapperSource(BaseClient):
                 self.print_overall_steps_status(overall_steps_status)
             elif source_type == "file":
                 overall_steps_status = []
-                source_obj = FileSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words)
-                # adding below line to prevent missing out mappings done above (compute_mappings,environment_mappings etc
-                source_obj.configuration_obj=configuration_obj
+                # passing configuration_obj to prevent missing out mappings done above (compute_mappings,environment_mappings etc
+                source_obj = FileSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words,
+                                        configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 create_source_response = source_obj.create_file_source(self)
                 print("create_source_response:",create_source_response)
@@ -349,9 +331,9 @@ class WrapperSource(BaseClient):
                 self.print_overall_steps_status(overall_steps_status)
             elif source_type == "streaming" and (source_sub_type == "confluent_cloud" or source_sub_type == "kafka"):
                 overall_steps_status = []
-                source_obj = StreamingSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words)
-                # adding below line to prevent missing out mappings done above (compute_mappings,environment_mappings etc
-                source_obj.configuration_obj=configuration_obj
+                # passing configuration_obj to prevent missing out mappings done above (compute_mappings,environment_mappings etc
+                source_obj = StreamingSource(env_id, storage_id, configuration_file_path, self.secrets_config, replace_words,
+                                             configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 create_source_response = source_obj.create_streaming_source(self)
                 print("create_source_response:",create_source_response)
@@ -448,8 +430,7 @@ class WrapperSource(BaseClient):
                 overall_steps_status=[]
                 source_obj = RDBMSSource()
                 source_obj.set_variables(env_id, storage_id, configuration_file_path, self.secrets_config,
-                                         replace_words)
-                source_obj.configuration_obj = configuration_obj
+                                         replace_words, configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 default_section_mappings =dict(self.mappings.get("api_mappings"))
                 source_obj.start_interactive_cluster(self,environment_id=source_obj.environment_id,default_section_mappings=default_section_mappings)
@@ -625,8 +606,7 @@ class WrapperSource(BaseClient):
             elif source_type == "crm" and source_sub_type == "salesforce":
                 source_obj = SalesforceSource()
                 source_obj.set_variables(env_id, storage_id, configuration_file_path, self.secrets_config,
-                                         replace_words)
-                source_obj.configuration_obj = configuration_obj
+                                         replace_words, configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 source_id = source_obj.create_salesforce_source(self)
                 if source_id is not None:
@@ -662,8 +642,7 @@ class WrapperSource(BaseClient):
                 overall_steps_status=[]
                 source_obj = GenericJDBCSource()
                 source_obj.set_variables(env_id, storage_id, configuration_file_path, self.secrets_config,
-                                         replace_words)
-                source_obj.configuration_obj = configuration_obj
+                                         replace_words, configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 default_section_mappings =dict(self.mappings.get("api_mappings"))
                 source_obj.start_interactive_cluster(self,environment_id=source_obj.environment_id,default_section_mappings=default_section_mappings)
@@ -836,8 +815,7 @@ class WrapperSource(BaseClient):
                 overall_steps_status = []
                 source_obj = CdataSource()
                 source_obj.set_variables(env_id, storage_id, configuration_file_path, self.secrets_config,
-                                         replace_words)
-                source_obj.configuration_obj = configuration_obj
+                                         replace_words, configuration_obj=configuration_obj)
                 source_obj.update_mappings_for_configurations(self.mappings)
                 default_section_mappings = dict(self.mappings.get("api_mappings"))
                 source_obj.start_interactive_cluster(self, environment_id=source_obj.environment_id,
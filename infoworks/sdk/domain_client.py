@@ -63,21 +63,9 @@ class DomainClient(BaseClient):
                 self.call_api("GET", url_to_list_domains,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_domains, response=response, pagination=pagination):
                     domains_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
                 response["result"] = domains_list
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -201,21 +189,9 @@ class DomainClient(BaseClient):
                 self.call_api("GET", url_to_list_sources_under_domain,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_sources_under_domain, response=response, pagination=pagination):
                     src_under_domain_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
                 response["result"] = src_under_domain_list
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -337,7 +313,8 @@ class DomainClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_domains,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=True).content)
             if response is not None:
                 result = response.get("result", [])
                 if len(result) > 0:
@@ -381,21 +358,9 @@ class DomainClient(BaseClient):
                 self.call_api("GET", url_to_list_pl_extns_under_domain,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pl_extns_under_domain, response=response, pagination=pagination):
                     pl_extn_under_domain_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
                 response["result"] = pl_extn_under_domain_list
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -609,25 +574,14 @@ class DomainClient(BaseClient):
             params = {"limit": 20, "offset": 0}
         try:
             accessible_pipelines_under_domain=[]
-            response = IWUtils.ejson_deserialize(self.call_api("GET", url_builder.url_to_get_accessible_pipelines(
-                self.client_config, domain_id) + IWUtils.get_query_params_string_from_dict(params=params), IWUtils.get_default_header_for_v3(
+            url_to_list_accessible_pipelines = url_builder.url_to_get_accessible_pipelines(
+                self.client_config, domain_id) + IWUtils.get_query_params_string_from_dict(params=params)
+            response = IWUtils.ejson_deserialize(self.call_api("GET", url_to_list_accessible_pipelines, IWUtils.get_default_header_for_v3(
                 self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_accessible_pipelines, response=response, pagination=pagination):
                     accessible_pipelines_under_domain.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
                 response["result"] = accessible_pipelines_under_domain
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, entity_id=domain_id, response=response)
@@ -660,25 +614,14 @@ class DomainClient(BaseClient):
         response = None
         try:
             accessible_workflows_under_domain = []
-            response = IWUtils.ejson_deserialize(self.call_api("GET", url_builder.url_to_get_accessible_workflows(
-                self.client_config, domain_id) + IWUtils.get_query_params_string_from_dict(params=params), IWUtils.get_default_header_for_v3(
+            url_to_list_accessible_workflows = url_builder.url_to_get_accessible_workflows(
+                self.client_config, domain_id) + IWUtils.get_query_params_string_from_dict(params=params)
+            response = IWUtils.ejson_deserialize(self.call_api("GET", url_to_list_accessible_workflows, IWUtils.get_default_header_for_v3(
                 self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_accessible_workflows, response=response, pagination=pagination):
                     accessible_workflows_under_domain.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
                 response["result"] = accessible_workflows_under_domain
                 response["message"] = initial_msg
                 return GenericResponse.parse_result(status=Response.Status.SUCCESS, entity_id=domain_id,
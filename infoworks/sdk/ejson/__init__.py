@@ -1,12 +1,22 @@
 from base64 import b64decode, b64encode
 import calendar
 from collections import OrderedDict
-from datetime import date, datetime
+from datetime import date
 import json
-import six
+import re
 
 EJSON_KEYWORDS = ("$date", "$type", "$value", "$escape", "$binary")
 
+try:
+    # optional faster json backend, used by loads when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers beyond 64 bits into floats, texts with a run of 19 or more digits are parsed by json instead
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19,}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19,}")
+
 try:
     from datetime import timezone
 except ImportError:
@@ -35,13 +45,59 @@ class UnknownTypeError(ValueError):
     pass
 
 
+def _contains_ejson_keywords(o):
+    """
+    walks the containers of o without copying them and tells whether any dict has an ejson keyword as key
+    """
+    seen = set()
+    stack = [o]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        if isinstance(o, dict):
+            if any(kw in o for kw in EJSON_KEYWORDS):
+                return True
+            stack.extend(v for v in o.values() if isinstance(v, (list, tuple, dict)))
+        else:
+            stack.extend(v for v in o if isinstance(v, (list, tuple, dict)))
+    return False
+
+
 class EJSONEncoder(json.JSONEncoder):
 
     def __init__(self, *args, **kwargs):
         self.custom_type_hooks = kwargs.pop('custom_type_hooks', ())
         json.JSONEncoder.__init__(self, *args, **kwargs)
+        # json writes instances of its native types itself without calling default, so hooks for them need _transform
+        self._hooks_native_types = any(
+            issubclass(cls, (str, int, float, list, tuple, dict, type(None)))
+            for hook_cls, name, f in self.custom_type_hooks
+            for cls in (hook_cls if isinstance(hook_cls, tuple) else (hook_cls,)))
+
+    def default(self, o):
+        if isinstance(o, date):
+            return {"$date": int(calendar.timegm(o.timetuple()) * 1000)}
+
+        if isinstance(o, bytes):
+            return {"$binary": b64encode(o).decode()}
+
+        for dict_cls, name, f in self.custom_type_hooks:
+            if isinstance(o, dict_cls):
+                return {"$type": name, "$value": f(o)}
+
+        return json.JSONEncoder.default(self, o)
 
     def encode(self, o):
+        if self._hooks_native_types or (isinstance(o, (list, tuple, dict)) and _contains_ejson_keywords(o)):
+            return json.JSONEncoder.encode(self, self._transform(o))
+        return json.JSONEncoder.encode(self, o)
+
+    def _transform(self, o):
+        """
+        returns a copy of o with the ejson escapes and markers applied, for the documents default can not handle
+        """
         if self.check_circular:
             markers = {}
         else:
@@ -69,10 +125,7 @@ class EJSONEncoder(json.JSONEncoder):
             if isinstance(o, date):
                 return {"$date": int(calendar.timegm(o.timetuple()) * 1000)}
 
-            if isinstance(o, datetime):
-                return {"$date": int(calendar.timegm(o.utctimetuple()) * 1000)}
-
-            if six.PY3 and isinstance(o, six.binary_type):
+            if isinstance(o, bytes):
                 return {"$binary": b64encode(o).decode()}
 
             for dict_cls, name, f in self.custom_type_hooks:
@@ -81,7 +134,7 @@ class EJSONEncoder(json.JSONEncoder):
 
             return o
 
-        return json.JSONEncoder.encode(self, _encode(o))
+        return _encode(o)
 
 
 class EJSONDecoder(json.JSONDecoder):
@@ -132,5 +185,22 @@ def dumps(obj, *args, **kwargs):
     return json.dumps(obj, *args, cls=kwargs.pop('cls', EJSONEncoder), **kwargs)
 
 
+def _parse_json(obj):
+    long_digit_run = _LONG_DIGIT_RUN if isinstance(obj, str) else _LONG_DIGIT_RUN_BYTES
+    if orjson is not None and long_digit_run.search(obj) is None:
+        try:
+            return orjson.loads(obj)
+        except orjson.JSONDecodeError:
+            # e.g. NaN, Infinity or non utf-8 input, which json accepts
+            pass
+    return json.loads(obj)
+
+
 def loads(obj, *args, **kwargs):
-    return json.loads(obj, *args, cls=kwargs.pop('cls', EJSONDecoder), **kwargs)
+    if args or set(kwargs) - {'custom_type_hooks'} or not isinstance(obj, (str, bytes, bytearray)):
+        return json.loads(obj, *args, cls=kwargs.pop('cls', EJSONDecoder), **kwargs)
+    o = _parse_json(obj)
+    # every ejson marker starts with $, documents without one need no decoding walk
+    if (b"$" if isinstance(obj, (bytes, bytearray)) else "$") not in obj:
+        return o
+    return EJSONDecoder(**kwargs)._decode(o)
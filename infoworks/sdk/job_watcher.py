@@ -0,0 +1,233 @@
+import threading
+import time
+
+from infoworks.sdk import url_builder, local_configurations
+from infoworks.sdk.generic_response import GenericResponse
+from infoworks.sdk.local_configurations import Response, ErrorCode
+from infoworks.sdk.polling import Poller
+from infoworks.sdk.utils import IWUtils
+
+TERMINAL_JOB_STATUSES = ["completed", "failed", "aborted", "canceled"]
+
+
+class _WatchedJob(object):
+
+    def __init__(self, job_id, source_id, poller):
+        self.job_id = job_id
+        self.source_id = source_id
+        self.poller = poller
+        self.next_poll_at = time.time()
+        self.failed_count = 0
+        self.response = {}
+
+
+class JobWatcher(object):
+    """
+    Polls many Infoworks jobs (source, pipeline, pipeline group, replicator...) from a single loop instead of one
+    sleeping poll_job thread per job. Every job keeps its own adaptive Poller schedule, the jobs that are due are read
+    together and a completion response (same shape as poll_job) is produced as soon as a job finishes.
+    Jobs registered with their source_id are read in batches through the jobs listing of the source.
+
+    ```
+    watcher = JobWatcher(iwx_client, callback=lambda job_id, response: print(job_id, response))
+    for job_id in job_ids:
+        watcher.watch(job_id, source_id=source_id)
+    for job_id, response in watcher.as_completed():
+        print(job_id, response["result"]["response"]["result"]["status"])
+    ```
+    or in the background with `watcher.start()` and `watcher.join()`.
+    """
+
+    def __init__(self, client, callback=None, poll_timeout=local_configurations.POLLING_TIMEOUT,
+                 polling_frequency=local_configurations.POLLING_FREQUENCY_IN_SEC,
+                 retries=local_configurations.NUM_POLLING_RETRIES,
+                 batch_size=local_configurations.JOB_WATCHER_BATCH_SIZE, on_poll=None):
+        """
+        :param client: initialised InfoworksClientSDK (or any of its client classes)
+        :param callback: function called with (job_id, response) as each job finishes
+        :type callback: Function
+        :param poll_timeout: default polling timeout of a job in seconds. If -1 then polling is done till the job completes
+        :type poll_timeout: Integer
+        :param polling_frequency: default longest interval between two polls of a job whose progress is unknown
+        :type polling_frequency: Integer
+        :param retries: Number of failed status reads after which a job is reported as failed
+        :type retries: Integer
+        :param batch_size: maximum number of jobs of a source read with one list query
+        :type batch_size: Integer
+        :param on_poll: function called with (job_id, response) after every status read of a job, including the last one
+        :type on_poll: Function
+        """
+        self.client = client
+        self.callback = callback
+        self.poll_timeout = poll_timeout
+        self.polling_frequency = polling_frequency
+        self.retries = retries
+        self.batch_size = batch_size
+        self.on_poll = on_poll
+        self.results = {}
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def watch(self, job_id, source_id=None, poll_timeout=None, polling_frequency=None):
+        """
+        adds a job to be watched. Can be called while the watcher is running.
+        :param job_id: Job Identifier
+        :type job_id: String
+        :param source_id: Source Identifier of a source job. Lets the status be read together with the other jobs of the source
+        :type source_id: String
+        :param poll_timeout: polling timeout of this job in seconds (default is the watcher poll_timeout)
+        :type poll_timeout: Integer
+        :param polling_frequency: longest interval between two polls of this job (default is the watcher polling_frequency)
+        :type polling_frequency: Integer
+        :return: the watcher
+        """
+        poller = Poller(poll_timeout=self.poll_timeout if poll_timeout is None else poll_timeout,
+                        polling_frequency=self.polling_frequency if polling_frequency is None else polling_frequency)
+        with self._lock:
+            self._jobs[job_id] = _WatchedJob(job_id, source_id, poller)
+        return self
+
+    def pending(self):
+        """
+        :return: number of jobs that have not finished yet
+        """
+        with self._lock:
+            return len(self._jobs)
+
+    def as_completed(self):
+        """
+        runs the polling loop in the calling thread till all the watched jobs finish or time out
+        :return: generator of (job_id, response dict) in the order the jobs finish
+        """
+        while True:
+            with self._lock:
+                if not self._jobs:
+                    return
+                now = time.time()
+                due_jobs = [job for job in self._jobs.values() if job.next_poll_at <= now]
+            for job, response in self._poll(due_jobs):
+                with self._lock:
+                    self._jobs.pop(job.job_id, None)
+                    self.results[job.job_id] = response
+                if self.callback is not None:
+                    try:
+                        self.callback(job.job_id, response)
+                    except Exception:
+                        self.client.logger.exception(f"Error in the job watcher callback of job {job.job_id}")
+                yield job.job_id, response
+            with self._lock:
+                next_poll_at = min([job.next_poll_at for job in self._jobs.values()], default=None)
+            if next_poll_at is not None:
+                time.sleep(max(next_poll_at - time.time(), 0))
+
+    def start(self):
+        """
+        runs the polling loop in a background thread. The responses are passed to the callback and kept in results.
+        :return: the watcher
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=lambda: [None for _ in self.as_completed()],
+                                            name="iwx_sdk_job_watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        """
+        waits for the background polling loop to finish
+        :param timeout: seconds to wait (default waits till all the jobs finish)
+        :type timeout: Float
+        :return: dict of job_id to response dict of the finished jobs
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.results
+
+    def _poll(self, due_jobs):
+        source_jobs = {}
+        single_jobs = []
+        for job in due_jobs:
+            if job.source_id is None:
+                single_jobs.append(job)
+            else:
+                source_jobs.setdefault(job.source_id, []).append(job)
+        for source_id, jobs in source_jobs.items():
+            if len(jobs) == 1:
+                single_jobs.extend(jobs)
+                continue
+            for i in range(0, len(jobs), self.batch_size):
+                batch = jobs[i:i + self.batch_size]
+                try:
+                    jobs_status = self._read_source_jobs(source_id, [job.job_id for job in batch])
+                except Exception as e:
+                    self.client.logger.error(f"Failed to read the jobs of source {source_id} together: {str(e)}")
+                    jobs_status = {}
+                for job in batch:
+                    if job.job_id in jobs_status:
+                        finished = self._update(job, {"result": jobs_status[job.job_id]})
+                        if finished is not None:
+                            yield job, finished
+                    else:
+                        single_jobs.append(job)
+        for job in single_jobs:
+            try:
+                response = self._read_job(job.job_id)
+            except Exception as e:
+                self.client.logger.exception(f"Error occurred during job {job.job_id} status poll")
+                response = {"message": str(e)}
+            finished = self._update(job, response)
+            if finished is not None:
+                yield job, finished
+
+    def _read_source_jobs(self, source_id, job_ids):
+        params = {"limit": len(job_ids), "filter": {"_id": {"$in": job_ids}}}
+        url_to_list_jobs = url_builder.get_source_details_url(self.client.client_config) + \
+            f"/{source_id}/jobs" + IWUtils.get_query_params_string_from_dict(params=params)
+        response = IWUtils.ejson_deserialize(
+            self.client.call_api("GET", url_to_list_jobs,
+                                 IWUtils.get_default_header_for_v3(self.client.client_config['bearer_token'])).content)
+        return {job.get("id"): job for job in response.get("result") or [] if job.get("id") in job_ids}
+
+    def _read_job(self, job_id):
+        job_monitor_url = url_builder.get_job_status_url(self.client.client_config, job_id)
+        return IWUtils.ejson_deserialize(
+            self.client.call_api("GET", job_monitor_url,
+                                 IWUtils.get_default_header_for_v3(self.client.client_config['bearer_token'])).content)
+
+    def _update(self, job, response):
+        """
+        records a status read of the job and schedules its next poll
+        :return: the completion response if the job finished, else None
+        """
+        job.response = response
+        if self.on_poll is not None:
+            try:
+                self.on_poll(job.job_id, response)
+            except Exception:
+                self.client.logger.exception(f"Error in the job watcher on_poll of job {job.job_id}")
+        result = response.get("result") or {}
+        percentage = None
+        if len(result) != 0:
+            job_status = result.get("status", "")
+            percentage = result.get("percentage")
+            self.client.logger.info(f"Job {job.job_id} poll status : {job_status} - Job completion percentage: "
+                                    f"{result.get('percentage', 0)}")
+            if job_status.lower() in TERMINAL_JOB_STATUSES:
+                return GenericResponse.parse_result(status=Response.Status.SUCCESS, entity_id=job.source_id,
+                                                    job_id=job.job_id, response=response)
+        else:
+            self.client.logger.error(f"Error occurred during job {job.job_id} status poll")
+            job.failed_count = job.failed_count + 1
+            if job.failed_count >= self.retries:
+                return GenericResponse.parse_result(status=Response.Status.FAILED,
+                                                    error_code=ErrorCode.GENERIC_ERROR,
+                                                    error_desc=response.get(
+                                                        "message", f"Error occurred during job {job.job_id} status poll"),
+                                                    response=response, job_id=job.job_id, entity_id=job.source_id)
+        if job.poller.expired():
+            return GenericResponse.parse_result(status=Response.Status.FAILED,
+                                                error_code=ErrorCode.POLL_TIMEOUT,
+                                                error_desc="Job status poll timeout occurred", response=response,
+                                                job_id=job.job_id, entity_id=job.source_id)
+        job.next_poll_at = time.time() + job.poller.next_interval(percentage, failed=len(result) == 0)
+        return None
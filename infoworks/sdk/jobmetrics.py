@@ -1,15 +1,384 @@
-import copy
 import datetime
+import functools
+import hashlib
 import json
 import math
+import os
+import threading
+import time
 import traceback
-from collections import OrderedDict
-from infoworks.sdk import url_builder
+from collections import Counter, OrderedDict
+from infoworks.sdk import url_builder, local_configurations
 from infoworks.sdk.utils import IWUtils
 from infoworks.error import AdminError
 from infoworks.sdk.base_client import BaseClient
+from infoworks.sdk.job_watcher import JobWatcher
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+SOURCE_METRICS_JOB_TYPES = ["source_crawl", "source_structured_crawl", "source_cdc", "source_cdc_merge", "export_data",
+                            "full_load", "cdc", "source_merge", "source_structured_cdc_merge", "source_structured_cdc",
+                            "source_semistructured_cdc_merge", "source_semistructured_cdc"]
+
+
+def split_time_window(date_string, end, window_in_mins=local_configurations.ABC_JOBS_SUB_WINDOW_IN_MINS,
+                      max_windows=local_configurations.ABC_JOBS_MAX_SUB_WINDOWS):
+    """
+    splits the time from date_string to end in up to max_windows windows of at least window_in_mins
+    :return: list of (start, end) date strings, the end of the last window is None (open ended)
+    """
+    start = datetime.datetime.strptime(date_string, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=datetime.timezone.utc)
+    minutes = (end - start).total_seconds() / 60
+    count = min(max(int(math.ceil(minutes / window_in_mins)), 1), max_windows)
+    step = (end - start) / count
+    bounds = [date_string] + [(start + step * i).strftime('%Y-%m-%dT%H:%M:%SZ') for i in range(1, count)] + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def group_jobs_by_entity(jobs):
+    """
+    :return: OrderedDict of entity_id to the list of its jobs
+    """
+    jobs_by_entity = OrderedDict()
+    for job in jobs:
+        jobs_by_entity.setdefault(job.get("entity_id"), []).append(job)
+    return jobs_by_entity
+
+
+def format_job_time(value):
+    """
+    converts an api timestamp like 2023-01-01T10:00:00.000Z to 2023-01-01 10:00:00
+    """
+    return (value or '').split('.')[0].replace('T', ' ')
+
+
+def as_int_or_none(values):
+    """
+    converts a numeric Series to an object Series of int, with None in place of NaN
+    """
+    return pd.Series([None if pd.isna(value) else int(value) for value in values], index=values.index, dtype=object)
+
+
+def combine_ingestion_metrics(ing_metrics):
+    """
+    returns the ingestion metrics of a job as a DataFrame with one row per table_id.
+    Incremental jobs report a CDC and a MERGE row per table: the source details and the records fetched come from the
+    CDC row, the status, watermarks and target count from the MERGE row.
+    """
+    metrics = pd.DataFrame(ing_metrics).reindex(
+        columns=['table_id', 'job_type', 'source_schema_name', 'source_database_name', 'fetch_records_count',
+                 'workflow_id', 'workflow_run_id', 'job_status', 'target_records_count', 'first_merged_watermark',
+                 'last_merged_watermark'])
+    metrics = metrics[metrics['table_id'].notna()]
+    rows_per_table = metrics.groupby('table_id', sort=False)['table_id'].transform('size')
+    single = metrics[rows_per_table == 1].set_index('table_id')
+    incremental = metrics[rows_per_table > 1]
+    cdc = incremental[incremental['job_type'] == "CDC"].drop_duplicates('table_id').set_index('table_id')
+    merge = incremental[incremental['job_type'] == "MERGE"].drop_duplicates('table_id').set_index('table_id')
+    incremental = cdc[['source_schema_name', 'source_database_name', 'fetch_records_count']].join(
+        merge[['workflow_id', 'workflow_run_id', 'job_status', 'target_records_count', 'first_merged_watermark',
+               'last_merged_watermark']], how='outer')
+    incremental['job_type'] = "INCREMENTAL"
+    if len(incremental) == 0:
+        return single
+    return pd.concat([single, incremental[single.columns]])
+
+
+def combine_export_metrics(export_metrics):
+    """
+    returns the export metrics of a job as a DataFrame with one row per table_id
+    """
+    metrics = pd.DataFrame(export_metrics).reindex(
+        columns=['table_id', 'source_id', 'job_status', 'target_records_count', 'number_of_records_written',
+                 'first_merged_watermark', 'last_merged_watermark'])
+    return metrics[metrics['table_id'].notna()].drop_duplicates('table_id').set_index('table_id')
+
+
+def get_export_target_names(table_export_config):
+    """
+    returns the target schema name and table name of a table export configuration
+    """
+    table_export_config = table_export_config or {}
+    target_configuration = table_export_config.get("target_configuration", {})
+    if table_export_config.get("target_type", "") == "BIGQUERY":
+        target_schema_name = ".".join([table_export_config.get("connection", {}).get("project_id", ""),
+                                       target_configuration.get("dataset_name", "")])
+    else:
+        target_schema_name = ".".join([target_configuration.get("schema_name", ""),
+                                       target_configuration.get("database_name", "")])
+    return target_schema_name, target_configuration.get("table_name", "")
+
+
+def set_metrics_columns(rows, metrics, fetch_records_count):
+    """
+    sets the watermark and record count columns of the rows in metrics.
+    The count before the load is the target count less the records fetched, or the target count if the load failed
+    """
+    target_records_count = pd.to_numeric(metrics['target_records_count'], errors='coerce')
+    fetch_records_count = pd.to_numeric(fetch_records_count, errors='coerce')
+    pre_target_count = (target_records_count - fetch_records_count).where(metrics['job_status'] != "FAILED",
+                                                                          target_records_count)
+    rows.loc[metrics.index, 'starting_watermark_value'] = metrics['first_merged_watermark'].fillna('')
+    rows.loc[metrics.index, 'ending_watermark_value'] = metrics['last_merged_watermark'].fillna('')
+    rows.loc[metrics.index, 'pre_target_count'] = as_int_or_none(pre_target_count)
+    rows.loc[metrics.index, 'target_records_count'] = as_int_or_none(target_records_count)
+    rows.loc[metrics.index, 'fetch_records_count'] = as_int_or_none(fetch_records_count)
+
+
+ABC_METRICS_COLUMNS = ['workflow_id', 'workflow_run_id', 'job_id', 'entity_type', 'job_type', 'job_start_time',
+                       'job_end_time', 'job_created_by', 'cluster_id', 'cluster_name', 'job_status', 'job_table_status',
+                       'source_name', 'source_file_names', 'source_schema_name', 'source_database_name',
+                       'table_group_name', 'iwx_table_name', 'starting_watermark_value', 'ending_watermark_value',
+                       'target_schema_name', 'target_table_name', 'pre_target_count', 'fetch_records_count',
+                       'target_records_count', 'job_link']
+
+
+class LookupCache(object):
+    """
+    Run scoped memo of the metadata lookups (table, export and table group configurations, source file paths) made
+    while collecting the ABC metrics. It is shared by the executor workers of a run; concurrent lookups of the same key
+    wait for the first one instead of calling the api again. hits and misses count the lookups per kind.
+    """
+
+    def __init__(self):
+        self.hits = Counter()
+        self.misses = Counter()
+        self._values = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, key, fetch):
+        """
+        :param kind: kind of lookup, e.g. table_info
+        :type kind: String
+        :param key: arguments identifying the looked up entity
+        :type key: Tuple
+        :param fetch: function returning the value when it is not cached yet
+        :type fetch: Function
+        :return: cached or fetched value
+        """
+        cache_key = (kind, key)
+        with self._lock:
+            if cache_key in self._values:
+                self.hits[kind] = self.hits[kind] + 1
+                return self._values[cache_key]
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if cache_key in self._values:
+                    self.hits[kind] = self.hits[kind] + 1
+                    return self._values[cache_key]
+            value = fetch()
+            with self._lock:
+                self._values[cache_key] = value
+                self.misses[kind] = self.misses[kind] + 1
+            return value
+
+    def stats(self):
+        """
+        :return: dict of lookup kind to the number of api calls made and saved
+        """
+        with self._lock:
+            return {kind: {"api_calls": self.misses[kind], "api_calls_saved": self.hits[kind]}
+                    for kind in set(self.hits) | set(self.misses)}
+
+
+class MetricsCheckpoint(object):
+    """
+    High-water mark of the ABC metrics kept in a local json state file (see get_abc_job_metrics(state_file=...)).
+    It records the last update time of the newest job processed, the jobs still running or pending and a hash of the
+    rows returned for the jobs of the last run. The next run reads only the jobs updated since then (plus the jobs
+    that were still open) and returns only the rows that are new or changed. Rows are identified by ROW_KEY_COLUMNS,
+    so the rows of a job reported as running are returned again with the same keys once it finishes.
+    """
+    ROW_KEY_COLUMNS = ['job_id', 'job_type', 'iwx_table_name', 'target_schema_name', 'target_table_name']
+    OPEN_JOB_STATUSES = ["running", "pending"]
+    DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+    def __init__(self, path, overlap=local_configurations.ABC_CHECKPOINT_OVERLAP_IN_SEC):
+        """
+        :param path: path of the json state file, created on the first save
+        :type path: String
+        :param overlap: seconds read again before the high-water mark, to not miss the jobs updated at the same time
+        :type overlap: Integer
+        """
+        self.path = os.path.expanduser(path)
+        self.overlap = overlap
+        self.high_water_mark = None
+        self.open_jobs = {}
+        self.row_hashes = {}
+        self.run_row_hashes = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as state_file:
+                state = json.load(state_file)
+            self.high_water_mark = state.get("high_water_mark")
+            self.open_jobs = state.get("open_jobs", {})
+            self.row_hashes = state.get("row_hashes", {})
+
+    @classmethod
+    def to_date_string(cls, value):
+        if isinstance(value, dict):
+            value = value.get("$date")
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(datetime.timezone.utc)
+            return value.strftime(cls.DATE_FORMAT)
+        if isinstance(value, str) and len(value) >= 19:
+            return value[:19] + "Z"
+        return None
+
+    def get_window_start(self, default):
+        """
+        :param default: date string to read the jobs from when there is no checkpoint yet
+        :type default: String
+        :return: date string from which the updated jobs have to be read
+        """
+        if self.high_water_mark is None:
+            return default
+        start = min([self.high_water_mark] + list(self.open_jobs.values()))
+        start = datetime.datetime.strptime(start, self.DATE_FORMAT) - datetime.timedelta(seconds=self.overlap)
+        return start.strftime(self.DATE_FORMAT)
+
+    def filter_rows(self, rows):
+        """
+        :param rows: metrics rows of the run
+        :type rows: List
+        :return: rows that are new or changed since the last run
+        """
+        changed_rows = []
+        row_hashes = self.run_row_hashes
+        for row in rows:
+            job_id = str(row.get("job_id"))
+            row_key = "|".join(str(row.get(column) or "") for column in self.ROW_KEY_COLUMNS[1:])
+            row_hash = hashlib.sha1(json.dumps(row, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            row_hashes.setdefault(job_id, {})[row_key] = row_hash
+            if self.row_hashes.get(job_id, {}).get(row_key) != row_hash:
+                changed_rows.append(row)
+        return changed_rows
+
+    def advance(self, jobs, failed_job_ids=()):
+        """
+        moves the high-water mark past the jobs read by the run and keeps the hashes of the rows seen by filter_rows
+        :param jobs: jobs read by the run
+        :type jobs: List
+        :param failed_job_ids: ids of the jobs whose rows could not be built, kept open so that the next run reads
+        them again
+        :type failed_job_ids: List
+        """
+        failed_job_ids = set(failed_job_ids)
+        row_hashes = self.run_row_hashes
+        open_jobs = {}
+        for job in jobs:
+            last_updated = self.to_date_string(job.get("last_updated") or job.get("created_at"))
+            if last_updated is None:
+                continue
+            if self.high_water_mark is None or last_updated > self.high_water_mark:
+                self.high_water_mark = last_updated
+            if str(job.get("status", "")).lower() in self.OPEN_JOB_STATUSES or job.get("id") in failed_job_ids:
+                open_jobs[job["id"]] = last_updated
+        # the open jobs of the last run were all inside the window read, the ones missing now are gone
+        self.open_jobs = open_jobs
+        for job_id in open_jobs:
+            if job_id not in row_hashes and job_id in self.row_hashes:
+                row_hashes[job_id] = self.row_hashes[job_id]
+        self.row_hashes = row_hashes
+        self.run_row_hashes = {}
+
+    def save(self):
+        state = {"high_water_mark": self.high_water_mark, "open_jobs": self.open_jobs, "row_hashes": self.row_hashes}
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as state_file:
+            json.dump(state, state_file)
+        os.replace(temp_path, self.path)
+
+
+class MetricsCollector(object):
+    """
+    Per call collector of the ABC metrics rows, shared by the executor workers of a run. Rows are shaped to
+    ABC_METRICS_COLUMNS (with their job_link) as they are added, filtered through the MetricsCheckpoint if any, and
+    then either kept in rows or handed to the callback. The callback gets the rows of one job at a time and is never
+    called from two workers at the same time.
+    """
+
+    def __init__(self, job_link_prefix="", callback=None, checkpoint=None):
+        """
+        :param job_link_prefix: url the job id is appended to for the job_link column
+        :type job_link_prefix: String
+        :param callback: function called with each list of rows instead of keeping them
+        :type callback: Function
+        :param checkpoint: MetricsCheckpoint dropping the rows unchanged since the previous run
+        :type checkpoint: MetricsCheckpoint
+        """
+        self.job_link_prefix = job_link_prefix
+        self.callback = callback
+        self.checkpoint = checkpoint
+        self.rows = []
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, rows):
+        """
+        :param rows: metrics rows (dicts with the ABC_METRICS_COLUMNS keys) of a job
+        :type rows: List
+        """
+        batch = []
+        for row in rows:
+            record = {column: row.get(column) for column in ABC_METRICS_COLUMNS}
+            if record["job_id"] is not None:
+                record["job_link"] = f"{self.job_link_prefix}{record['job_id']}"
+            batch.append(record)
+        with self._lock:
+            if self.checkpoint is not None:
+                batch = self.checkpoint.filter_rows(batch)
+            if not batch:
+                return
+            self.count = self.count + len(batch)
+            if self.callback is None:
+                self.rows.extend(batch)
+            else:
+                self.callback(batch)
+
+
+class MetricsRunReport(object):
+    """
+    Timing and errors of the tasks of a get_abc_job_metrics run (one task per source job and per pipeline job).
+    A failing task is recorded with its error and does not stop the other tasks.
+    """
+
+    def __init__(self):
+        self.tasks = []
+        self.started_at = time.time()
+        self.ended_at = None
+        self._lock = threading.Lock()
+
+    def record(self, task, entity_id, job_id, seconds, rows, error=None):
+        with self._lock:
+            self.tasks.append({"task": task, "entity_id": entity_id, "job_id": job_id, "seconds": seconds,
+                               "rows": rows, "error": error})
+
+    @property
+    def errors(self):
+        """
+        :return: list of the failed tasks
+        """
+        with self._lock:
+            return [task for task in self.tasks if task["error"] is not None]
+
+    def summary(self):
+        """
+        :return: dict with the number of tasks, failed tasks and rows, the wall clock and summed task seconds and the
+        slowest task
+        """
+        with self._lock:
+            ended_at = self.ended_at if self.ended_at is not None else time.time()
+            slowest = max(self.tasks, key=lambda task: task["seconds"], default=None)
+            return {"tasks": len(self.tasks),
+                    "failed_tasks": len([task for task in self.tasks if task["error"] is not None]),
+                    "rows": sum(task["rows"] for task in self.tasks),
+                    "wall_seconds": round(ended_at - self.started_at, 3),
+                    "task_seconds": round(sum(task["seconds"] for task in self.tasks), 3),
+                    "slowest_task": slowest}
 
 
 class JobMetricsClient(BaseClient):
@@ -81,16 +450,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_job_ingestion_metrics, response=response):
                     combinedJobMetric.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return combinedJobMetric
         except Exception as e:
             raise AdminError("Unable to get ingestion job metrics info")
@@ -111,16 +472,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_export_job_metrics, response=response):
                     combinexportMetric.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return combinexportMetric
         except Exception as e:
             raise AdminError("Unable to get export job metrics info")
@@ -140,16 +493,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_job_ingestion_metrics, response=response):
                     combinedJobMetric.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return combinedJobMetric
         except Exception as e:
             raise AdminError("Unable to get ingestion job metrics info")
@@ -169,16 +514,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_job_ingestion_metrics, response=response):
                     exportMetric.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return exportMetric
         except Exception as e:
             raise AdminError("Unable to get export job metrics info")
@@ -200,16 +537,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_metrics, response=response):
                     metrics.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return metrics
         except Exception as e:
             raise AdminError("Unable to get job metrics info")
@@ -224,16 +553,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_src_filepaths, response=response):
                     source_files.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return source_files
         except Exception as e:
             print(e)
@@ -249,16 +570,8 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_pipeline_build_metrics, response=response):
                     combinedJobMetric.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return combinedJobMetric
         except Exception as e:
             raise AdminError("Unable to get pipeline job metrics info")
@@ -273,48 +586,12 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_get_source_info, response=response):
                     combined_sources.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return combined_sources
         except Exception as e:
             raise AdminError("Unable to get source details")
 
-    def get_jobs_of_single_source(self, source_id, date_string):
-        try:
-            combinedJobs = []
-            # filter_condition = "{\"$and\": [{\"createdAt\": {\"$gte\": {\"$date\": \"" + date_string + "\"}}},{\"jobType\": {\"$in\": [\"source_crawl\", \"source_cdc_merge\"]}}]}"
-            filter_condition = "{\"$and\": [{\"entityId\":\"" + source_id + "\"},{\"last_upd\": {\"$gte\": {\"$date\": \"" + date_string + "\"}}},{\"jobType\": {\"$in\": [\"source_crawl\",\"source_structured_crawl\",\"source_cdc\",\"source_cdc_merge\",\"export_data\",\"full_load\",\"cdc\",\"source_merge\",\"source_structured_cdc_merge\",\"source_structured_cdc\",\"source_cdc_merge\",\"source_semistructured_cdc_merge\",\"source_semistructured_cdc\"]}}, {\"status\":{\"$in\":[\"failed\",\"completed\",\"running\",\"pending\",\"canceled\",\"aborted\"]}}]}"
-            url_to_get_jobs = url_builder.get_job_status_url(
-                self.client_config) + f"?filter={filter_condition}&limit=50&offset=0"
-            response = IWUtils.ejson_deserialize(
-                self.call_api("GET", url_to_get_jobs,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
-                              ).content)
-
-            if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
-                    combinedJobs.extend(result)
-                    next_url = response.get('links')['next']
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=next_url,
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
-                return combinedJobs
-        except Exception as e:
-            raise AdminError("Unable to get ingestion jobs list of source")
-
     def get_cluster_runs_of_job(self, job_id):
         try:
             cluster_runs = []
@@ -324,71 +601,85 @@ class JobMetricsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
                               ).content)
             if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_cluster_jobs, response=response):
                     cluster_runs.extend(result)
-                    next_url = response.get('links')['next']
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=next_url,
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
                 return cluster_runs
         except Exception as e:
             raise AdminError("Unable to get cluster jobs list of source")
 
-    def get_pipeline_jobs(self, date_string):
-        try:
-            combinedJobs = []
-            filter_condition = "{\"$and\": [{\"last_upd\": {\"$gte\": {\"$date\": \"" + date_string + "\"}}},{\"jobType\": {\"$in\": [\"pipeline_build\"]}}, {\"status\":{\"$in\":[\"failed\",\"completed\",\"running\",\"pending\",\"aborted\",\"canceled\"]}}]}"
+    def get_jobs_updated_since(self, filter_conditions, date_string):
+        """
+        Gets the jobs matching the filter conditions and updated since date_string. The time window up to now is split
+        in sub windows (see split_time_window) that are paged through concurrently, then the jobs are deduplicated by id.
+        :param filter_conditions: conditions of the jobs filter, combined with $and
+        :type filter_conditions: List
+        :param date_string: jobs updated after this time (e.g. 2023-01-01T10:00:00Z) are returned
+        :type date_string: String
+        :return: list of jobs
+        """
+
+        def get_jobs_of_window(window):
+            window_start, window_end = window
+            conditions = [{"last_upd": {"$gte": {"$date": window_start}}}]
+            if window_end is not None:
+                conditions.append({"last_upd": {"$lt": {"$date": window_end}}})
+            filter_condition = json.dumps({"$and": conditions + filter_conditions})
             url_to_get_jobs = url_builder.get_job_status_url(
                 self.client_config) + f"?filter={filter_condition}&limit=50&offset=0"
-            response = IWUtils.ejson_deserialize(
-                self.call_api("GET", url_to_get_jobs,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
-                              ).content)
+            jobs = []
+            for result in self.iter_pages(url_to_get_jobs):
+                jobs.extend(result)
+            return jobs
 
-            if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
-                    combinedJobs.extend(result)
-                    next_url = response.get('links')['next']
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=next_url,
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
-                return combinedJobs
+        windows = split_time_window(date_string, datetime.datetime.now(datetime.timezone.utc))
+        with ThreadPoolExecutor(max_workers=len(windows)) as executor:
+            jobs_of_windows = list(executor.map(get_jobs_of_window, windows))
+        jobs_by_id = OrderedDict()
+        for jobs in jobs_of_windows:
+            for job in jobs:
+                # a job updated while the windows are read can show up in two of them
+                jobs_by_id[job["id"]] = job
+        return list(jobs_by_id.values())
+
+    def get_jobs_of_single_source(self, source_id, date_string):
+        """
+        Gets the ingestion and export jobs of a source updated since date_string
+        :param source_id: Source Identifier
+        :type source_id: String
+        :param date_string: jobs updated after this time (e.g. 2023-01-01T10:00:00Z) are returned
+        :type date_string: String
+        :return: list of jobs
+        """
+        try:
+            return self.get_all_source_jobs(date_string, source_id=source_id)
+        except Exception as e:
+            raise AdminError("Unable to get ingestion jobs list of source")
+
+    def get_pipeline_jobs(self, date_string):
+        try:
+            return self.get_jobs_updated_since(
+                [{"jobType": {"$in": ["pipeline_build"]}},
+                 {"status": {"$in": ["failed", "completed", "running", "pending", "aborted", "canceled"]}}],
+                date_string)
         except Exception as e:
             raise AdminError("Unable to get pipeline jobs list")
 
-    def get_all_source_jobs(self, date_string):
+    def get_all_source_jobs(self, date_string, source_id=None):
+        """
+        Gets the ingestion and export jobs of the sources updated since date_string
+        :param date_string: jobs updated after this time (e.g. 2023-01-01T10:00:00Z) are returned
+        :type date_string: String
+        :param source_id: Source Identifier, to get the jobs of a single source
+        :type source_id: String
+        :return: list of jobs
+        """
+        filter_conditions = [{"entityType": {"$in": ["source"]}},
+                             {"jobType": {"$in": SOURCE_METRICS_JOB_TYPES}},
+                             {"status": {"$in": ["failed", "completed", "running", "pending", "canceled", "aborted"]}}]
+        if source_id is not None:
+            filter_conditions.insert(0, {"entityId": source_id})
         try:
-            combinedJobs = []
-            filter_condition = "{\"$and\": [{\"last_upd\": {\"$gte\": {\"$date\": \"" + date_string + "\"}}},{\"entityType\": {\"$in\": [\"source\"]}}, {\"jobType\": {\"$in\": [\"source_crawl\",\"source_structured_crawl\",\"source_cdc\",\"source_cdc_merge\",\"export_data\",\"full_load\",\"cdc\",\"source_merge\",\"source_structured_cdc_merge\",\"source_structured_cdc\",\"source_cdc_merge\",\"source_semistructured_cdc_merge\",\"source_semistructured_cdc\"]}},{\"status\":{\"$in\":[\"failed\",\"completed\",\"running\",\"pending\",\"canceled\",\"aborted\"]}}]}"
-            url_to_get_all_source_jobs = url_builder.get_job_status_url(
-                self.client_config) + f"?filter={filter_condition}&limit=50&offset=0"
-            response = IWUtils.ejson_deserialize(
-                self.call_api("GET", url_to_get_all_source_jobs,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])
-                              ).content)
-            if response is not None and "result" in response:
-                result = response.get("result", [])
-                while len(result) > 0:
-                    combinedJobs.extend(result)
-                    next_url = response.get('links')['next']
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=next_url,
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(self.callurl(nextUrl).content)
-                    result = response.get("result", [])
-                return combinedJobs
+            return self.get_jobs_updated_since(filter_conditions, date_string)
         except Exception as e:
             raise AdminError("Unable to get source ingestion jobs list")
 
@@ -443,228 +734,232 @@ class JobMetricsClient(BaseClient):
         except:
             raise AdminError("Unable to get pipeline NAME")
 
-    def get_source_jobs_metrics_results_table_level(self, date_string, source, workflow_id=None, workflow_run_id=None):
-        src_name = source["name"]
-        source_id = source["id"]
-        list_of_jobs_obj = self.get_jobs_of_single_source(source_id, date_string)
+    def get_source_jobs_metrics_results_table_level(self, date_string, source, workflow_id=None, workflow_run_id=None,
+                                                    lookup_cache=None, collector=None, jobs=None):
+        """
+        Gets the table level ABC metrics of the jobs of a source
+        :param date_string: jobs updated after this time (e.g. 2023-01-01T10:00:00Z) are reported
+        :type date_string: String
+        :param source: source object with the id and name of the source
+        :type source: JSON Object
+        :param workflow_id: Workflow id to get the jobs
+        :type workflow_id: String
+        :param workflow_run_id: Workflow run id to get the jobs
+        :type workflow_run_id: String
+        :param lookup_cache: LookupCache shared by the jobs of the run
+        :type lookup_cache: LookupCache
+        :param collector: MetricsCollector the rows of each job are added to as soon as they are built. Without one
+        they are also appended to job_metrics_final
+        :type collector: MetricsCollector
+        :param jobs: jobs of the source, if already fetched with get_all_source_jobs
+        :type jobs: List
+        :return: list of row dicts (empty when a collector is given)
+        """
+        if lookup_cache is None:
+            lookup_cache = LookupCache()
+        rows = []
+        if jobs is None:
+            jobs = self.get_all_source_jobs(date_string, source_id=source["id"])
         try:
-            for job in list_of_jobs_obj:
-                # self.logger.info(f"Job Data: {json.dumps(job)}")
-                job_id = job["id"]
-                job_type = job["type"]
-                job_status = job["status"]
-                job_createdAt = job["created_at"]
-                #job_start_time = job_createdAt.split('.')[0].replace('T', ' ')
-                job_start_time = job['build_started_at'].split('.')[0].replace('T', ' ')
-                job_end_time = job['build_ended_at'].split('.')[0].replace('T', ' ')
-                job_created_by = job.get('created_by')
-                workflow_id = job.get('triggered_by', {}).get('parent_id', '')
-                workflow_run_id = job.get('triggered_by', {}).get('run_id', '')
-
-                # Fetches Cluster Run Info (i.e. Table Data in a Job)
-                cluster_data = self.get_cluster_runs_of_job(job_id)
-
-                # Fetches Table Group Info
-                try:
-                    tg_id, processedAt, job_end_time, job_status, entity_type = self.get_tablegroup_id_from_job(
-                        job_id, source["id"])
-                    job_end_time = job_end_time.split('.')[0].replace('T', ' ')
-                    table_group_name, all_tables_list = self.get_table_group_name(tg_id, source["id"])
-                except Exception as error:
-                    # This means the job is non-table group job
-                    table_group_name = ""
-                    entity_type = "table"
-                    all_tables_list = []
-
-                # Fetches Ingestion Metrics
-                ing_metrics = self.get_ingestion_metrics(str(job_id), source["id"])
-                ing_metrics_df = pd.DataFrame(ing_metrics)
-                if ing_metrics is not None:
-                    ing_metrics_tables_list = list(set([i['table_id'] for i in ing_metrics]))
-                else:
-                    ing_metrics_tables_list = []
-
-                # Fetches Export Metrics
-                export_metrics = self.get_export_metrics(str(job_id), source_id)
-                df_export = pd.DataFrame(export_metrics)
-                if export_metrics is not None:
-                    export_metrics_tables_list = list([i['table_id'] for i in export_metrics])
-                else:
-                    export_metrics_tables_list = []
-
-                # Job Level Properties
-                source_job_row_template = {
-                    'workflow_id': workflow_id, 'workflow_run_id': workflow_run_id,
-                    'job_id': job_id, 'job_type': self.job_type_mappings[job_type.upper()],
-                    'job_start_time': job_start_time, 'job_end_time': job_end_time,
-                    'job_created_by': job_created_by, 'cluster_id': "", "cluster_name": "",
-                    'job_status': job_status.upper(), 'job_table_status': '',
-                    'entity_type': entity_type, "source_name": src_name, "source_schema_name": "",
-                    "source_database_name": "", "source_file_names": [], "table_group_name": table_group_name,
-                    "iwx_table_name": "", 'starting_watermark_value': '', 'ending_watermark_value': '',
-                    "target_schema_name": "", "target_table_name": "", "pre_target_count": "", "fetch_records_count": 0,
-                    "target_records_count": "", "job_link": ""}
-
-                if cluster_data:
-                    # Table Level in a Job
-                    for row in cluster_data:
-                        cluster_id = row.get('cluster_id', '')
-                        cluster_name = row.get('cluster_name', '')
-                        table_job_start_time = row.get('started_at', '').split('.')[0].replace('T', ' ')
-                        table_job_end_time = row.get('ended_at', '').split('.')[0].replace('T', ' ')
-                        iwx_table_name = row.get('entity_name', '')
-                        table_id = row.get('sub_entity_id', '')
-                        job_table_status = row.get('entity_run_details', {}).get('entity_run_status', '')
-
-                        table_info = self.get_table_info(source_id, table_id)
-                        table_name = table_info.get('name')
-                        target_table_name = table_info.get("configuration", {}).get('target_table_name', '')
-                        target_schema_name = table_info.get("configuration", {}).get('target_schema_name', '')
-                        table_row_count = table_info.get('row_count', 0)
-
-                        source_job_row_template["job_start_time"] = table_job_start_time
-                        source_job_row_template["job_end_time"] = table_job_end_time
-                        source_job_row_template['cluster_id'] = cluster_id
-                        source_job_row_template['cluster_name'] = cluster_name
-                        source_job_row_template['job_table_status'] = job_table_status
-                        source_job_row_template['iwx_table_name'] = table_name
-                        source_job_row_template['target_schema_name'] = target_schema_name
-                        source_job_row_template['target_table_name'] = target_table_name
-
-                        if ing_metrics != [] and job_type != "export_data" and job_table_status.upper() == "SUCCESS":
-                            if table_id in ing_metrics_tables_list:
-                                filter1 = ing_metrics_df["table_id"] == table_id
-                                table = {}
-                                if len(ing_metrics_df.loc[filter1]) > 1:
-                                    # Incremental Job
-                                    filter2 = ing_metrics_df["job_type"] == "CDC"
-                                    filter3 = ing_metrics_df["job_type"] == "MERGE"
-                                    cdc_output = ing_metrics_df.loc[filter1 & filter2].to_dict('records')[0]
-                                    merge_output = ing_metrics_df.loc[filter1 & filter3].to_dict('records')[0]
-                                    for item in ['source_id', 'fetch_records_count', 'job_id',
-                                                 'source_schema_name', 'source_database_name']:
-                                        table[item] = cdc_output.get(item, "")
-                                        table['job_type'] = "INCREMENTAL"
-                                    for item in ['workflow_id', 'workflow_run_id', 'job_status',
-                                                 'target_records_count', 'first_merged_watermark',
-                                                 'last_merged_watermark']:
-                                        table[item] = merge_output.get(item, "")
-                                        table['job_type'] = "INCREMENTAL"
-                                else:
-                                    table = ing_metrics_df.loc[filter1].to_dict('records')[0]
-                                table["source_schema_name"] = table.get("source_schema_name", "")
-                                table["source_database_name"] = table.get("source_database_name", "")
-                                table["source_file_names"] = self.get_source_file_paths(
-                                    source['id'], table_id, job_id) if table["source_schema_name"] == "" else []
-                                table["workflow_id"] = table.get("workflow_id", "")
-                                table["workflow_run_id"] = table.get('workflow_run_id', "")
-                                if workflow_id is not None and workflow_run_id is not None:
-                                    if not (table["workflow_id"] == workflow_id and
-                                            table["workflow_run_id"] == workflow_run_id):
-                                        continue
-                                table["entity_type"] = entity_type
-                                table["starting_watermark_value"] = table.pop('first_merged_watermark', '')
-                                table["ending_watermark_value"] = table.pop('last_merged_watermark', '')
-                                if math.isnan(table.get('target_records_count')):
-                                    table['pre_target_count'] = None
-                                    table['target_records_count'] = None
-                                else:
-                                    if table["job_status"] == "FAILED":
-                                        table['pre_target_count'] = table.get('target_records_count')
-                                        table['target_records_count'] = int(table.get('target_records_count'))
-                                    else:
-                                        table['pre_target_count'] = int(
-                                            table.get('target_records_count') - int(table.get('fetch_records_count')))
-                                        table['target_records_count'] = int(table.get('target_records_count'))
-                                if table.get('job_type') == "CDC":
-                                    table['job_type'] = "INCREMENTAL"
-                                # table['job_start_time'] = table['job_start_time'].split('.')[0].replace('T', ' ')
-                                # table['job_end_time'] = table['job_end_time'].split('.')[0].replace('T', ' ')
-                                table['fetch_records_count'] = int(table['fetch_records_count'])
-
-                                # self.logger.info(f"Ingestion Table Data: {json.dumps(table)}")
-                                # Metrics in Consideration from Ingestion Data
-                                for key in ["job_type", "source_schema_name", "source_database_name",
-                                            "source_file_names", "entity_type", "starting_watermark_value",
-                                            "ending_watermark_value",
-                                            "target_records_count", "pre_target_count", "fetch_records_count"]:
-                                    source_job_row_template[key] = table.get(key, '')
-
-                            # Table not in Ingestion Metrics
-                            else:
-                                sync_type = table_info.get('configuration', {}).get('sync_type', '')
-                                source_job_row_template['job_type'] = sync_type.upper()
-                                source_job_row_template["pre_target_count"] = table_row_count
-                                source_job_row_template["target_records_count"] = table_row_count
-
-                        if job_type == "export_data":
-                            if export_metrics is not None:
-                                if table_id in export_metrics_tables_list:
-                                    filter1 = df_export["table_id"] == table_id
-                                    table = df_export.loc[filter1].to_dict('records')[0]
-                                    table["job_type"] = "EXPORT"
-                                    table_export_config = self.get_table_export_info(table.get('source_id'), table_id)
-                                    if table_export_config.get("target_type", "") == "BIGQUERY":
-                                        table["target_schema_name"] = ".".join(
-                                            [table_export_config.get("connection", {}).get("project_id", ""),
-                                             table_export_config.get("target_configuration", {}).get("dataset_name",
-                                                                                                     "")])
-                                    else:
-                                        table["target_schema_name"] = ".".join(
-                                            [table_export_config.get("target_configuration", {}).get("schema_name", ""),
-                                             table_export_config.get("target_configuration", {}).get("database_name",
-                                                                                                     "")])
-                                    table["target_table_name"] = table_export_config.get("target_configuration",
-                                                                                         {}).get(
-                                        "table_name", "")
-                                    table["workflow_id"] = table.get("workflow_id", "")
-                                    table["workflow_run_id"] = table.get("workflow_run_id", "")
-                                    table["entity_type"] = entity_type
-                                    table["starting_watermark_value"] = table.pop('first_merged_watermark', '')
-                                    table["ending_watermark_value"] = table.pop('last_merged_watermark', '')
-                                    if math.isnan(table.get('target_records_count')):
-                                        table['pre_target_count'] = None
-                                        table['target_records_count'] = None
-                                    else:
-                                        if table["job_status"] == "FAILED":
-                                            table['pre_target_count'] = table.get('target_records_count')
-                                            table['target_records_count'] = int(table.get('target_records_count'))
-                                        else:
-                                            table['pre_target_count'] = int(
-                                                table.get('target_records_count') - int(
-                                                    table.get('number_of_records_written')))
-                                            table['target_records_count'] = int(table.get('target_records_count'))
-                                    od = OrderedDict()
-                                    # table['job_start_time'] = table['job_start_time'].split('.')[0].replace('T', ' ')
-                                    # table['job_end_time'] = table['job_end_time'].split('.')[0].replace('T', ' ')
-                                    table['fetch_records_count'] = int(table['number_of_records_written'])
-
-                                    for key in ["job_type", "target_schema_name",
-                                                "target_table_name", "entity_type", "starting_watermark_value",
-                                                "ending_watermark_value", "target_records_count", "pre_target_count",
-                                                "fetch_records_count"]:
-                                        source_job_row_template[key] = table.get(key, "")
-                                else:
-                                    source_job_row_template['job_type'] = "EXPORT"
-                                    source_job_row_template['pre_target_count'] = table_row_count
-                                    source_job_row_template['target_records_count'] = table_row_count
-                                    source_job_row_template['entity_type'] = entity_type
-
-                        # self.logger.info(f"Source Row Template: {json.dumps(source_job_row_template)}")
-                        job_od = OrderedDict()
-                        for key in source_job_row_template.keys():
-                            job_od[key] = source_job_row_template.get(key, "")
-                        self.job_metrics_final.append(job_od)
-                else:
-                    job_od = OrderedDict()
-                    for key in source_job_row_template.keys():
-                        job_od[key] = source_job_row_template.get(key, "")
-                    self.job_metrics_final.append(job_od)
+            for job in jobs:
+                job_rows = self.get_source_job_metrics_rows(job, source, workflow_id, workflow_run_id, lookup_cache)
+                self.collect_rows(job_rows, collector)
+                if collector is None:
+                    rows.extend(job_rows)
         except Exception as e:
             print(str(e))
             traceback.print_exc()
+        return rows
+
+    def get_source_job_metrics_rows(self, job, source, workflow_id=None, workflow_run_id=None, lookup_cache=None):
+        """
+        Builds the table level ABC metrics rows of a source job.
+        The cluster runs of the job (one per table) are joined on table_id with the table configurations and with the
+        ingestion metrics (CDC and MERGE rows of incremental jobs combined) or the export metrics of the job.
+        :param job: job object from the jobs listing
+        :type job: JSON Object
+        :param source: source object with the id and name of the source
+        :type source: JSON Object
+        :param workflow_id: Workflow id to get the jobs
+        :type workflow_id: String
+        :param workflow_run_id: Workflow run id to get the jobs
+        :type workflow_run_id: String
+        :param lookup_cache: LookupCache shared by the jobs of the run
+        :type lookup_cache: LookupCache
+        :return: list of row dicts
+        """
+        if lookup_cache is None:
+            lookup_cache = LookupCache()
+        source_id = source["id"]
+        job_id = job["id"]
+        job_type = job["type"]
+        job_status = job["status"]
+        job_end_time = format_job_time(job.get('build_ended_at'))
+        # Fetches Table Group Info
+        try:
+            tg_id, processedAt, job_end_time, job_status, entity_type = self.get_tablegroup_id_from_job(
+                job_id, source_id)
+            job_end_time = format_job_time(job_end_time)
+            table_group_name, all_tables_list = lookup_cache.get(
+                "table_group_name", (tg_id, source_id), lambda: self.get_table_group_name(tg_id, source_id))
+        except Exception:
+            # This means the job is non-table group job
+            table_group_name = ""
+            entity_type = "table"
+
+        # Job Level Properties
+        job_row = OrderedDict([
+            ('workflow_id', job.get('triggered_by', {}).get('parent_id', '')),
+            ('workflow_run_id', job.get('triggered_by', {}).get('run_id', '')),
+            ('job_id', job_id), ('job_type', self.job_type_mappings[job_type.upper()]),
+            ('job_start_time', format_job_time(job.get('build_started_at'))), ('job_end_time', job_end_time),
+            ('job_created_by', job.get('created_by')), ('cluster_id', ""), ("cluster_name", ""),
+            ('job_status', job_status.upper()), ('job_table_status', ''),
+            ('entity_type', entity_type), ("source_name", source["name"]), ("source_schema_name", ""),
+            ("source_database_name", ""), ("source_file_names", []), ("table_group_name", table_group_name),
+            ("iwx_table_name", ""), ('starting_watermark_value', ''), ('ending_watermark_value', ''),
+            ("target_schema_name", ""), ("target_table_name", ""), ("pre_target_count", ""),
+            ("fetch_records_count", 0), ("target_records_count", ""), ("job_link", "")])
+
+        # Fetches Cluster Run Info (i.e. Table Data in a Job)
+        cluster_data = self.get_cluster_runs_of_job(job_id)
+        if not cluster_data:
+            return [job_row]
+
+        # Table Level in a Job: one row per cluster run joined with the table configuration
+        runs = pd.DataFrame({
+            'table_id': [row.get('sub_entity_id', '') for row in cluster_data],
+            'cluster_id': [row.get('cluster_id', '') for row in cluster_data],
+            'cluster_name': [row.get('cluster_name', '') for row in cluster_data],
+            'job_start_time': [format_job_time(row.get('started_at', '')) for row in cluster_data],
+            'job_end_time': [format_job_time(row.get('ended_at', '')) for row in cluster_data],
+            'job_table_status': [row.get('entity_run_details', {}).get('entity_run_status', '')
+                                 for row in cluster_data]})
+        runs = runs.merge(self.get_tables_info_frame(source_id, runs['table_id'].unique(), lookup_cache),
+                          on='table_id', how='left')
+        rows = pd.DataFrame({key: pd.Series([value] * len(runs), index=runs.index, dtype=object)
+                             for key, value in job_row.items()})
+        for key in ['job_start_time', 'job_end_time', 'cluster_id', 'cluster_name', 'job_table_status',
+                    'iwx_table_name', 'target_schema_name', 'target_table_name']:
+            rows[key] = runs[key].astype(object)
+        keep = pd.Series(True, index=runs.index)
+
+        if job_type == "export_data":
+            export_metrics = self.get_export_metrics(str(job_id), source_id)
+            if export_metrics is not None:
+                exports = combine_export_metrics(export_metrics)
+                in_export_metrics = runs['table_id'].isin(exports.index)
+                rows.loc[:, 'job_type'] = "EXPORT"
+                rows.loc[:, 'entity_type'] = entity_type
+                rows.loc[~in_export_metrics, 'pre_target_count'] = runs['table_row_count']
+                rows.loc[~in_export_metrics, 'target_records_count'] = runs['table_row_count']
+                if in_export_metrics.any():
+                    metrics = runs[['table_id']].join(exports, on='table_id')[in_export_metrics]
+                    export_targets = {}
+                    for table_id, export_source_id in metrics[['table_id', 'source_id']].drop_duplicates(
+                            'table_id').itertuples(index=False):
+                        export_targets[table_id] = get_export_target_names(lookup_cache.get(
+                            "table_export_info", (export_source_id, table_id),
+                            functools.partial(self.get_table_export_info, export_source_id, table_id)))
+                    rows.loc[in_export_metrics, 'target_schema_name'] = metrics['table_id'].map(
+                        lambda table_id: export_targets[table_id][0])
+                    rows.loc[in_export_metrics, 'target_table_name'] = metrics['table_id'].map(
+                        lambda table_id: export_targets[table_id][1])
+                    set_metrics_columns(rows, metrics, metrics['number_of_records_written'])
+        else:
+            ing_metrics = self.get_ingestion_metrics(str(job_id), source_id)
+            if ing_metrics == []:
+                # no metrics reported for the job, the rows keep the job level values
+                return rows.to_dict('records')
+            loaded = rows['job_table_status'].astype(str).str.upper() == "SUCCESS"
+            ingestion = combine_ingestion_metrics(ing_metrics or [])
+            in_ingestion_metrics = loaded & runs['table_id'].isin(ingestion.index)
+
+            # Table not in Ingestion Metrics
+            not_in_ingestion_metrics = loaded & ~in_ingestion_metrics
+            rows.loc[not_in_ingestion_metrics, 'job_type'] = runs['sync_type'].fillna('').astype(str).str.upper()
+            rows.loc[not_in_ingestion_metrics, 'pre_target_count'] = runs['table_row_count']
+            rows.loc[not_in_ingestion_metrics, 'target_records_count'] = runs['table_row_count']
+
+            if in_ingestion_metrics.any():
+                metrics = runs[['table_id']].join(ingestion, on='table_id')[in_ingestion_metrics]
+                for key in ['workflow_id', 'workflow_run_id', 'source_schema_name', 'source_database_name']:
+                    metrics[key] = metrics[key].fillna('')
+                if workflow_id is not None and workflow_run_id is not None:
+                    keep[in_ingestion_metrics] = (metrics['workflow_id'] == workflow_id) & (
+                            metrics['workflow_run_id'] == workflow_run_id)
+                rows.loc[in_ingestion_metrics, 'job_type'] = metrics['job_type'].replace({"CDC": "INCREMENTAL"})
+                rows.loc[in_ingestion_metrics, 'source_schema_name'] = metrics['source_schema_name']
+                rows.loc[in_ingestion_metrics, 'source_database_name'] = metrics['source_database_name']
+                # file based sources have no schema, their rows list the files that were ingested
+                rows.loc[in_ingestion_metrics, 'source_file_names'] = pd.Series(
+                    [lookup_cache.get("source_file_paths", (source_id, table_id, job_id),
+                                      functools.partial(self.get_source_file_paths, source_id, table_id, job_id))
+                     if schema_name == "" else []
+                     for table_id, schema_name in metrics[['table_id', 'source_schema_name']].itertuples(index=False)],
+                    index=metrics.index, dtype=object)
+                set_metrics_columns(rows, metrics, metrics['fetch_records_count'])
+
+        return rows[keep].to_dict('records')
 
-    def get_pipeline_build_metrics_results(self, job=None, workflow_id=None, workflow_run_id=None):
+    def get_tables_info_frame(self, source_id, table_ids, lookup_cache=None):
+        """
+        Gets the configuration of the tables of a source
+        :param source_id: Entity identifier of the source
+        :type source_id: String
+        :param table_ids: Entity identifiers of the tables
+        :type table_ids: List
+        :param lookup_cache: LookupCache shared by the jobs of the run
+        :type lookup_cache: LookupCache
+        :return: DataFrame with one row per table_id
+        """
+        if lookup_cache is None:
+            lookup_cache = LookupCache()
+        tables = []
+        for table_id in table_ids:
+            table_info = lookup_cache.get("table_info", (source_id, table_id),
+                                          functools.partial(self.get_table_info, source_id, table_id)) or {}
+            configuration = table_info.get("configuration", {})
+            tables.append({'table_id': table_id, 'iwx_table_name': table_info.get('name'),
+                           'target_schema_name': configuration.get('target_schema_name', ''),
+                           'target_table_name': configuration.get('target_table_name', ''),
+                           'table_row_count': table_info.get('row_count', 0),
+                           'sync_type': configuration.get('sync_type', '')})
+        return pd.DataFrame(tables, columns=['table_id', 'iwx_table_name', 'target_schema_name', 'target_table_name',
+                                             'table_row_count', 'sync_type'], dtype=object)
+
+    def get_job_link_prefix(self):
+        """
+        :return: url of the job logs page in the Infoworks UI, without the job id
+        """
+        ui_port = 443 if self.client_config["port"] == '443' else 3000
+        return f"{self.client_config['protocol']}://{self.client_config['ip']}:{ui_port}/job/logs?jobId="
+
+    def run_metrics_task(self, task, job, collector, run_report, build_rows):
+        """
+        builds the rows of a job with build_rows, adds them to the collector and records the timing in the run_report
+        """
+        started_at = time.time()
+        try:
+            rows = build_rows()
+            collector.add(rows)
+            run_report.record(task, job.get("entity_id"), job.get("id"), time.time() - started_at, len(rows))
+        except Exception as e:
+            self.logger.exception(f"Failed to get the ABC metrics of job {job.get('id')}")
+            run_report.record(task, job.get("entity_id"), job.get("id"), time.time() - started_at, 0, error=str(e))
+
+    def collect_rows(self, rows, collector=None):
+        """
+        adds the rows to the collector, or to job_metrics_final when there is none (the rows of the public per job
+        methods called directly are read from job_metrics_final, which then grows with every call)
+        """
+        if collector is not None:
+            collector.add(rows)
+        else:
+            self.job_metrics_final.extend(rows)
+        return rows
+
+    def get_pipeline_build_metrics_results(self, job=None, workflow_id=None, workflow_run_id=None, collector=None):
         """
         Gets the Infoworks pipeline build metrics
         :param job: job object to get the pipeline build metrics details
@@ -673,7 +968,16 @@ class JobMetricsClient(BaseClient):
         :type workflow_id: String
         :param workflow_run_id: Workflow run id to get the jobs
         :type workflow_run_id: String
-        :return: response dict
+        :param collector: MetricsCollector the rows of the job are added to. Without one they are appended to
+        job_metrics_final
+        :type collector: MetricsCollector
+        :return: list of row dicts
+        """
+        return self.collect_rows(self.get_pipeline_build_metrics_rows(job, workflow_id, workflow_run_id), collector)
+
+    def get_pipeline_build_metrics_rows(self, job=None, workflow_id=None, workflow_run_id=None):
+        """
+        :return: the pipeline build metrics rows of a job, without adding them anywhere
         """
         if job is None:
             self.logger.error("job is a mandatory parameter")
@@ -685,8 +989,9 @@ class JobMetricsClient(BaseClient):
         job_cluster_id = job.get('cluster_id')
         job_cluster_name = job.get('cluster_name')
         job_createdAt = job['created_at']
-        job_start_time = job['build_started_at'].split('.')[0].replace('T', ' ')
-        job_end_time = job['build_ended_at'].split('.')[0].replace('T', ' ')
+        # a running build has no build_ended_at yet
+        job_start_time = format_job_time(job.get('build_started_at'))
+        job_end_time = format_job_time(job.get('build_ended_at'))
         entity_type = job['entity_type']
         job_created_by = job.get('created_by')
         running_job_template = {
@@ -711,8 +1016,8 @@ class JobMetricsClient(BaseClient):
         cluster_data = self.get_cluster_runs_of_job(job_id)
         if cluster_data:
             # Job Start Time and End Time for no Pipeline Metrics
-            running_job_template['job_start_time'] = cluster_data[0]['started_at'].split('.')[0].replace('T', ' ')
-            running_job_template['job_end_time'] = cluster_data[0]['ended_at'].split('.')[0].replace('T', ' ')
+            running_job_template['job_start_time'] = format_job_time(cluster_data[0].get('started_at'))
+            running_job_template['job_end_time'] = format_job_time(cluster_data[0].get('ended_at'))
             running_job_template['cluster_id'] = cluster_data[0]['cluster_id']
             running_job_template['cluster_name'] = cluster_data[0]['cluster_name']
             job_cluster_id = cluster_data[0]['cluster_id']
@@ -728,8 +1033,8 @@ class JobMetricsClient(BaseClient):
                         'target_table_name', 'pre_target_count', 'fetch_records_count',
                         'target_records_count']:
                 running_od[key] = running_job_template.get(key, "")
-            self.job_metrics_final.append(running_od)
-            return
+            temp.append(running_od)
+            return temp
         pipeline_metrics = self.get_pipeline_build_metrics(str(job_id))
         # For SQL Pipeline successful jobs (No Pipeline Metrics)
         if job_status.upper() == "COMPLETED" and len(pipeline_metrics) == 0:
@@ -741,54 +1046,47 @@ class JobMetricsClient(BaseClient):
                         'target_table_name', 'pre_target_count', 'fetch_records_count',
                         'target_records_count']:
                 running_od[key] = running_job_template.get(key, "")
-            self.job_metrics_final.append(running_od)
-            return
-        pipeline_successful_tables = []
+            temp.append(running_od)
+            return temp
         if pipeline_metrics is not None:
-            tables_list = list(set([i['target_table_name'] for i in pipeline_metrics]))
-            df_pipeline = pd.DataFrame(pipeline_metrics)
-            for target_table_name in tables_list:
-                schema_name, table_name = target_table_name.split(".")
-                pipeline_successful_tables.append(table_name)
-                filter1 = df_pipeline["target_table_name"] == target_table_name
-                table = df_pipeline.loc[filter1].to_dict('records')[0]
-                table["job_type"] = "PIPELINE_BUILD"
-                table["source_name"] = ''
-                table["source_file_names"] = []
-                table["source_schema_name"] = ""
-                table["source_database_name"] = ""
-                table["table_group_name"] = ''
-                table["iwx_table_name"] = ''
-                table['target_schema_name'] = schema_name
-                table['target_table_name'] = table_name
-                table["workflow_id"] = table.get('workflow_id', '')
-                table["workflow_run_id"] = table.get('workflow_run_id', '')
+            # the metrics have one or more records per target table, the first one of each target is reported
+            first_metrics = OrderedDict()
+            for metrics in pipeline_metrics:
+                first_metrics.setdefault(metrics.get("target_table_name") or "", metrics)
+            for target_table_name, metrics in first_metrics.items():
+                table = dict(metrics)
+                if table.get("workflow_id") is None:
+                    table["workflow_id"] = ''
+                if table.get("workflow_run_id") is None:
+                    table["workflow_run_id"] = ''
                 if workflow_id is not None and workflow_run_id is not None:
                     if not (table["workflow_id"] == workflow_id and table["workflow_run_id"] == workflow_run_id):
                         continue
-                table["entity_type"] = job.get("entity_type", "pipeline")
-                table["starting_watermark_value"] = table.pop('first_merged_watermark', '')
-                table["ending_watermark_value"] = table.pop('last_merged_watermark', '')
-                table["target_records_count"] = table.get("target_records_count", None)
-                table["job_status"] = table.get("job_status", "")
-                table["cluster_id"] = job_cluster_id
-                table["cluster_name"] = job_cluster_name
-                table['job_created_by'] = job_created_by
-                if math.isnan(table.get('target_records_count')):
-                    table['pre_target_count'] = None
-                    table['target_records_count'] = None
+                # catalog.schema.table names keep the catalog in the schema name
+                schema_name, _, table_name = target_table_name.rpartition(".")
+                target_records_count = table.get("target_records_count")
+                if target_records_count is None or pd.isna(target_records_count):
+                    pre_target_count = None
+                    target_records_count = None
+                elif table.get("job_status") == "FAILED":
+                    pre_target_count = target_records_count
+                    target_records_count = int(target_records_count)
                 else:
-                    if table["job_status"] == "FAILED":
-                        table['pre_target_count'] = table.get('target_records_count')
-                        table['target_records_count'] = int(table.get('target_records_count'))
-                    else:
-                        table['pre_target_count'] = int(
-                            table.get('target_records_count') - int(table.get('number_of_records_written')))
-                        table['target_records_count'] = int(table.get('target_records_count'))
+                    pre_target_count = int(target_records_count - int(table.get('number_of_records_written')))
+                    target_records_count = int(target_records_count)
+                table.update({"job_type": "PIPELINE_BUILD", "source_name": '', "source_file_names": [],
+                              "source_schema_name": "", "source_database_name": "", "table_group_name": '',
+                              "iwx_table_name": '', 'target_schema_name': schema_name,
+                              'target_table_name': table_name, "entity_type": job.get("entity_type", "pipeline"),
+                              "starting_watermark_value": table.pop('first_merged_watermark', ''),
+                              "ending_watermark_value": table.pop('last_merged_watermark', ''),
+                              "job_status": table.get("job_status", ""), "cluster_id": job_cluster_id,
+                              "cluster_name": job_cluster_name, 'job_created_by': job_created_by,
+                              'pre_target_count': pre_target_count, 'target_records_count': target_records_count,
+                              'job_start_time': format_job_time(table.get('job_start_time')),
+                              'job_end_time': format_job_time(table.get('job_end_time')),
+                              'fetch_records_count': int(table['number_of_records_written'])})
                 od = OrderedDict()
-                table['job_start_time'] = table['job_start_time'].split('.')[0].replace('T', ' ')
-                table['job_end_time'] = table['job_end_time'].split('.')[0].replace('T', ' ')
-                table['fetch_records_count'] = int(table['number_of_records_written'])
                 for key in ['workflow_id', 'workflow_run_id', 'job_id', 'entity_type', 'job_type', 'job_start_time',
                             'job_end_time', 'job_created_by', 'cluster_id', 'cluster_name', 'job_status',
                             'source_name', 'source_file_names', 'source_schema_name', 'source_database_name',
@@ -798,9 +1096,11 @@ class JobMetricsClient(BaseClient):
                             'target_records_count']:
                     od[key] = table.get(key, "")
                 temp.append(od)
-            self.job_metrics_final.extend(temp)
+        return temp
 
-    def get_abc_job_metrics(self, time_range_for_jobs_in_mins=5, workflow_id=None, workflow_run_id=None):
+    def get_abc_job_metrics(self, time_range_for_jobs_in_mins=5, workflow_id=None, workflow_run_id=None,
+                            lookup_cache=None, state_file=None, callback=None,
+                            max_workers=local_configurations.ABC_METRICS_MAX_WORKERS, run_report=None):
         """
         Gets the Infoworks Job metrics
         :param time_range_for_jobs_in_mins: time range to look out for Infoworks jobs (default 5mins)
@@ -809,44 +1109,77 @@ class JobMetricsClient(BaseClient):
         :type workflow_id: String
         :param workflow_run_id: Workflow run id to get the jobs
         :type workflow_run_id: String
-        :return: response dict
+        :param lookup_cache: LookupCache for the metadata lookups of the run, pass one to read its counters afterwards
+        :type lookup_cache: LookupCache
+        :param state_file: path of a json file keeping the MetricsCheckpoint of the previous runs. If given, only the
+        jobs updated since the previous run are read (time_range_for_jobs_in_mins is used for the first run) and only
+        the rows that are new or changed are returned. Use one state file per workflow_id/workflow_run_id filter.
+        :type state_file: String
+        :param callback: function called with the rows of each job as soon as they are built, from the executor workers
+        (one call at a time). The rows are then not kept in memory.
+        :type callback: Function
+        :param max_workers: number of source and pipeline jobs processed concurrently
+        :type max_workers: Integer
+        :param run_report: MetricsRunReport recording the timing and errors of each job, pass one to read it afterwards
+        :type run_report: MetricsRunReport
+        :return: list of row dicts, or the number of rows passed to the callback if one is given
         """
+        if lookup_cache is None:
+            lookup_cache = LookupCache()
+        if run_report is None:
+            run_report = MetricsRunReport()
         try:
             sources_info = self.get_source_info()
             delay = int(time_range_for_jobs_in_mins)
             now = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=delay)
             date_string = now.strftime('%Y-%m-%dT%H:%M:%SZ')
+            checkpoint = MetricsCheckpoint(state_file) if state_file is not None else None
+            if checkpoint is not None:
+                date_string = checkpoint.get_window_start(date_string)
+            collector = MetricsCollector(job_link_prefix=self.get_job_link_prefix(), callback=callback,
+                                         checkpoint=checkpoint)
             source_jobs = self.get_all_source_jobs(date_string)
-            source_jobs_source_ids = list(set([i['entity_id'] for i in source_jobs]))
-            sources_info = [i for i in sources_info if i['id'] in source_jobs_source_ids]
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                executor.map(self.get_source_jobs_metrics_results_table_level,
-                             [date_string] * len(sources_info), sources_info,
-                             [workflow_id, workflow_run_id] * len(sources_info))
-                executor.shutdown(wait=True)
+            sources_by_id = {source["id"]: source for source in sources_info}
             pipeline_jobs_list = self.get_pipeline_jobs(date_string)
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                executor.map(self.get_pipeline_build_metrics_results, pipeline_jobs_list,
-                             [workflow_id, workflow_run_id] * len(pipeline_jobs_list))
-                executor.shutdown(wait=True)
-
-            result = []
-            header = ['workflow_id', 'workflow_run_id', 'job_id', 'entity_type', 'job_type', 'job_start_time',
-                      'job_end_time', 'job_created_by', 'cluster_id', 'cluster_name', 'job_status', 'job_table_status', 'source_name',
-                      'source_file_names', 'source_schema_name',
-                      'source_database_name', 'table_group_name', 'iwx_table_name', 'starting_watermark_value',
-                      'ending_watermark_value', 'target_schema_name', 'target_table_name', 'pre_target_count',
-                      'fetch_records_count', 'target_records_count', 'job_link']
-            ui_port = 443 if self.client_config["port"] == '443' else 3000
-            if len(self.job_metrics_final) > 0:
-                for item in self.job_metrics_final:
-                    dict_temp = {}
-                    for i in header:
-                        dict_temp[i] = item.get(i)
-                        if i == "job_link" and dict_temp.get("job_id", None) != None:
-                            dict_temp[
-                                i] = f"{self.client_config['protocol']}://{self.client_config['ip']}:{ui_port}/job/logs?jobId={dict_temp.get('job_id', '')}"
-                    result.append(copy.deepcopy(dict_temp))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+                for source_id, jobs in group_jobs_by_entity(source_jobs).items():
+                    source = sources_by_id.get(source_id)
+                    if source is None:
+                        continue
+                    for job in jobs:
+                        futures.append(executor.submit(
+                            self.run_metrics_task, "source_job", job, collector, run_report,
+                            functools.partial(self.get_source_job_metrics_rows, job, source, workflow_id,
+                                              workflow_run_id, lookup_cache)))
+                for job in pipeline_jobs_list:
+                    futures.append(executor.submit(
+                        self.run_metrics_task, "pipeline_job", job, collector, run_report,
+                        functools.partial(self.get_pipeline_build_metrics_rows, job, workflow_id,
+                                          workflow_run_id)))
+                for future in as_completed(futures):
+                    future.result()
+            run_report.ended_at = time.time()
+            self.logger.info(f"ABC metrics lookups: {lookup_cache.stats()}")
+            self.logger.info(f"ABC metrics tasks: {run_report.summary()}")
+            if run_report.errors:
+                self.logger.error(f"{len(run_report.errors)} ABC metrics tasks failed: "
+                                  f"{[(task['job_id'], task['error']) for task in run_report.errors]}")
+
+            if checkpoint is not None:
+                checkpoint.advance(source_jobs + pipeline_jobs_list,
+                                   failed_job_ids=[task["job_id"] for task in run_report.errors])
+                checkpoint.save()
+                self.logger.info(f"ABC metrics checkpoint moved to {checkpoint.high_water_mark}, "
+                                 f"{collector.count} new or changed rows")
+            # rows of the last get_abc_job_metrics call, empty if they were handed to a callback
+            self.job_metrics_final = collector.rows
+            if callback is not None:
+                return collector.count
+            result = collector.rows
+            if checkpoint is not None:
+                return result
+            if len(result) > 0:
                 return result
             else:
                 print("Job list empty!!!")
@@ -854,3 +1187,115 @@ class JobMetricsClient(BaseClient):
             print("Something went wrong")
             print(str(e))
             traceback.print_exc()
+
+    def write_abc_job_metrics(self, sink, time_range_for_jobs_in_mins=5, workflow_id=None, workflow_run_id=None,
+                              state_file=None):
+        """
+        Writes the Infoworks Job metrics to a sink as they are produced, instead of collecting them in memory
+        ```
+        from infoworks.sdk.metrics_sinks import ParquetMetricsSink
+        iwx_client.write_abc_job_metrics(ParquetMetricsSink("/tmp/abc_metrics", partition_by="job_start_time"))
+        ```
+        :param sink: CSVMetricsSink, NDJSONMetricsSink, ParquetMetricsSink or any MetricsSink. It is closed at the end
+        :type sink: MetricsSink
+        :param time_range_for_jobs_in_mins: time range to look out for Infoworks jobs (default 5mins)
+        :type time_range_for_jobs_in_mins: Integer
+        :param workflow_id: Workflow id to get the jobs
+        :type workflow_id: String
+        :param workflow_run_id: Workflow run id to get the jobs
+        :type workflow_run_id: String
+        :param state_file: path of the MetricsCheckpoint state file, to write only the new or changed rows
+        :type state_file: String
+        :return: number of rows written
+        """
+        with sink:
+            self.get_abc_job_metrics(time_range_for_jobs_in_mins=time_range_for_jobs_in_mins, workflow_id=workflow_id,
+                                     workflow_run_id=workflow_run_id, state_file=state_file, callback=sink.write)
+        return sink.rows_written
+
+    def stream_abc_job_metrics(self, callback, time_range_for_jobs_in_mins=5, workflow_id=None, workflow_run_id=None,
+                               poll_timeout=local_configurations.POLLING_TIMEOUT,
+                               polling_frequency=local_configurations.POLLING_FREQUENCY_IN_SEC, run_report=None):
+        """
+        Streams the Infoworks Job metrics for live dashboards. The rows of all the jobs of the time range are passed to
+        the callback first, as with get_abc_job_metrics(callback=...). The running and pending jobs are then watched by
+        a single JobWatcher, and their rows are built again and passed to the callback whenever their status,
+        percentage, cluster runs or metrics change, till they finish or poll_timeout is reached.
+        :param callback: function called with the rows of a job (list of dicts) each time they are emitted
+        :type callback: Function
+        :param time_range_for_jobs_in_mins: time range to look out for Infoworks jobs (default 5mins)
+        :type time_range_for_jobs_in_mins: Integer
+        :param workflow_id: Workflow id to get the jobs
+        :type workflow_id: String
+        :param workflow_run_id: Workflow run id to get the jobs
+        :type workflow_run_id: String
+        :param poll_timeout: seconds a running job is watched for. If -1 then it is watched till it finishes
+        :type poll_timeout: Integer
+        :param polling_frequency: longest interval between two polls of a job whose progress is unknown
+        :type polling_frequency: Integer
+        :param run_report: MetricsRunReport recording the timing and errors of the snapshot tasks and of the rows built
+        for the watched jobs, pass one to read it afterwards
+        :type run_report: MetricsRunReport
+        :return: number of rows passed to the callback
+        """
+        if run_report is None:
+            run_report = MetricsRunReport()
+        lookup_cache = LookupCache()
+        collector = MetricsCollector(job_link_prefix=self.get_job_link_prefix(), callback=callback)
+        open_jobs = set()
+
+        def on_snapshot_rows(rows):
+            open_jobs.update(row["job_id"] for row in rows if str(row.get("job_status")) in ["RUNNING", "PENDING"])
+            callback(rows)
+
+        snapshot_count = self.get_abc_job_metrics(time_range_for_jobs_in_mins=time_range_for_jobs_in_mins,
+                                                  workflow_id=workflow_id, workflow_run_id=workflow_run_id,
+                                                  lookup_cache=lookup_cache, callback=on_snapshot_rows,
+                                                  run_report=run_report) or 0
+        if not open_jobs:
+            return snapshot_count
+        sources_by_id = {source["id"]: source for source in self.get_source_info()}
+        fingerprints = {}
+        skipped_jobs = set()
+
+        def on_poll(job_id, response):
+            job = response.get("result") or {}
+            if not job.get("id"):
+                return
+            started_at = time.time()
+            task = "stream_pipeline_job" if job.get("entity_type") == "pipeline" else "stream_source_job"
+            try:
+                if job.get("entity_type") == "pipeline":
+                    rows = self.get_pipeline_build_metrics_rows(job, workflow_id, workflow_run_id)
+                elif job.get("entity_id") in sources_by_id:
+                    rows = self.get_source_job_metrics_rows(job, sources_by_id[job["entity_id"]], workflow_id,
+                                                            workflow_run_id, lookup_cache)
+                else:
+                    if job_id not in skipped_jobs:
+                        skipped_jobs.add(job_id)
+                        self.logger.error(f"Source {job.get('entity_id')} of job {job_id} not found, its metrics are "
+                                          f"not streamed")
+                        run_report.record(task, job.get("entity_id"), job_id, time.time() - started_at, 0,
+                                          error="source not found")
+                    return
+            except Exception as e:
+                self.logger.exception(f"Failed to get the ABC metrics of job {job_id}")
+                run_report.record(task, job.get("entity_id"), job_id, time.time() - started_at, 0, error=str(e))
+                return
+            run_report.record(task, job.get("entity_id"), job_id, time.time() - started_at, len(rows))
+            fingerprint = hashlib.sha1(json.dumps([job.get("status"), job.get("percentage"), rows], sort_keys=True,
+                                                  default=str).encode("utf-8")).hexdigest()
+            if fingerprints.get(job_id) != fingerprint:
+                fingerprints[job_id] = fingerprint
+                collector.add(rows)
+
+        watcher = JobWatcher(self, poll_timeout=poll_timeout, polling_frequency=polling_frequency, on_poll=on_poll)
+        for job_id in open_jobs:
+            watcher.watch(job_id)
+        for job_id, response in watcher.as_completed():
+            self.logger.info(f"Stopped streaming the metrics of job {job_id}")
+        run_report.ended_at = time.time()
+        if run_report.errors:
+            self.logger.error(f"{len(run_report.errors)} ABC metrics tasks failed: "
+                              f"{[(task['job_id'], task['error']) for task in run_report.errors]}")
+        return snapshot_count + collector.count
@@ -48,19 +48,8 @@ class JobsClient(BaseClient):
                 if job_id is not None:
                     job_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                         job_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(job_id=job_id, status=Response.Status.SUCCESS, response=response)
@@ -194,19 +183,8 @@ class JobsClient(BaseClient):
                 if run_id is not None:
                     job_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_get_cluster_job_details, response=response, pagination=pagination):
                         job_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(job_id=job_id, status=Response.Status.SUCCESS, response=response)
@@ -243,19 +221,8 @@ class JobsClient(BaseClient):
                     return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
                                                         error_desc=f"Failed to get the admin job details.",
                                                         response=response)
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                     job_details.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(job_id=None, status=Response.Status.SUCCESS, response=response)
@@ -263,6 +230,19 @@ class JobsClient(BaseClient):
             self.logger.error("Error in getting job details")
             raise JobsError("Error in getting job details" + str(e))
 
+    def iter_admin_jobs(self, params=None):
+        """
+        Function to iterate over the admin job details page by page without holding the whole list in memory
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of job dicts
+        """
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_jobs = url_builder.get_admin_jobs_url(
+            self.client_config) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_jobs, JobsError, "Error in getting job details")
+
     def get_all_jobs_for_source(self, source_id=None, params=None, pagination=True):
         """
         Function to get all jobs for a particular source
@@ -302,19 +282,8 @@ class JobsClient(BaseClient):
                                                         error_desc=f"Failed to get the source jobs details.",
                                                         response=response)
 
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                     job_details.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             response["message"] = initial_msg
             response["result"] = job_details
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -322,6 +291,24 @@ class JobsClient(BaseClient):
             self.logger.error("Error in getting job details")
             raise JobsError("Error in getting job details" + str(e))
 
+    def iter_jobs_for_source(self, source_id=None, params=None):
+        """
+        Function to iterate over all jobs of a particular source page by page without holding the whole list in memory
+        :param source_id: entity identifier for which the jobs are to be fetched
+        :type: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of job dicts
+        """
+        if None in {source_id}:
+            self.logger.error("source_id cannot be None")
+            raise Exception("source_id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_jobs = url_builder.get_source_details_url(self.client_config) + f"/{source_id}/jobs" + \
+                           IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_jobs, JobsError, "Error in getting job details")
+
     def get_source_job_summary_or_logs(self, job_id=None, source_id=None, type="summary", num_of_lines=1000):
         """
         Function to get job summary for given job_id
@@ -398,19 +385,8 @@ class JobsClient(BaseClient):
                 if job_id is not None:
                     job_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                         job_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -448,20 +424,8 @@ class JobsClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                     job_details.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -581,19 +545,8 @@ class JobsClient(BaseClient):
                 if job_id is not None:
                     job_details.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_jobs, response=response, pagination=pagination):
                         job_details.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = job_details
             response["message"] = initial_msg
             return GenericResponse.parse_result(job_id=job_id, status=Response.Status.SUCCESS, response=response)
@@ -1,11 +1,33 @@
 POLLING_FREQUENCY_IN_SEC = 15
 NUM_POLLING_RETRIES = 3
 POLLING_TIMEOUT = 1200
+POLLING_MIN_INTERVAL_IN_SEC = 2
+POLLING_MAX_INTERVAL_IN_SEC = 120
+POLLING_BACKOFF_FACTOR = 1.5
+POLLING_JITTER = 0.1
 NUM_FAILURE_RETRIES = 5
 RUNNING_JOB_LOGGING_COUNTER = 10
 REQUEST_TIMEOUT_IN_SEC = 60
 MAX_RETRIES = 1
+MAX_CONNECTIONS_PER_HOST = 10
+ASYNC_MAX_WORKERS = 32
+PAGINATION_PREFETCH_PAGES = 4
+JOB_WATCHER_BATCH_SIZE = 50
+RESPONSE_CACHE_TTL_IN_SEC = 300
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+ABC_CHECKPOINT_OVERLAP_IN_SEC = 60
+METRICS_SINK_BATCH_SIZE = 1000
+ABC_METRICS_MAX_WORKERS = 10
+ABC_JOBS_SUB_WINDOW_IN_MINS = 30
+ABC_JOBS_MAX_SUB_WINDOWS = 8
+CICD_EXPORT_MAX_WORKERS = 8
+CICD_LOOKUP_BATCH_SIZE = 100
+CICD_WATERMARK_MAX_WORKERS = 8
+JSON_STREAM_CHUNK_SIZE = 1024 * 1024
 LOG_LOCATION = "/tmp/iwx_sdk.log"
+TOKEN_REFRESH_LEEWAY_IN_SEC = 60
+# set to a file path (e.g. "/tmp/iwx_sdk_token_cache.json") to share bearer tokens across processes
+TOKEN_CACHE_LOCATION = None
 
 
 class Response(object):
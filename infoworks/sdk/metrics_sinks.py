@@ -0,0 +1,236 @@
+import abc
+import csv
+import json
+import math
+import os
+import threading
+import uuid
+
+from infoworks.sdk import local_configurations
+
+try:
+    # optional, needed by ParquetMetricsSink only
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+STRING = "string"
+INTEGER = "int64"
+STRING_LIST = "list<string>"
+
+# explicit types of the ABC metrics columns (same order as jobmetrics.ABC_METRICS_COLUMNS)
+ABC_METRICS_SCHEMA = [
+    ("workflow_id", STRING), ("workflow_run_id", STRING), ("job_id", STRING), ("entity_type", STRING),
+    ("job_type", STRING), ("job_start_time", STRING), ("job_end_time", STRING), ("job_created_by", STRING),
+    ("cluster_id", STRING), ("cluster_name", STRING), ("job_status", STRING), ("job_table_status", STRING),
+    ("source_name", STRING), ("source_file_names", STRING_LIST), ("source_schema_name", STRING),
+    ("source_database_name", STRING), ("table_group_name", STRING), ("iwx_table_name", STRING),
+    ("starting_watermark_value", STRING), ("ending_watermark_value", STRING), ("target_schema_name", STRING),
+    ("target_table_name", STRING), ("pre_target_count", INTEGER), ("fetch_records_count", INTEGER),
+    ("target_records_count", INTEGER), ("job_link", STRING)]
+
+
+def coerce_value(value, column_type):
+    """
+    :return: the value converted to the column type, None for missing values ("", None, NaN)
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if column_type == INTEGER:
+        if value == "":
+            return None
+        try:
+            # int first, float would lose the precision of the counts above 2**53
+            return int(value)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return int(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return None
+    if column_type == STRING_LIST:
+        if isinstance(value, (list, tuple)):
+            return [coerce_list_item(item) for item in value]
+        return [coerce_list_item(value)]
+    return str(value)
+
+
+def coerce_list_item(item):
+    # the source file paths are records (dicts) of the sourceFilesPath report, kept whole as json
+    if isinstance(item, (dict, list, tuple)):
+        return json.dumps(item, sort_keys=True, default=str)
+    return str(item)
+
+
+def coerce_row(row, schema=ABC_METRICS_SCHEMA):
+    return {column: coerce_value(row.get(column), column_type) for column, column_type in schema}
+
+
+class MetricsSink(abc.ABC):
+    """
+    Writes the ABC metrics rows in batches as they are produced, e.g.
+    `iwx_client.write_abc_job_metrics(CSVMetricsSink("/tmp/abc_metrics.csv"))`.
+    Rows are converted to the explicit ABC_METRICS_SCHEMA types before they are written.
+    With partition_by (a date column such as job_start_time) the rows are written under
+    path/<partition_by>_date=YYYY-MM-DD/part-<id>.<extension>, else to the file path.
+    """
+    extension = ""
+
+    def __init__(self, path, partition_by=None, batch_size=local_configurations.METRICS_SINK_BATCH_SIZE,
+                 schema=ABC_METRICS_SCHEMA):
+        """
+        :param path: file written to, or directory of the partitions if partition_by is given
+        :type path: String
+        :param partition_by: date column ('job_start_time' or 'job_end_time') the rows are partitioned on
+        :type partition_by: String
+        :param batch_size: number of rows buffered per file before they are written
+        :type batch_size: Integer
+        :param schema: list of (column, type) written
+        :type schema: List
+        """
+        self.path = os.path.expanduser(path)
+        self.partition_by = partition_by
+        self.batch_size = batch_size
+        self.schema = schema
+        self.columns = [column for column, column_type in schema]
+        self.rows_written = 0
+        self._part_id = uuid.uuid4().hex[:12]
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def get_file_path(self, row):
+        if self.partition_by is None:
+            return self.path
+        partition = (row.get(self.partition_by) or "")[:10] or "unknown"
+        return os.path.join(self.path, f"{self.partition_by}_date={partition}", f"part-{self._part_id}{self.extension}")
+
+    def write(self, rows):
+        """
+        :param rows: list of metrics row dicts
+        :type rows: List
+        """
+        with self._lock:
+            for row in rows:
+                record = coerce_row(row, self.schema)
+                file_path = self.get_file_path(record)
+                buffer = self._buffers.setdefault(file_path, [])
+                buffer.append(record)
+                if len(buffer) >= self.batch_size:
+                    self._flush(file_path)
+
+    def flush(self):
+        with self._lock:
+            for file_path in list(self._buffers):
+                self._flush(file_path)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self.close_files()
+
+    def _flush(self, file_path):
+        records = self._buffers.pop(file_path, [])
+        if records:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.write_batch(file_path, records)
+            self.rows_written = self.rows_written + len(records)
+
+    @abc.abstractmethod
+    def write_batch(self, file_path, records):
+        """
+        writes the coerced records to file_path, opening the file on its first batch
+        """
+
+    def close_files(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CSVMetricsSink(MetricsSink):
+    """
+    MetricsSink writing CSV files with a header line. source_file_names is written as a json list.
+    """
+    extension = ".csv"
+
+    def __init__(self, path, partition_by=None, batch_size=local_configurations.METRICS_SINK_BATCH_SIZE,
+                 schema=ABC_METRICS_SCHEMA):
+        super(CSVMetricsSink, self).__init__(path, partition_by=partition_by, batch_size=batch_size, schema=schema)
+        self._files = {}
+
+    def write_batch(self, file_path, records):
+        if file_path not in self._files:
+            csv_file = open(file_path, "w", newline="")
+            writer = csv.DictWriter(csv_file, fieldnames=self.columns)
+            writer.writeheader()
+            self._files[file_path] = (csv_file, writer)
+        csv_file, writer = self._files[file_path]
+        list_columns = [column for column, column_type in self.schema if column_type == STRING_LIST]
+        for record in records:
+            for column in list_columns:
+                if record[column] is not None:
+                    record[column] = json.dumps(record[column])
+        writer.writerows(records)
+        csv_file.flush()
+
+    def close_files(self):
+        for csv_file, writer in self._files.values():
+            csv_file.close()
+        self._files = {}
+
+
+class NDJSONMetricsSink(MetricsSink):
+    """
+    MetricsSink writing newline delimited json, one row object per line.
+    """
+    extension = ".ndjson"
+
+    def __init__(self, path, partition_by=None, batch_size=local_configurations.METRICS_SINK_BATCH_SIZE,
+                 schema=ABC_METRICS_SCHEMA):
+        super(NDJSONMetricsSink, self).__init__(path, partition_by=partition_by, batch_size=batch_size, schema=schema)
+        self._files = {}
+
+    def write_batch(self, file_path, records):
+        if file_path not in self._files:
+            self._files[file_path] = open(file_path, "w")
+        json_file = self._files[file_path]
+        json_file.write("".join(json.dumps(record) + "\n" for record in records))
+        json_file.flush()
+
+    def close_files(self):
+        for json_file in self._files.values():
+            json_file.close()
+        self._files = {}
+
+
+class ParquetMetricsSink(MetricsSink):
+    """
+    MetricsSink writing Parquet files, one row group per batch. Needs pyarrow (pip install infoworkssdk[parquet]).
+    """
+    extension = ".parquet"
+
+    def __init__(self, path, partition_by=None, batch_size=local_configurations.METRICS_SINK_BATCH_SIZE,
+                 schema=ABC_METRICS_SCHEMA):
+        if pyarrow is None:
+            raise ImportError("pyarrow is needed to write the metrics as Parquet: pip install pyarrow")
+        super(ParquetMetricsSink, self).__init__(path, partition_by=partition_by, batch_size=batch_size, schema=schema)
+        arrow_types = {STRING: pyarrow.string(), INTEGER: pyarrow.int64(), STRING_LIST: pyarrow.list_(pyarrow.string())}
+        self.arrow_schema = pyarrow.schema([(column, arrow_types[column_type]) for column, column_type in schema])
+        self._writers = {}
+
+    def write_batch(self, file_path, records):
+        if file_path not in self._writers:
+            self._writers[file_path] = pyarrow.parquet.ParquetWriter(file_path, self.arrow_schema)
+        self._writers[file_path].write_table(pyarrow.Table.from_pylist(records, schema=self.arrow_schema))
+
+    def close_files(self):
+        for writer in self._writers.values():
+            writer.close()
+        self._writers = {}
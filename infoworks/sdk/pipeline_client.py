@@ -1,11 +1,11 @@
 import base64
-import time
 
-from infoworks.error import PipelineError
+from infoworks.error import PipelineError, PaginationError
 from infoworks.sdk import url_builder, local_configurations
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.generic_response import GenericResponse
 from infoworks.sdk.local_configurations import Response, ErrorCode
+from infoworks.sdk.polling import Poller
 from infoworks.sdk.pipeline_response import PipelineResponse
 from infoworks.sdk.utils import IWUtils
 
@@ -33,14 +33,10 @@ class PipelineClient(BaseClient):
         """
         failed_count = 0
         response = {}
-        if poll_timeout != -1:
-            timeout = time.time() + poll_timeout
-        else:
-            # 2,592,000 is 30 days assuming it to be max time a job can run
-            timeout = time.time() + 2592000
-        while True:
-            if time.time() > timeout:
-                break
+        poller = Poller(poll_timeout=poll_timeout, polling_frequency=polling_frequency)
+        while not poller.expired():
+            percentage = None
+            failed = False
             try:
                 self.logger.info(f"Failed poll job status count: {failed_count}")
                 job_monitor_url = url_builder.get_job_status_url(self.client_config, job_id)
@@ -50,7 +46,8 @@ class PipelineClient(BaseClient):
                 result = response.get('result', {})
                 if len(result) != 0:
                     job_status = result["status"]
-                    print(f"pipeline_status : {job_status}.Sleeping for {polling_frequency} seconds")
+                    percentage = result.get("percentage")
+                    print(f"pipeline_status : {job_status}")
                     self.logger.info(
                         "Job poll status : " + result["status"] + "Job completion percentage: " + str(result.get(
                             "percentage", 0)))
@@ -68,6 +65,7 @@ class PipelineClient(BaseClient):
                                                              response=response, job_id=job_id,
                                                              pipeline_id=pipeline_id)
                     failed_count = failed_count + 1
+                    failed = True
             except Exception as e:
                 self.logger.exception("Error occurred during job status poll")
                 self.logger.info(str(e))
@@ -76,7 +74,13 @@ class PipelineClient(BaseClient):
                     print(response)
                     raise PipelineError(response.get("message", "Error occurred during job status poll"))
                 failed_count = failed_count + 1
-            time.sleep(polling_frequency)
+                failed = True
+            poller.sleep(percentage, failed=failed)
+
+        return PipelineResponse.parse_result(status=Response.Status.FAILED,
+                                             error_code=ErrorCode.POLL_TIMEOUT,
+                                             error_desc="Job status poll timeout occurred", response=response,
+                                             job_id=job_id, pipeline_id=pipeline_id)
 
     def list_pipelines(self, domain_id=None, params=None, pagination=True):
         """
@@ -104,35 +108,38 @@ class PipelineClient(BaseClient):
                 self.call_api("GET", url_to_list_pipelines,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipelines, response=response, pagination=pagination):
                     pipelines_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return PipelineResponse.parse_result(status=Response.Status.FAILED,
-                                                             error_code=ErrorCode.GENERIC_ERROR,
-                                                             error_desc="Error in listing pipelines",
-                                                             response=response
-                                                             )
 
                 response["result"] = pipelines_list
                 response["message"] = initial_msg
             return PipelineResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return PipelineResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing pipelines", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing pipelines")
             raise PipelineError("Error in listing pipelines" + str(e))
 
+    def iter_pipelines(self, domain_id=None, params=None):
+        """
+        Function to iterate over the pipelines of a domain page by page without holding the whole list in memory
+        :param domain_id: Entity identified for domain
+        :type domain_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of pipeline dicts
+        """
+        if None in {domain_id}:
+            self.logger.error("Domain ID cannot be None")
+            raise Exception("Domain ID cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_pipelines = url_builder.list_pipelines_url(self.client_config, domain_id) \
+                                + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_pipelines, PipelineError, "Error in listing pipelines")
+
     def create_pipeline(self, pipeline_config=None):
         """
         Create a new Pipeline.
@@ -858,31 +865,16 @@ class PipelineClient(BaseClient):
                 self.call_api("GET", url_to_list_pipeline_versions,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipeline_versions, response=response, pagination=pagination):
                     pipelines_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return PipelineResponse.parse_result(status=Response.Status.FAILED,
-                                                             error_code=ErrorCode.GENERIC_ERROR,
-                                                             error_desc="Error in listing pipeline version",
-                                                             response=response
-                                                             )
 
                 response["result"] = pipelines_list
                 response["message"] = initial_msg
             return PipelineResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return PipelineResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing pipeline version", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing pipeline version")
             raise PipelineError("Error in listing pipeline version" + str(e))
@@ -1,10 +1,9 @@
-import time
-
-from infoworks.error import PipelineError
+from infoworks.error import PipelineError, PaginationError
 from infoworks.sdk import url_builder, local_configurations
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.generic_response import GenericResponse
 from infoworks.sdk.local_configurations import Response, ErrorCode
+from infoworks.sdk.polling import Poller
 from infoworks.sdk.utils import IWUtils
 
 
@@ -32,14 +31,10 @@ class PipelineGroupClient(BaseClient):
         """
         failed_count = 0
         response = {}
-        if poll_timeout != -1:
-            timeout = time.time() + poll_timeout
-        else:
-            # 2,592,000 is 30 days assuming it to be max time a job can run
-            timeout = time.time() + 2592000
-        while True:
-            if time.time() > timeout:
-                break
+        poller = Poller(poll_timeout=poll_timeout, polling_frequency=polling_frequency)
+        while not poller.expired():
+            percentage = None
+            failed = False
             try:
                 self.logger.info(f"Failed poll job status count: {failed_count}")
                 job_monitor_url = url_builder.get_job_status_url(self.client_config, job_id)
@@ -49,7 +44,8 @@ class PipelineGroupClient(BaseClient):
                 result = response.get('result', {})
                 if len(result) != 0:
                     job_status = result["status"]
-                    print(f"pipeline_group_status : {job_status}.Sleeping for {polling_frequency} seconds")
+                    percentage = result.get("percentage")
+                    print(f"pipeline_group_status : {job_status}")
                     self.logger.info(
                         "Job poll status : " + result["status"] + "Job completion percentage: " + str(result.get(
                             "percentage", 0)))
@@ -65,6 +61,7 @@ class PipelineGroupClient(BaseClient):
                                                             response=response, job_id=job_id,
                                                             entity_id=pipeline_group_id)
                     failed_count = failed_count + 1
+                    failed = True
             except Exception as e:
                 self.logger.exception("Error occurred during job status poll")
                 self.logger.info(str(e))
@@ -73,7 +70,13 @@ class PipelineGroupClient(BaseClient):
                     print(response)
                     raise PipelineError(response.get("message", "Error occurred during job status poll"))
                 failed_count = failed_count + 1
-            time.sleep(polling_frequency)
+                failed = True
+            poller.sleep(percentage, failed=failed)
+
+        return GenericResponse.parse_result(status=Response.Status.FAILED,
+                                            error_code=ErrorCode.POLL_TIMEOUT,
+                                            error_desc="Job status poll timeout occurred", response=response,
+                                            job_id=job_id, entity_id=pipeline_group_id)
 
     def list_jobs_under_pipeline_group(self, domain_id, pipeline_group_id, params=None,pagination=True):
         """
@@ -101,31 +104,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_list_pipeline_grp_jobs,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipeline_grp_jobs, response=response, pagination=pagination):
                     pipeline_groups_jobs_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing pipeline group jobs",
-                                                            response=response
-                                                            )
 
                 response["result"] = pipeline_groups_jobs_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing pipeline group jobs", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing pipeline group jobs")
             raise PipelineError("Error in listing pipeline group jobs" + str(e))
@@ -230,31 +218,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_list_pipeline_grp_jobs,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipeline_grp_jobs, response=response, pagination=pagination):
                     pipelines_in_pipeline_groups_jobs_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing pipeline jobs in pipeline group job",
-                                                            response=response
-                                                            )
 
                 response["result"] = pipelines_in_pipeline_groups_jobs_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing pipeline jobs in pipeline group job", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing pipeline jobs in pipeline group job")
             raise PipelineError("Error in listing pipeline jobs in pipeline group job" + str(e))
@@ -285,31 +258,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_list_pipeline_grp_job_runs,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipeline_grp_job_runs, response=response, pagination=pagination):
                     cluster_jobs_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing cluster jobs in pipeline group job",
-                                                            response=response
-                                                            )
 
                 response["result"] = cluster_jobs_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing cluster jobs in pipeline group job", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing cluster jobs in pipeline group job")
             raise PipelineError("Error in listing cluster jobs in pipeline group job" + str(e))
@@ -437,31 +395,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_list_pipeline_grp,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_pipeline_grp, response=response, pagination=pagination):
                     pipeline_groups_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing pipeline groups",
-                                                            response=response
-                                                            )
 
                 response["result"] = pipeline_groups_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing pipeline groups", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing pipeline groups")
             raise PipelineError("Error in listing pipeline groups" + str(e))
@@ -624,31 +567,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_get_accessible_pl_grp,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_accessible_pl_grp, response=response, pagination=pagination):
                     pipeline_groups_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing accessible pipeline groups",
-                                                            response=response
-                                                            )
 
                 response["result"] = pipeline_groups_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing accessible pipeline groups", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing accessible pipeline groups")
             raise PipelineError("Error in listing accessible pipeline groups" + str(e))
@@ -680,31 +608,16 @@ class PipelineGroupClient(BaseClient):
                 self.call_api("GET", url_to_get_adv_config_pl_grp,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_adv_config_pl_grp, response=response, pagination=pagination):
                     adv_config_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return GenericResponse.parse_result(status=Response.Status.FAILED,
-                                                            error_code=ErrorCode.GENERIC_ERROR,
-                                                            error_desc="Error in listing adv config of pipeline groups",
-                                                            response=response
-                                                            )
 
                 response["result"] = adv_config_list
                 response["message"] = initial_msg
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing adv config of pipeline groups", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing adv config of pipeline groups")
             raise PipelineError("Error in listing adv config of pipeline groups" + str(e))
@@ -0,0 +1,131 @@
+import random
+import time
+
+from infoworks.sdk import local_configurations
+
+# 2,592,000 is 30 days assuming it to be max time a job can run
+MAX_JOB_RUN_TIME_IN_SEC = 2592000
+
+
+class Poller(object):
+    """
+    Decides how long to wait between two status polls of a job.
+    The wait starts at min_interval and grows exponentially up to polling_frequency, so that short jobs are noticed
+    within seconds. Once the job reports its completion percentage, the wait follows the estimated time left instead
+    (which lets long running jobs be polled less often, up to max_interval). Every wait is jittered so that many
+    pollers started together do not hit the api at the same time, and no wait goes past the poll_timeout deadline.
+
+    A poll that failed to read the status waits polling_frequency before it is retried.
+
+    ```
+    poller = Poller(poll_timeout=1200, polling_frequency=15)
+    while not poller.expired():
+        status, percentage = get_job_status()
+        if status in ["completed", "failed"]:
+            break
+        poller.sleep(percentage, failed=status is None)
+    ```
+    """
+
+    def __init__(self, poll_timeout=local_configurations.POLLING_TIMEOUT,
+                 polling_frequency=local_configurations.POLLING_FREQUENCY_IN_SEC,
+                 min_interval=local_configurations.POLLING_MIN_INTERVAL_IN_SEC,
+                 max_interval=local_configurations.POLLING_MAX_INTERVAL_IN_SEC,
+                 backoff_factor=local_configurations.POLLING_BACKOFF_FACTOR,
+                 jitter=local_configurations.POLLING_JITTER):
+        """
+        :param poll_timeout: seconds after which the polling gives up. If -1 then polling is done till the job completes
+        :type poll_timeout: Integer
+        :param polling_frequency: longest wait between two polls while the progress of the job is unknown
+        :type polling_frequency: Integer
+        :param min_interval: wait before the first poll
+        :type min_interval: Integer
+        :param max_interval: longest wait between two polls of a job whose progress is known
+        :type max_interval: Integer
+        :param backoff_factor: factor by which the wait grows after every poll
+        :type backoff_factor: Float
+        :param jitter: fraction of the wait that is randomised (0.1 means +/- 10%)
+        :type jitter: Float
+        """
+        self.started_at = time.time()
+        if poll_timeout is None or poll_timeout == -1:
+            poll_timeout = MAX_JOB_RUN_TIME_IN_SEC
+        self.deadline = self.started_at + poll_timeout
+        self.polling_frequency = max(polling_frequency, 0)
+        self.min_interval = min(min_interval, self.polling_frequency)
+        self.max_interval = max(max_interval, self.polling_frequency)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.interval = self.min_interval
+        self.polls = 0
+        self._first_progress = None
+
+    def expired(self):
+        """
+        :return: True once the poll_timeout deadline has passed
+        """
+        return time.time() >= self.deadline
+
+    def remaining(self):
+        """
+        :return: seconds left till the poll_timeout deadline
+        """
+        return max(self.deadline - time.time(), 0)
+
+    def estimated_time_left(self, percentage=None):
+        """
+        estimates the seconds left for the job from the rate at which its completion percentage has moved so far
+        :param percentage: completion percentage reported by the last poll
+        :type percentage: Float
+        :return: seconds left or None if it can not be estimated yet
+        """
+        try:
+            percentage = float(percentage)
+        except (TypeError, ValueError):
+            return None
+        now = time.time()
+        if self._first_progress is None or percentage < self._first_progress[1]:
+            self._first_progress = (now, percentage)
+            return None
+        first_seen_at, first_percentage = self._first_progress
+        if percentage <= first_percentage or now <= first_seen_at:
+            return None
+        rate = (percentage - first_percentage) / (now - first_seen_at)
+        return max(100 - percentage, 0) / rate
+
+    def next_interval(self, percentage=None, failed=False):
+        """
+        :param percentage: completion percentage reported by the last poll, if any
+        :type percentage: Float
+        :param failed: True if the last poll could not read the status of the job
+        :type failed: Boolean
+        :return: seconds to wait before the next poll
+        """
+        eta = None if failed else self.estimated_time_left(percentage)
+        if failed:
+            # a failed read is retried after polling_frequency, as before, so that the few retries of the callers
+            # are not spent within seconds, and does not move the backoff
+            interval = self.polling_frequency
+        elif eta is None:
+            interval = self.interval
+            self.interval = min(self.interval * self.backoff_factor, self.polling_frequency)
+        else:
+            # poll about twice in the time the job is expected to still take
+            interval = min(max(eta / 2, self.min_interval), self.max_interval)
+        if self.jitter:
+            interval = interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.polls = self.polls + 1
+        return min(interval, self.remaining())
+
+    def sleep(self, percentage=None, failed=False):
+        """
+        waits till the next poll is due
+        :param percentage: completion percentage reported by the last poll, if any
+        :type percentage: Float
+        :param failed: True if the last poll could not read the status of the job
+        :type failed: Boolean
+        :return: seconds slept
+        """
+        interval = self.next_interval(percentage, failed=failed)
+        time.sleep(interval)
+        return interval
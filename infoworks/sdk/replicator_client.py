@@ -1,5 +1,4 @@
 import json
-import time
 import traceback
 
 from infoworks.error import GenericError
@@ -7,6 +6,7 @@ from infoworks.sdk import url_builder, local_configurations
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.generic_response import GenericResponse
 from infoworks.sdk.local_configurations import Response, ErrorCode
+from infoworks.sdk.polling import Poller
 from infoworks.sdk.source_response import SourceResponse
 from infoworks.sdk.utils import IWUtils
 
@@ -36,20 +36,8 @@ class ReplicatorClient(BaseClient):
             # print(json.dumps(response))
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {})
-                records = result.get("records", [])
-                while len(records) > 0:
+                for records in self.iter_pages(url_to_list_replicator_sources, response=response, items_key="records"):
                     replicator_source_list.extend(records)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {})
-                    records = result.get("records", [])
             else:
                 self.logger.error("Failed to get list of replicator sources")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -247,20 +235,8 @@ class ReplicatorClient(BaseClient):
 
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {})
-                records = result.get("records", [])
-                while len(records) > 0:
+                for records in self.iter_pages(url_to_list_replicator_destinations, response=response, items_key="records"):
                     replicator_destinations_list.extend(records)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {})
-                    records = result.get("records", [])
             else:
                 self.logger.error("Failed to get list of replicator destinations")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -457,20 +433,8 @@ class ReplicatorClient(BaseClient):
 
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {})
-                records = result.get("records", [])
-                while len(records) > 0:
+                for records in self.iter_pages(url_to_list_replicator_definitions, response=response, items_key="records"):
                     replicator_definitions_list.extend(records)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {})
-                    records = result.get("records", [])
             else:
                 self.logger.error("Failed to get list of replicator definitions")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -756,15 +720,10 @@ class ReplicatorClient(BaseClient):
         """
         failed_count = 0
         response = {}
-        if poll_timeout != -1:
-            timeout = time.time() + poll_timeout
-        else:
-            # 2,592,000 is 30 days assuming it to be max time a job can run
-            timeout = time.time() + 2592000
-
-        while True:
-            if time.time() > timeout:
-                break
+        poller = Poller(poll_timeout=poll_timeout, polling_frequency=polling_frequency)
+        while not poller.expired():
+            percentage = None
+            failed = False
             try:
                 self.logger.info(f"Failed poll job status count: {failed_count}")
                 job_monitor_url = url_builder.get_job_status_url(self.client_config, job_id)
@@ -774,10 +733,11 @@ class ReplicatorClient(BaseClient):
                 result = response.get('result', {})
                 if len(result) != 0:
                     job_status = result["status"]
-                    # print(f"replicator_job_status : {job_status}.Sleeping for {polling_frequency} seconds")
+                    percentage = result.get("percentage")
+                    # print(f"replicator_job_status : {job_status}")
                     self.logger.info(
                         f"Job poll status : {result['status']}  - Job completion percentage: "
-                        f"{result.get('percentage', 0)} - Sleeping for {polling_frequency} seconds")
+                        f"{result.get('percentage', 0)}")
                     if job_status.lower() in ["completed", "failed", "aborted", "canceled"]:
                         return GenericResponse.parse_result(status=Response.Status.SUCCESS,
                                                             job_id=job_id, response=response)
@@ -790,6 +750,7 @@ class ReplicatorClient(BaseClient):
                                                             response=response, job_id=job_id,
                                                             )
                     failed_count = failed_count + 1
+                    failed = True
             except Exception as e:
                 self.logger.exception("Error occurred during job status poll")
                 self.logger.info(str(e))
@@ -798,7 +759,8 @@ class ReplicatorClient(BaseClient):
                     print(response)
                     raise GenericError(response.get("message", "Error occurred during job status poll"))
                 failed_count = failed_count + 1
-            time.sleep(polling_frequency)
+                failed = True
+            poller.sleep(percentage, failed=failed)
 
         return GenericResponse.parse_result(status=Response.Status.FAILED,
                                             error_code=ErrorCode.POLL_TIMEOUT,
@@ -940,17 +902,8 @@ class ReplicatorClient(BaseClient):
                                                         error_desc=f"Failed to get the source jobs details.",
                                                         response=response)
 
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_jobs, response=response):
                     job_details.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             response["message"] = initial_msg
             response["result"] = job_details
             return GenericResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -1115,20 +1068,8 @@ class ReplicatorClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {})
-                records = result.get("records", [])
-                while len(records) > 0:
+                for records in self.iter_pages(url_to_list_replication_schedules, response=response, items_key="records"):
                     replication_schedules_list.extend(records)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {})
-                    records = result.get("records", [])
             else:
                 self.logger.error("Failed to get list of replication schedules")
                 return GenericResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -0,0 +1,158 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from infoworks.sdk import local_configurations
+
+
+def get_resource_path(url):
+    """
+    :return: path of the url without the query string and the trailing slash
+    """
+    return urlsplit(url).path.rstrip("/")
+
+
+def is_related_resource(cached_path, written_path):
+    """
+    tells whether a write to written_path can change the response cached for cached_path,
+    i.e. one of them is the other or nested under it (e.g. /v3/sources, /v3/sources/{id} and /v3/sources/{id}/tables)
+    """
+    return (cached_path + "/").startswith(written_path + "/") or (written_path + "/").startswith(cached_path + "/")
+
+
+def build_response(url, status_code, headers, content):
+    response = requests.models.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = "utf-8"
+    return response
+
+
+class ResponseCache(object):
+    """
+    In memory LRU cache of GET responses with a time to live.
+    Set it on a client with client.set_response_cache(ResponseCache()); it is used by the calls made with use_cache=True
+    (e.g. the name to id lookups) and entries are dropped when the client writes to the same resource.
+    """
+
+    def __init__(self, ttl=local_configurations.RESPONSE_CACHE_TTL_IN_SEC,
+                 max_entries=local_configurations.RESPONSE_CACHE_MAX_ENTRIES):
+        """
+        :param ttl: seconds for which a response is served from the cache
+        :type ttl: Integer
+        :param max_entries: maximum number of responses kept, the least recently used are dropped first
+        :type max_entries: Integer
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """
+        :return: cached requests Response for the url or None
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[url]
+                entry = None
+            if entry is None:
+                self.misses = self.misses + 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits = self.hits + 1
+        expires_at, status_code, headers, content = entry
+        return build_response(url, status_code, headers, content)
+
+    def set(self, url, response):
+        """
+        caches the requests Response of the url
+        """
+        with self._lock:
+            self._entries[url] = (time.time() + self.ttl, response.status_code, dict(response.headers),
+                                  response.content)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url):
+        """
+        drops the cached responses of the resource of the url, of its parents and of the resources nested under it
+        """
+        written_path = get_resource_path(url)
+        with self._lock:
+            for cached_url in [cached_url for cached_url in self._entries
+                               if is_related_resource(get_resource_path(cached_url), written_path)]:
+                del self._entries[cached_url]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    ResponseCache persisted in a SQLite database file, so lookups are reused across runs and processes.
+    """
+
+    def __init__(self, path, ttl=local_configurations.RESPONSE_CACHE_TTL_IN_SEC,
+                 max_entries=local_configurations.RESPONSE_CACHE_MAX_ENTRIES):
+        """
+        :param path: path of the SQLite database file
+        :type path: String
+        :param ttl: seconds for which a response is served from the cache
+        :type ttl: Integer
+        :param max_entries: maximum number of responses kept, the least recently used are dropped first
+        :type max_entries: Integer
+        """
+        super(SQLiteResponseCache, self).__init__(ttl=ttl, max_entries=max_entries)
+        self.path = os.path.expanduser(path)
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, path TEXT, "
+                                 "expires_at REAL, used_at REAL, status_code INTEGER, headers TEXT, content BLOB)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+
+    def get(self, url):
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT status_code, headers, content FROM responses "
+                                           "WHERE url = ? AND expires_at > ?", (url, now)).fetchone()
+            if row is None:
+                self.misses = self.misses + 1
+                return None
+            self._connection.execute("UPDATE responses SET used_at = ? WHERE url = ?", (now, url))
+            self.hits = self.hits + 1
+        status_code, headers, content = row
+        return build_response(url, status_code, json.loads(headers), bytes(content))
+
+    def set(self, url, response):
+        now = time.time()
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                     (url, get_resource_path(url), now + self.ttl, now, response.status_code,
+                                      json.dumps(dict(response.headers)), sqlite3.Binary(response.content)))
+            self._connection.execute("DELETE FROM responses WHERE expires_at <= ? OR url IN (SELECT url FROM responses "
+                                     "ORDER BY used_at DESC LIMIT -1 OFFSET ?)", (now, self.max_entries))
+
+    def invalidate(self, url):
+        written_path = get_resource_path(url)
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE path = ? OR substr(path, 1, ?) = ? "
+                                     "OR substr(?, 1, length(path) + 1) = path || '/'",
+                                     (written_path, len(written_path) + 1, written_path + "/", written_path))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
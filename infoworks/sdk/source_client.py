@@ -1,13 +1,13 @@
 import json
-import time
 import traceback
 import urllib
 
-from infoworks.error import SourceError
+from infoworks.error import SourceError, PaginationError
 from infoworks.sdk import url_builder, local_configurations
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.generic_response import GenericResponse
 from infoworks.sdk.local_configurations import Response, ErrorCode, SourceMappings
+from infoworks.sdk.polling import Poller
 from infoworks.sdk.source_response import SourceResponse
 from infoworks.sdk.utils import IWUtils
 
@@ -39,14 +39,10 @@ class SourceClient(BaseClient):
             raise Exception("source id cannot be None")
         failed_count = 0
         response = {}
-        if poll_timeout != -1:
-            timeout = time.time() + poll_timeout
-        else:
-            # 2,592,000 is 30 days assuming it to be max time a job can run
-            timeout = time.time() + 2592000
-        while True:
-            if time.time() > timeout:
-                break
+        poller = Poller(poll_timeout=poll_timeout, polling_frequency=polling_frequency)
+        while not poller.expired():
+            percentage = None
+            failed = False
             try:
                 self.logger.info(f"Failed poll job status count: {failed_count}")
                 job_monitor_url = url_builder.get_job_status_url(self.client_config, job_id)
@@ -56,8 +52,9 @@ class SourceClient(BaseClient):
                 result = response.get('result', {})
                 if len(result) != 0:
                     job_status = result["status"]
+                    percentage = result.get("percentage")
                     job_type = result.get("type", "source_job")
-                    print(f"{job_type}_status : {job_status}.Sleeping for {polling_frequency} seconds")
+                    print(f"{job_type}_status : {job_status}")
                     self.logger.info(
                         "Job poll status : " + result["status"] + "Job completion percentage: " + str(result.get(
                             "percentage", 0)))
@@ -73,6 +70,7 @@ class SourceClient(BaseClient):
                                                            response=response, job_id=job_id,
                                                            source_id=source_id)
                     failed_count = failed_count + 1
+                    failed = True
             except Exception as e:
                 self.logger.exception("Error occurred during job status poll")
                 self.logger.info(str(e))
@@ -81,7 +79,8 @@ class SourceClient(BaseClient):
                     print(response)
                     raise SourceError(response.get("message", "Error occurred during job status poll"))
                 failed_count = failed_count + 1
-            time.sleep(polling_frequency)
+                failed = True
+            poller.sleep(percentage, failed=failed)
 
         return SourceResponse.parse_result(status=Response.Status.FAILED,
                                            error_code=ErrorCode.POLL_TIMEOUT,
@@ -345,10 +344,10 @@ class SourceClient(BaseClient):
                 return SourceResponse.parse_result(status=Response.Status.SUCCESS)
             job_status = "running"
             failed_count = 0
-            timeout = time.time() + poll_timeout
-            while True:
-                if time.time() > timeout:
-                    break
+            poller = Poller(poll_timeout=poll_timeout, polling_frequency=polling_frequency)
+            while not poller.expired():
+                percentage = None
+                failed = False
                 try:
                     self.logger.info(f"Failed poll job status count: {failed_count}")
                     url_for_interactive_job_poll = url_builder.interactive_job_poll_url(self.client_config, source_id,
@@ -363,6 +362,7 @@ class SourceClient(BaseClient):
                         job_status = None
                     else:
                         job_status = result["status"]
+                        percentage = result.get("percentage")
                     self.logger.info(f"Browse source job poll status : {job_status}")
                     if job_status in ["completed", "failed", "aborted"]:
                         break
@@ -375,12 +375,14 @@ class SourceClient(BaseClient):
                                                                response=response, job_id=job_id,
                                                                source_id=source_id)
                         failed_count = failed_count + 1
+                        failed = True
                 except Exception as e:
                     self.logger.info("Error occurred during job status poll")
                     if failed_count >= retries - 1:
                         raise SourceError(f"Error occurred during job status poll {source_id} " + str(e))
                     failed_count = failed_count + 1
-                time.sleep(polling_frequency)
+                    failed = True
+                poller.sleep(percentage, failed=failed)
             if job_status == "completed":
                 self.logger.info(f"Browse table job for source {source_id} was successful")
                 return SourceResponse.parse_result(status=Response.Status.SUCCESS, job_id=job_id)
@@ -726,19 +728,8 @@ class SourceClient(BaseClient):
                 if tg_id is not None:
                     tg_list.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_tg, response=response, pagination=pagination):
                         tg_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = tg_list
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=response)
         except Exception as e:
@@ -937,20 +928,8 @@ class SourceClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_sources, response=response, pagination=pagination):
                     source_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get list of sources")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -963,6 +942,19 @@ class SourceClient(BaseClient):
             self.logger.error("Error in listing sources")
             raise SourceError("Error in listing sources " + str(e))
 
+    def iter_sources(self, params=None):
+        """
+        Function to iterate over the sources page by page without holding the whole list in memory
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of source dicts
+        """
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_sources = url_builder.list_sources_url(
+            self.client_config) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_sources, SourceError, "Error in listing sources ")
+
     def update_source(self, source_id=None, update_body=None):
         """
         Function to update the source
@@ -1134,22 +1126,14 @@ class SourceClient(BaseClient):
                 if key is not None:
                     adv_config_list.extend([result])
                 else:
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_adv_config, response=response, pagination=pagination):
                         adv_config_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
             response["result"] = adv_config_list
             response["message"] = initial_msg
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in getting source advanced configs", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing advanced configurations")
             raise SourceError("Error in listing advanced configurations" + str(e))
@@ -1271,35 +1255,38 @@ class SourceClient(BaseClient):
                 self.call_api("GET", url_to_list_tables,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_tables, response=response, pagination=pagination):
                     tables_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return SourceResponse.parse_result(status=Response.Status.FAILED,
-                                                           error_code=ErrorCode.GENERIC_ERROR,
-                                                           error_desc="Error in listing tables under the source",
-                                                           response=response
-                                                           )
 
                 response["result"] = tables_list
                 response["message"] = initial_msg
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing tables under the source", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing tables under source")
             raise SourceError("Error in listing tables under source" + str(e))
 
+    def iter_tables_in_source(self, source_id=None, params=None):
+        """
+        Function to iterate over the tables part of the source page by page without holding the whole list in memory
+        :param source_id: Entity identifier for source
+        :type source_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by, projections as a dictionary
+        :type: JSON dict
+        :return: generator of table dicts
+        """
+        if None in {source_id}:
+            self.logger.error("source id cannot be None")
+            raise Exception("source id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_tables = url_builder.list_tables_under_source(
+            self.client_config, source_id) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_tables, SourceError, "Error in listing tables under source")
+
     def get_list_of_table_groups(self, source_id=None, params=None, pagination=True):
         """
         Function to list the tables groups part of the source
@@ -1325,35 +1312,38 @@ class SourceClient(BaseClient):
                 self.call_api("GET", url_to_list_tablegrps,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_tablegrps, response=response, pagination=pagination):
                     tablegrp_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return SourceResponse.parse_result(status=Response.Status.FAILED,
-                                                           error_code=ErrorCode.GENERIC_ERROR,
-                                                           error_desc="Error in listing table groups under the source",
-                                                           response=response
-                                                           )
 
                 response["result"] = tablegrp_list
                 response["message"] = initial_msg
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing table groups under the source", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing table groups under source")
             raise SourceError("Error in listing table groups under source" + str(e))
 
+    def iter_table_groups(self, source_id=None, params=None):
+        """
+        Function to iterate over the table groups part of the source page by page
+        :param source_id: Entity identifier for source
+        :type source_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of table group dicts
+        """
+        if None in {source_id}:
+            self.logger.error("source id cannot be None")
+            raise Exception("source id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        url_to_list_tablegrps = url_builder.create_table_group_url(
+            self.client_config, source_id) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_tablegrps, SourceError, "Error in listing table groups under source")
+
     def get_table_columns_details(self, source_id=None, table_name=None, schema_name=None, database_name=None):
         """
         Function to get the table column details
@@ -1689,27 +1679,13 @@ class SourceClient(BaseClient):
                 self.call_api("GET", url_to_get_ing_metrics,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_ing_metrics, response=response, pagination=pagination):
                     metric_results.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return SourceResponse.parse_result(status=Response.Status.FAILED,
-                                                           error_code=ErrorCode.GENERIC_ERROR,
-                                                           error_desc="Error in getting the table ingestion metrics",
-                                                           response=response)
 
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=metric_results)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in getting the table ingestion metrics", response=error.response)
         except Exception as e:
             self.logger.error("Error in fetching ingestion metrics for source")
             raise SourceError(f"Error in fetching ingestion metrics for source for {source_id} " + str(e))
@@ -1785,7 +1761,8 @@ class SourceClient(BaseClient):
 
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_sources,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=True).content)
             if response is not None:
                 result = response.get("result", [])
                 if len(result) > 0:
@@ -2073,7 +2050,8 @@ class SourceClient(BaseClient):
         try:
             response = IWUtils.ejson_deserialize(
                 self.call_api("GET", url_to_list_tables_under_source,
-                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
+                              IWUtils.get_default_header_for_v3(self.client_config['bearer_token']),
+                              use_cache=True).content)
             if response is not None:
                 result = response.get("result", [])
                 if len(result) > 0:
@@ -2166,20 +2144,8 @@ class SourceClient(BaseClient):
                                                                ).content)
             initial_msg = response.get("message", "")
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(table_list_url, response=response, pagination=pagination):
                     tables_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get list of tables")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2476,20 +2442,8 @@ class SourceClient(BaseClient):
                                   IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(file_mappings_url, response=response, pagination=pagination):
                         file_mappings_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 else:
                     self.logger.error("Failed to get list of file mappings")
                     return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2733,20 +2687,8 @@ class SourceClient(BaseClient):
                                   IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(get_json_src_tbls_url, response=response, pagination=pagination):
                         tables_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 else:
                     self.logger.error("Failed to get list of json source tables")
                     return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2834,20 +2776,8 @@ class SourceClient(BaseClient):
                                                                ).content)
             initial_msg = response.get("message", "")
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(src_audit_logs_url, response=response, pagination=pagination):
                     audit_logs.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get audit logs of source")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2859,6 +2789,24 @@ class SourceClient(BaseClient):
             self.logger.error(f"Failed to get the audit logs of {source_id} " + str(e))
             raise SourceError(f"Failed to get the audit logs of {source_id} " + str(e))
 
+    def iter_source_audit_logs(self, source_id=None, params=None):
+        """
+        Function to iterate over the audit logs of source page by page without holding the whole list in memory
+        :param source_id: Entity identifier for source
+        :type source_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of audit log dicts
+        """
+        if None in {source_id}:
+            self.logger.error("source id cannot be None")
+            raise Exception("source id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        src_audit_logs_url = url_builder.get_source_audit_logs_url(
+            self.client_config, source_id) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(src_audit_logs_url, SourceError, f"Failed to get the audit logs of {source_id} ")
+
     def get_table_audit_logs(self, source_id=None, table_id=None, params=None, pagination=True):
         """
         Function to get audit logs of source
@@ -2886,20 +2834,8 @@ class SourceClient(BaseClient):
                                                                ).content)
             initial_msg = response.get("message", "")
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(tbl_audit_logs_url, response=response, pagination=pagination):
                     audit_logs.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get audit logs of table")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2911,6 +2847,26 @@ class SourceClient(BaseClient):
             self.logger.error(f"Failed to get the audit logs of table {table_id} " + str(e))
             raise SourceError(f"Failed to get the audit logs of table {table_id} " + str(e))
 
+    def iter_table_audit_logs(self, source_id=None, table_id=None, params=None):
+        """
+        Function to iterate over the audit logs of table page by page without holding the whole list in memory
+        :param source_id: Entity identifier for source
+        :type source_id: String
+        :param table_id: Entity identifier for table
+        :type table_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of audit log dicts
+        """
+        if None in {source_id, table_id}:
+            self.logger.error("source id or table id cannot be None")
+            raise Exception("source id or table id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        tbl_audit_logs_url = url_builder.get_table_audit_logs_url(
+            self.client_config, source_id, table_id) + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(tbl_audit_logs_url, SourceError, f"Failed to get the audit logs of {table_id} ")
+
     def get_tablegroup_audit_logs(self, source_id=None, table_group_id=None, params=None, pagination=True):
         """
         Function to get audit logs of source
@@ -2939,20 +2895,8 @@ class SourceClient(BaseClient):
                                                                ).content)
             initial_msg = response.get("message", "")
             if response is not None:
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(tblgrp_audit_logs_url, response=response, pagination=pagination):
                     audit_logs.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get audit logs of table group")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -2989,31 +2933,16 @@ class SourceClient(BaseClient):
                 self.call_api("GET", url_to_get_table_adv_config,
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_get_table_adv_config, response=response, pagination=pagination):
                     adv_config_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", None)
-                    if result is None:
-                        return SourceResponse.parse_result(status=Response.Status.FAILED,
-                                                           error_code=ErrorCode.GENERIC_ERROR,
-                                                           error_desc="Error in listing adv config of table",
-                                                           response=response
-                                                           )
 
                 response["result"] = adv_config_list
                 response["message"] = initial_msg
             return SourceResponse.parse_result(status=Response.Status.SUCCESS, response=response)
+        except PaginationError as error:
+            self.logger.error(error.message)
+            return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.GENERIC_ERROR, error_desc="Error in listing adv config of table", response=error.response)
         except Exception as e:
             self.logger.error("Error in listing adv config of table")
             raise SourceError("Error in listing adv config of table" + str(e))
@@ -3408,20 +3337,8 @@ class SourceClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_validation_specs, response=response, pagination=pagination):
                     validations_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             else:
                 self.logger.error("Failed to get list of validations for table")
                 return SourceResponse.parse_result(status=Response.Status.FAILED, error_code=ErrorCode.USER_ERROR,
@@ -1,9 +1,8 @@
-import time
-
 from infoworks.error import WorkflowError
 from infoworks.sdk import url_builder
 from infoworks.sdk.base_client import BaseClient
 from infoworks.sdk.local_configurations import Response, ErrorCode
+from infoworks.sdk.polling import Poller
 from infoworks.sdk.utils import IWUtils
 from infoworks.sdk.workflow_response import WorkflowResponse
 
@@ -35,41 +34,23 @@ class WorkflowClient(BaseClient):
                                   IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", {}).get("items", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflows, response=response, items_key="items"):
                         workflows_list.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", {}).get("items", [])
                 response["result"] = workflows_list
                 response["message"] = initial_msg
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
             else:
                 workflows_list = []
-                response = IWUtils.ejson_deserialize(self.call_api("GET", url_builder.create_workflow_url(
-                    self.client_config, domain_id)+ IWUtils.get_query_params_string_from_dict(params=params), IWUtils.get_default_header_for_v3(
-                    self.client_config['bearer_token'])).content)
+                url_to_list_workflows = url_builder.create_workflow_url(
+                    self.client_config, domain_id) + IWUtils.get_query_params_string_from_dict(params=params)
+                response = IWUtils.ejson_deserialize(self.call_api("GET", url_to_list_workflows,
+                                                                   IWUtils.get_default_header_for_v3(
+                                                                       self.client_config['bearer_token'])).content)
 
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflows, response=response):
                         workflows_list.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 response["result"] = workflows_list
                 response["message"] = initial_msg
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -450,15 +431,18 @@ class WorkflowClient(BaseClient):
             self.logger.exception('Error occurred while trying to fetch status of workflow.')
             raise WorkflowError('Error occurred while trying to fetch status of workflow.')
 
-    def poll_workflow_run_till_completion(self, workflow_run_id=None, workflow_id=None,domain_id=None, poll_interval=30):
+    def poll_workflow_run_till_completion(self, workflow_run_id=None, workflow_id=None,domain_id=None, poll_interval=30,
+                                          poll_timeout=-1):
         """
         Polls Infoworks Data workflow for given workflow id and run id
         :param workflow_run_id: run id of the workflow running
         :type workflow_run_id: String
         :param workflow_id: entity id of the workflow running
         :type workflow_id: String
-        :param poll_interval:interval in seconds between poll(default 30)
+        :param poll_interval:longest interval in seconds between poll(default 30)
         :type poll_interval : Int
+        :param poll_timeout: Polling timeout in seconds(default -1, polling is done till the workflow run completes)
+        :type poll_timeout: Integer
         :return: response dict
         """
         response = None
@@ -472,16 +456,23 @@ class WorkflowClient(BaseClient):
             result = response.get('result', {})
             if result:
                 workflow_status = result['workflow_status']["state"]
+                poller = Poller(poll_timeout=poll_timeout, polling_frequency=poll_interval)
                 while workflow_status.lower() not in ['success', 'completed', 'failed', 'aborted', 'canceled']:
+                    if poller.expired():
+                        self.logger.error(f'Timed out polling status of the workflow {workflow_id}')
+                        return WorkflowResponse.parse_result(status=Response.Status.FAILED,
+                                                             error_code=ErrorCode.POLL_TIMEOUT,
+                                                             error_desc='Workflow status poll timeout occurred',
+                                                             response=response)
+                    print(f"workflow_status : {workflow_status}")
+                    # completion percentage of the run, reported under workflow_status or on the run itself
+                    percentage = result['workflow_status'].get("percentage", result.get("percentage"))
+                    poller.sleep(percentage)
                     response = IWUtils.ejson_deserialize(self.call_api("GET", url_builder.get_workflow_status_url(
                         self.client_config, workflow_id, workflow_run_id,domain_id), IWUtils.get_default_header_for_v3(
                         self.client_config['bearer_token'])).content)
                     result = response.get('result', {})
                     workflow_status = result['workflow_status']["state"]
-                    if workflow_status.lower() in ['success', 'completed', 'failed', 'aborted', 'canceled']:
-                        break
-                    print(f"workflow_status : {workflow_status}.Sleeping for {poll_interval} seconds")
-                    time.sleep(poll_interval)
 
                 run_id = result.get('id', None)
                 if result.get('id', None) is None:
@@ -708,23 +699,18 @@ class WorkflowClient(BaseClient):
                                                              error_code=ErrorCode.USER_ERROR,
                                                              error_desc='Failed to get the workflow run id jobs',
                                                              response=response)
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflow_runs, response=response, pagination=pagination,
+                                                  method="POST", data=api_body_for_filter):
                         workflow_runs_list.extend(result)
-                        if not pagination:
-                            break
-                        api_body_for_filter["offset"] = api_body_for_filter.get("limit")
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("POST", url_to_list_workflow_runs, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token']), data=api_body_for_filter).content)
-                        result = response.get("result", [])
                 response["result"] = workflow_runs_list
                 response["message"] = initial_msg
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
             else:
                 workflow_runs_list = []
+                url_to_list_workflow_runs = url_builder.get_all_workflows_runs_url_with_domain_id(
+                    self.client_config, domain_id, workflow_id) + IWUtils.get_query_params_string_from_dict(params=params)
                 response = IWUtils.ejson_deserialize(
-                    self.call_api("GET", url_builder.get_all_workflows_runs_url_with_domain_id(
-                        self.client_config, domain_id, workflow_id) + IWUtils.get_query_params_string_from_dict(params=params), IWUtils.get_default_header_for_v3(
+                    self.call_api("GET", url_to_list_workflow_runs, IWUtils.get_default_header_for_v3(
                         self.client_config['bearer_token'])).content)
                 result = response.get('result', None)
                 if result is None:
@@ -734,21 +720,9 @@ class WorkflowClient(BaseClient):
                                                          error_desc='Failed to get the workflow run id jobs',
                                                          response=response)
                 if response is not None:
-                    result = response.get("result", [])
                     initial_msg = response.get("message", "")
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflow_runs, response=response, pagination=pagination):
                         workflow_runs_list.extend(result)
-                        if not pagination:
-                            break
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                     response["result"] = workflow_runs_list
                     response["message"] = initial_msg
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -758,6 +732,31 @@ class WorkflowClient(BaseClient):
             self.logger.exception('Error occurred while trying to get workflow details.')
             raise WorkflowError('Error occurred while trying to get workflow details.')
 
+    def iter_workflow_runs(self, domain_id=None, workflow_id=None, params=None):
+        """
+        Iterates over the workflow runs page by page without holding the whole list in memory.
+        If domain_id and workflow_id are None the runs of all workflows are returned. Need admin access
+        :param domain_id: Domain id to which the workflow belongs to
+        :type domain_id: String
+        :param workflow_id: Workflow id whose runs are to be fetched
+        :type workflow_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of workflow run dicts
+        """
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        items_key = None
+        if None in {domain_id, workflow_id}:
+            url_to_list_workflow_runs = url_builder.get_workflow_runs_url(self.client_config)
+            items_key = "items"
+        else:
+            url_to_list_workflow_runs = url_builder.get_all_workflows_runs_url_with_domain_id(
+                self.client_config, domain_id, workflow_id)
+        url_to_list_workflow_runs = url_to_list_workflow_runs + IWUtils.get_query_params_string_from_dict(params=params)
+        return self.iter_records(url_to_list_workflow_runs, WorkflowError,
+                                 'Error occurred while trying to get workflow run details. ', items_key=items_key)
+
     def get_list_of_workflow_runs_jobs(self, run_id=None, params=None,pagination=True):
         """
          Gets List of Infoworks Data workflow runs jobs details
@@ -796,21 +795,9 @@ class WorkflowClient(BaseClient):
                                                      response=response)
 
             if response is not None:
-                result = response.get("result", [])
                 initial_msg = response.get("message", "")
-                while len(result) > 0:
+                for result in self.iter_pages(get_all_workflow_run_jobs_url, response=response, pagination=pagination):
                     workflow_run_jobs_list.extend(result)
-                    if not pagination:
-                        break
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
 
             response["result"] = workflow_run_jobs_list
             response["message"] = initial_msg
@@ -821,6 +808,26 @@ class WorkflowClient(BaseClient):
             self.logger.exception('Error occurred while trying to get jobs under workflow run.' + str(e))
             raise WorkflowError('Error occurred while trying to get jobs under workflow run.' + str(e))
 
+    def iter_workflow_run_jobs(self, run_id=None, params=None):
+        """
+        Iterates over the jobs of a workflow run page by page without holding the whole list in memory
+        :param run_id: Workflow run id
+        :type run_id: String
+        :param params: Pass the parameters like limit, filter, offset, sort_by, order_by as a dictionary
+        :type: JSON dict
+        :return: generator of job dicts
+        """
+        if run_id is None:
+            self.logger.error("run_id cannot be None")
+            raise Exception("run_id cannot be None")
+        if params is None:
+            params = {"limit": 50, "offset": 0}
+        get_all_workflow_run_jobs_url = url_builder.get_all_workflow_run_jobs_url(self.client_config, run_id) + \
+                                        IWUtils.get_query_params_string_from_dict(params=params) + \
+                                        "&fetch_summary=true&recursive_job_search=true"
+        return self.iter_records(get_all_workflow_run_jobs_url, WorkflowError,
+                                 'Error occurred while trying to get jobs under workflow run.')
+
     def get_list_of_domain_workflow_schedules(self, domain_id, params=None):
         """
         Gets List of Schedules of all Workflows belonging to the Domain
@@ -851,17 +858,8 @@ class WorkflowClient(BaseClient):
                 initial_msg = response.get("message", '')
                 result = response.get("result", [])
 
-                while len(result) > 0:
+                for result in self.iter_pages(domain_schedules_url, response=response):
                     domain_schedules.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", [])
             response["result"] = domain_schedules
             response["message"] = initial_msg
             return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -1104,18 +1102,8 @@ class WorkflowClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {}).get("items", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_workflow_runs, response=response, items_key="items"):
                     workflow_run_list.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {}).get("items", [])
             response["result"] = workflow_run_list
             response["message"] = initial_msg
             return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -1144,18 +1132,8 @@ class WorkflowClient(BaseClient):
                               IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
             if response is not None:
                 initial_msg = response.get("message", "")
-                result = response.get("result", {}).get("items", [])
-                while len(result) > 0:
+                for result in self.iter_pages(url_to_list_workflow_run_tasks, response=response, items_key="items"):
                     workflow_run_tasks_list.extend(result)
-                    nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                      ip=self.client_config['ip'],
-                                                                      port=self.client_config['port'],
-                                                                      protocol=self.client_config['protocol'],
-                                                                      )
-                    response = IWUtils.ejson_deserialize(
-                        self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                            self.client_config['bearer_token'])).content)
-                    result = response.get("result", {}).get("items", [])
             response["result"] = workflow_run_tasks_list
             response["message"] = initial_msg
             return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response=response)
@@ -1253,39 +1231,21 @@ class WorkflowClient(BaseClient):
                                   IWUtils.get_default_header_for_v3(self.client_config['bearer_token'])).content)
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflows, response=response):
                         workflows_list.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response={"result": workflows_list, "message": initial_msg})
             else:
                 workflows_list = []
-                response = IWUtils.ejson_deserialize(self.call_api("GET", url_builder.create_workflow_version_url(
-                    self.client_config, domain_id, workflow_id)+ IWUtils.get_query_params_string_from_dict(params=params), IWUtils.get_default_header_for_v3(
-                    self.client_config['bearer_token'])).content)
+                url_to_list_workflows = url_builder.create_workflow_version_url(
+                    self.client_config, domain_id, workflow_id) + IWUtils.get_query_params_string_from_dict(params=params)
+                response = IWUtils.ejson_deserialize(self.call_api("GET", url_to_list_workflows,
+                                                                   IWUtils.get_default_header_for_v3(
+                                                                       self.client_config['bearer_token'])).content)
 
                 if response is not None:
                     initial_msg = response.get("message", "")
-                    result = response.get("result", [])
-                    while len(result) > 0:
+                    for result in self.iter_pages(url_to_list_workflows, response=response):
                         workflows_list.extend(result)
-                        nextUrl = '{protocol}://{ip}:{port}{next}'.format(next=response.get('links')['next'],
-                                                                          ip=self.client_config['ip'],
-                                                                          port=self.client_config['port'],
-                                                                          protocol=self.client_config['protocol'],
-                                                                          )
-                        response = IWUtils.ejson_deserialize(
-                            self.call_api("GET", nextUrl, IWUtils.get_default_header_for_v3(
-                                self.client_config['bearer_token'])).content)
-                        result = response.get("result", [])
                 return WorkflowResponse.parse_result(status=Response.Status.SUCCESS, response={"result": workflows_list, "message": initial_msg})
 
         except Exception as e:
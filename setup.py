@@ -15,6 +15,9 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     install_requires=[
         'requests', 'bson', 'urllib3', 'pandas', 'networkx', 'pyyaml', 'tabulate','jwt'],
+    extras_require={
+        'fast': ['orjson'],
+        'parquet': ['pyarrow']},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
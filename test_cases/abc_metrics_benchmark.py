@@ -0,0 +1,171 @@
+# Times the ABC job metrics paths of JobMetricsClient against a synthetic Infoworks api served by ApiReplayer.
+# python test_cases/abc_metrics_benchmark.py --sizes 10 1000 --latency 0.01
+# Add 50000 to --sizes to time a large workload, it takes several minutes and is not run by default.
+# With --fixtures, the responses recorded by ApiRecorder on a real cluster are served first.
+import argparse
+import json
+import re
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.jobmetrics import JobMetricsClient, MetricsRunReport
+
+TIME = "2023-01-01T10:00:00.000Z"
+END_TIME = "2023-01-01T10:05:00.000Z"
+SOURCE_JOB_TYPES = ["source_crawl", "source_cdc_merge", "export_data", "source_structured_crawl"]
+
+
+class SyntheticInfoworksApi(object):
+    """
+    Answers the api calls of the ABC metrics for num_jobs jobs, 80% of them source jobs (25 per source) and the rest
+    pipeline builds. Responses are built when requested, so large workloads do not have to be held in memory.
+    """
+
+    def __init__(self, num_jobs, tables_per_source=3, jobs_per_source=25):
+        self.tables_per_source = tables_per_source
+        num_source_jobs = max(int(num_jobs * 0.8), 1)
+        num_sources = max(num_source_jobs // jobs_per_source, 1)
+        self.sources = [{"id": f"src{i}", "name": f"source_{i}"} for i in range(num_sources)]
+        self.jobs = []
+        for i in range(num_source_jobs):
+            source_id = f"src{i % num_sources}"
+            self.jobs.append({"id": f"job{i}", "type": SOURCE_JOB_TYPES[i % len(SOURCE_JOB_TYPES)],
+                              "status": "running" if i % 50 == 49 else "completed", "entity_id": source_id,
+                              "entity_type": "source", "sub_entity_id": f"{source_id}_tg", "created_at": TIME,
+                              "build_started_at": TIME, "build_ended_at": END_TIME, "last_updated": END_TIME,
+                              "created_by": "benchmark", "triggered_by": {"parent_id": "wf", "run_id": f"run{i % 7}"}})
+        for i in range(num_jobs - num_source_jobs):
+            self.jobs.append({"id": f"pipeline_job{i}", "type": "pipeline_build",
+                              "status": "failed" if i % 20 == 19 else "completed", "entity_id": f"pipeline{i % 40}",
+                              "entity_type": "pipeline", "created_at": TIME, "build_started_at": TIME,
+                              "build_ended_at": END_TIME, "last_updated": END_TIME, "created_by": "benchmark",
+                              "cluster_id": "cluster", "cluster_name": "cluster"})
+        self.jobs_by_id = {job["id"]: job for job in self.jobs}
+        self._listings = {}
+
+    def list_jobs(self, raw_filter):
+        if raw_filter not in self._listings:
+            job_filter = json.loads(raw_filter)
+            jobs = self.jobs
+            for condition in job_filter.get("$and", []):
+                if "entityId" in condition:
+                    jobs = [job for job in jobs if job["entity_id"] == condition["entityId"]]
+                elif "entityType" in condition:
+                    jobs = [job for job in jobs if job["entity_type"] in condition["entityType"]["$in"]]
+                elif "jobType" in condition:
+                    jobs = [job for job in jobs if job["type"] in condition["jobType"]["$in"]]
+            self._listings[raw_filter] = jobs
+        return self._listings[raw_filter]
+
+    def table_ids(self, source_id):
+        return [f"{source_id}_t{i}" for i in range(self.tables_per_source)]
+
+    def metrics(self, job):
+        rows = []
+        for table_id in self.table_ids(job["entity_id"]):
+            row = {"table_id": table_id, "source_id": job["entity_id"], "job_id": job["id"],
+                   "source_schema_name": "schema", "source_database_name": "database", "workflow_id": "wf",
+                   "workflow_run_id": job["triggered_by"]["run_id"], "job_status": "SUCCEEDED",
+                   "target_records_count": 1000, "fetch_records_count": 100, "number_of_records_written": 100,
+                   "first_merged_watermark": "", "last_merged_watermark": ""}
+            if job["type"] == "source_cdc_merge":
+                rows.append(dict(row, job_type="CDC", target_records_count=None))
+                rows.append(dict(row, job_type="MERGE", fetch_records_count=None))
+            else:
+                rows.append(dict(row, job_type="FULL_LOAD"))
+        return rows
+
+    def respond(self, method, url, data=None):
+        parts = urlsplit(url)
+        path = parts.path.split("/")
+        query = parse_qs(parts.query)
+        result = None
+        listing = None
+        if parts.path == "/v3/admin/jobs":
+            listing = self.list_jobs(unquote(query["filter"][0]))
+        elif parts.path == "/v3/sources":
+            listing = self.sources
+        elif re.match(r"/v3/admin/jobs/[^/]+/runs$", parts.path):
+            job = self.jobs_by_id[path[4]]
+            if job["entity_type"] == "pipeline":
+                listing = [{"cluster_id": "cluster", "cluster_name": "cluster", "started_at": TIME, "ended_at": END_TIME}]
+            else:
+                listing = [{"cluster_id": "cluster", "cluster_name": "cluster", "started_at": TIME,
+                            "ended_at": END_TIME, "entity_name": table_id, "sub_entity_id": table_id,
+                            "entity_run_details": {"entity_run_status": "SUCCESS"}}
+                           for table_id in self.table_ids(job["entity_id"])]
+        elif re.match(r"/v3/admin/jobs/[^/]+/reports/pipeline-metrics", parts.path):
+            listing = [{"target_table_name": f"schema.table{i}", "job_status": "SUCCEEDED", "target_records_count": 10,
+                        "number_of_records_written": 5, "job_start_time": TIME, "job_end_time": END_TIME,
+                        "workflow_id": "", "workflow_run_id": "", "job_id": path[4], "first_merged_watermark": "",
+                        "last_merged_watermark": ""} for i in range(3)]
+        elif parts.path.endswith("/reports/job-metrics"):
+            listing = self.metrics(self.jobs_by_id[path[5]])
+        elif parts.path.endswith("/reports/export-metrics"):
+            listing = [{"table_id": table_id, "source_id": path[3], "job_status": "SUCCEEDED",
+                        "target_records_count": 1000, "number_of_records_written": 100, "first_merged_watermark": "",
+                        "last_merged_watermark": ""} for table_id in self.table_ids(path[3])]
+        elif parts.path.endswith("/reports/sourceFilesPath"):
+            listing = []
+        elif parts.path.endswith("/configurations/export"):
+            result = {"target_type": "SNOWFLAKE", "connection": {},
+                      "target_configuration": {"database_name": "db", "schema_name": "schema", "table_name": path[5]}}
+        elif re.match(r"/v3/sources/[^/]+/table-groups/[^/]+$", parts.path):
+            result = {"name": path[5], "tables": []}
+        elif re.match(r"/v3/sources/[^/]+/tables/[^/]+$", parts.path):
+            result = {"id": path[5], "name": path[5], "row_count": 1000,
+                      "configuration": {"target_table_name": path[5], "target_schema_name": "target",
+                                        "sync_type": "full-load"}}
+        elif re.match(r"/v3/sources/[^/]+/jobs/[^/]+$", parts.path):
+            result = self.jobs_by_id[path[5]]
+        else:
+            return 404, {"message": f"Unknown url {url}"}
+        if listing is not None:
+            limit = int(query.get("limit", ["50"])[0])
+            offset = int(query.get("offset", ["0"])[0])
+            result = listing[offset:offset + limit]
+        return 200, {"result": result}
+
+
+def build_client(replayer):
+    client = JobMetricsClient()
+    client.client_config.update({"protocol": "http", "ip": "benchmark", "port": "3000", "bearer_token": "token",
+                                 "refresh_token": None})
+    return replayer.attach(client)
+
+
+def timed(function):
+    start = time.perf_counter()
+    output = function()
+    return output, time.perf_counter() - start
+
+
+def run(num_jobs, latency, fixtures):
+    api = SyntheticInfoworksApi(num_jobs)
+    replayer = ApiReplayer(fixtures, latency=latency, fallback=api.respond)
+    client = build_client(replayer)
+    run_report = MetricsRunReport()
+    rows, abc_time = timed(lambda: client.get_abc_job_metrics(callback=lambda batch: None, run_report=run_report))
+    abc_calls = replayer.calls
+    pipeline_jobs = [job for job in api.jobs if job["entity_type"] == "pipeline"]
+    pipeline_rows, pipeline_time = timed(
+        lambda: sum(len(client.get_pipeline_build_metrics_results(job)) for job in pipeline_jobs))
+    source = api.sources[0]
+    source_jobs = [job for job in api.jobs if job["entity_id"] == source["id"]]
+    table_rows, table_time = timed(
+        lambda: len(client.get_source_jobs_metrics_results_table_level(TIME[:19] + "Z", source, jobs=source_jobs)))
+    print(f"{num_jobs} jobs: get_abc_job_metrics {abc_time:.2f}s ({rows} rows, {abc_calls} api calls, "
+          f"{run_report.summary()['failed_tasks']} failed tasks) | "
+          f"get_pipeline_build_metrics_results x{len(pipeline_jobs)} {pipeline_time:.2f}s ({pipeline_rows} rows) | "
+          f"table level x{len(source_jobs)} jobs of one source {table_time:.2f}s ({table_rows} rows)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ABC job metrics benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000], help="numbers of jobs")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every api call")
+    parser.add_argument("--fixtures", default=None, help="directory of responses recorded with ApiRecorder")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.latency, args.fixtures)
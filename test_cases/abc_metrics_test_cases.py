@@ -0,0 +1,238 @@
+import datetime
+import json
+import re
+from urllib.parse import parse_qs, urlsplit
+
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.jobmetrics import MetricsCheckpoint, MetricsCollector, MetricsRunReport, split_time_window
+from test_cases.abc_metrics_benchmark import SyntheticInfoworksApi, build_client
+
+
+class StreamingApi(SyntheticInfoworksApi):
+    """
+    SyntheticInfoworksApi whose running jobs complete after their first status poll
+    """
+
+    def __init__(self, num_jobs):
+        super(StreamingApi, self).__init__(num_jobs)
+        self.polls = {}
+        self.source_listings = 0
+        self.hidden_sources = []
+
+    def respond(self, method, url, data=None):
+        parts = urlsplit(url)
+        if parts.path == "/v3/sources":
+            self.source_listings = self.source_listings + 1
+            if self.source_listings > 1 and self.hidden_sources:
+                return 200, {"result": [source for source in self.sources if source["id"] not in self.hidden_sources]}
+        match = re.match(r"/v3/admin/jobs/([^/]+)$", parts.path)
+        if match is not None:
+            job = self.jobs_by_id[match.group(1)]
+            self.polls[job["id"]] = self.polls.get(job["id"], 0) + 1
+            if self.polls[job["id"]] > 1:
+                job.update({"status": "completed", "build_ended_at": "2023-01-01T10:05:00.000Z"})
+            return 200, {"result": job}
+        return super(StreamingApi, self).respond(method, url, data)
+
+
+def stream_rows(api):
+    client = build_client(ApiReplayer(fallback=api.respond))
+    rows = []
+    run_report = MetricsRunReport()
+    count = client.stream_abc_job_metrics(callback=rows.extend, polling_frequency=0, run_report=run_report)
+    return rows, count, run_report
+
+
+class TestStreamABCJobMetrics:
+
+    def test_running_pipeline_build_is_streamed_till_it_completes(self):
+        api = StreamingApi(10)
+        pipeline_job = [job for job in api.jobs if job["entity_type"] == "pipeline"][0]
+        pipeline_job["status"] = "running"
+        del pipeline_job["build_ended_at"]
+        rows, count, run_report = stream_rows(api)
+        statuses = [row["job_status"] for row in rows if row["job_id"] == pipeline_job["id"]]
+        assert statuses[0] == "RUNNING"
+        assert "RUNNING" in statuses and "SUCCEEDED" in statuses
+        assert count == len(rows)
+        assert run_report.errors == []
+
+    def test_job_of_an_unknown_source_is_skipped_and_reported(self):
+        api = StreamingApi(10)
+        source_job = [job for job in api.jobs if job["entity_type"] == "source"][0]
+        source_job["status"] = "running"
+        # the source is gone by the time the running jobs are watched
+        api.hidden_sources.append(source_job["entity_id"])
+        rows, count, run_report = stream_rows(api)
+        assert [task["job_id"] for task in run_report.errors] == [source_job["id"]]
+        assert run_report.errors[0]["error"] == "source not found"
+
+
+class TestJobMetricsFinal:
+
+    def test_direct_calls_append_to_job_metrics_final(self):
+        api = SyntheticInfoworksApi(10)
+        client = build_client(ApiReplayer(fallback=api.respond))
+        pipeline_rows = client.get_pipeline_build_metrics_results(api.jobs[-1])
+        source = api.sources[0]
+        source_jobs = [job for job in api.jobs if job["entity_id"] == source["id"]]
+        table_rows = client.get_source_jobs_metrics_results_table_level("2023-01-01T10:00:00Z", source,
+                                                                        jobs=source_jobs)
+        assert len(pipeline_rows) > 0 and len(table_rows) > 0
+        assert client.job_metrics_final == pipeline_rows + table_rows
+
+    def test_job_metrics_final_holds_the_rows_of_the_last_run(self):
+        api = SyntheticInfoworksApi(10)
+        client = build_client(ApiReplayer(fallback=api.respond))
+        rows = client.get_abc_job_metrics()
+        assert client.job_metrics_final == rows
+        client.get_abc_job_metrics(callback=lambda batch: None)
+        assert client.job_metrics_final == []
+
+
+def get_row(job_id, table_name="table1", **values):
+    return dict({"job_id": job_id, "job_type": "FULL_LOAD", "iwx_table_name": table_name,
+                 "target_schema_name": "schema", "target_table_name": table_name, "job_status": "COMPLETED",
+                 "target_records_count": 10}, **values)
+
+
+class TestMetricsCheckpoint:
+
+    def test_advance_keeps_the_newest_update_and_the_open_jobs(self, tmp_path):
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"))
+        assert checkpoint.get_window_start("2023-01-01T09:00:00Z") == "2023-01-01T09:00:00Z"
+        checkpoint.advance([{"id": "job1", "status": "completed", "last_updated": "2023-01-01T10:00:00.000Z"},
+                            {"id": "job2", "status": "running", "last_updated": "2023-01-01T09:30:00.000Z"},
+                            {"id": "job3", "status": "pending", "created_at": {"$date": "2023-01-01T09:45:00.000Z"}}])
+        checkpoint.save()
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"), overlap=60)
+        assert checkpoint.high_water_mark == "2023-01-01T10:00:00Z"
+        assert checkpoint.open_jobs == {"job2": "2023-01-01T09:30:00Z", "job3": "2023-01-01T09:45:00Z"}
+        # the oldest open job, less the overlap
+        assert checkpoint.get_window_start("2023-01-01T09:00:00Z") == "2023-01-01T09:29:00Z"
+
+    def test_finished_open_jobs_are_dropped(self, tmp_path):
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"))
+        checkpoint.advance([{"id": "job1", "status": "running", "last_updated": "2023-01-01T10:00:00Z"}])
+        checkpoint.advance([{"id": "job1", "status": "completed", "last_updated": "2023-01-01T10:10:00Z"}])
+        assert checkpoint.open_jobs == {}
+        assert checkpoint.get_window_start("2023-01-01T09:00:00Z") == "2023-01-01T10:09:00Z"
+
+    def test_filter_rows_returns_the_new_and_changed_rows_only(self, tmp_path):
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"))
+        rows = [get_row("job1"), get_row("job1", "table2"), get_row("job2")]
+        assert checkpoint.filter_rows(rows) == rows
+        checkpoint.advance([])
+        changed = get_row("job1", "table2", target_records_count=20)
+        assert checkpoint.filter_rows([get_row("job1"), changed, get_row("job2")]) == [changed]
+
+    def test_rows_of_open_jobs_not_read_again_are_kept(self, tmp_path):
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"))
+        checkpoint.filter_rows([get_row("job1", job_status="RUNNING")])
+        checkpoint.advance([{"id": "job1", "status": "running", "last_updated": "2023-01-01T10:00:00Z"}])
+        checkpoint.advance([{"id": "job1", "status": "running", "last_updated": "2023-01-01T10:00:00Z"}])
+        assert checkpoint.filter_rows([get_row("job1", job_status="RUNNING")]) == []
+
+
+class TestMetricsCollector:
+
+    def test_rows_are_shaped_with_their_job_link(self):
+        collector = MetricsCollector(job_link_prefix="https://iwx/job/logs?jobId=")
+        collector.add([get_row("job1", extra="dropped")])
+        assert collector.count == 1
+        assert collector.rows[0]["job_link"] == "https://iwx/job/logs?jobId=job1"
+        assert "extra" not in collector.rows[0]
+
+    def test_unchanged_rows_are_dropped_through_the_checkpoint(self, tmp_path):
+        checkpoint = MetricsCheckpoint(str(tmp_path / "state.json"))
+        collector = MetricsCollector(checkpoint=checkpoint)
+        collector.add([get_row("job1"), get_row("job2")])
+        checkpoint.advance([])
+        batches = []
+        collector = MetricsCollector(checkpoint=checkpoint, callback=batches.append)
+        collector.add([get_row("job1"), get_row("job2", job_status="FAILED")])
+        collector.add([get_row("job1")])
+        assert [[row["job_id"] for row in batch] for batch in batches] == [["job2"]]
+        assert collector.count == 1
+
+
+class TestIncrementalABCJobMetrics:
+
+    def test_next_runs_return_only_new_or_changed_rows(self, tmp_path):
+        state_file = str(tmp_path / "state.json")
+        api = SyntheticInfoworksApi(10)
+        running_job = api.jobs[0]
+        running_job["status"] = "running"
+        client = build_client(ApiReplayer(fallback=api.respond))
+        first_rows = client.get_abc_job_metrics(state_file=state_file)
+        assert len(first_rows) > 0
+        with open(state_file) as state:
+            assert list(json.load(state)["open_jobs"]) == [running_job["id"]]
+        assert client.get_abc_job_metrics(state_file=state_file) == []
+        running_job.update({"status": "completed", "last_updated": "2023-01-01T10:10:00.000Z"})
+        rows = client.get_abc_job_metrics(state_file=state_file)
+        assert set(row["job_id"] for row in rows) == {running_job["id"]}
+        assert set(row["job_status"] for row in rows) == {"COMPLETED"}
+
+    def test_job_of_a_failed_task_is_read_again_by_the_next_run(self, tmp_path, monkeypatch):
+        state_file = str(tmp_path / "state.json")
+        api = SyntheticInfoworksApi(10)
+        failed_job = api.jobs[1]
+        client = build_client(ApiReplayer(fallback=api.respond))
+        get_source_job_metrics_rows = client.get_source_job_metrics_rows
+
+        def fail_once(job, *args):
+            if job["id"] == failed_job["id"]:
+                raise Exception("metrics report not available")
+            return get_source_job_metrics_rows(job, *args)
+
+        monkeypatch.setattr(client, "get_source_job_metrics_rows", fail_once)
+        run_report = MetricsRunReport()
+        first_rows = client.get_abc_job_metrics(state_file=state_file, run_report=run_report)
+        assert [task["job_id"] for task in run_report.errors] == [failed_job["id"]]
+        assert failed_job["id"] not in set(row["job_id"] for row in first_rows)
+        with open(state_file) as state:
+            assert failed_job["id"] in json.load(state)["open_jobs"]
+        monkeypatch.setattr(client, "get_source_job_metrics_rows", get_source_job_metrics_rows)
+        rows = client.get_abc_job_metrics(state_file=state_file)
+        assert set(row["job_id"] for row in rows) == {failed_job["id"]}
+        with open(state_file) as state:
+            assert failed_job["id"] not in json.load(state)["open_jobs"]
+
+
+class TestSplitTimeWindow:
+    end = datetime.datetime(2023, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+    def test_window_is_split_in_sub_windows_of_window_in_mins(self):
+        windows = split_time_window("2023-01-01T10:30:00Z", self.end, window_in_mins=30)
+        assert windows == [("2023-01-01T10:30:00Z", "2023-01-01T11:00:00Z"),
+                           ("2023-01-01T11:00:00Z", "2023-01-01T11:30:00Z"),
+                           ("2023-01-01T11:30:00Z", None)]
+
+    def test_number_of_sub_windows_is_capped(self):
+        windows = split_time_window("2023-01-01T00:00:00Z", self.end, window_in_mins=30, max_windows=4)
+        assert windows == [("2023-01-01T00:00:00Z", "2023-01-01T03:00:00Z"),
+                           ("2023-01-01T03:00:00Z", "2023-01-01T06:00:00Z"),
+                           ("2023-01-01T06:00:00Z", "2023-01-01T09:00:00Z"),
+                           ("2023-01-01T09:00:00Z", None)]
+
+    def test_short_or_future_window_is_one_open_window(self):
+        assert split_time_window("2023-01-01T11:55:00Z", self.end) == [("2023-01-01T11:55:00Z", None)]
+        assert split_time_window("2023-01-01T12:30:00Z", self.end) == [("2023-01-01T12:30:00Z", None)]
+
+    def test_jobs_read_in_two_sub_windows_are_returned_once(self):
+        api = SyntheticInfoworksApi(10)
+        windows = []
+
+        def respond(method, url, data=None):
+            job_filter = json.loads(parse_qs(urlsplit(url).query)["filter"][0])
+            windows.append(tuple(condition["last_upd"] for condition in job_filter["$and"] if "last_upd" in condition))
+            return api.respond(method, url, data)
+
+        client = build_client(ApiReplayer(fallback=respond))
+        start = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=2)
+        jobs = client.get_jobs_updated_since([{"entityType": {"$in": ["source"]}}],
+                                             start.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        # the synthetic api does not filter by time, every sub window lists all the source jobs
+        assert len(windows) >= 4
+        assert [job["id"] for job in jobs] == [job["id"] for job in api.jobs if job["entity_type"] == "source"]
@@ -0,0 +1,59 @@
+# Compares EJSONEncoder with the previous transform-then-encode implementation on multi MB source configurations.
+# python test_cases/ejson_encoder_benchmark.py
+import copy
+import datetime
+import json
+import os
+import time
+import tracemalloc
+
+from bson import ObjectId
+
+from infoworks.sdk.ejson import EJSONEncoder
+
+cust_hooks = [(ObjectId, 'oid', str)]
+config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_jsons", "rdbms_source_configure.json")
+
+
+def build_config(num_tables):
+    with open(config_path, "r") as f:
+        source_config = json.load(f)
+    tables = []
+    for i in range(num_tables):
+        table = copy.deepcopy(source_config)
+        table["id"] = ObjectId()
+        table["last_modified"] = datetime.datetime(2023, 1, 1, 10, 30) + datetime.timedelta(minutes=i)
+        tables.append(table)
+    return {"configuration": {"source_id": ObjectId(), "tables": tables}}
+
+
+def legacy_encode(o):
+    encoder = EJSONEncoder(custom_type_hooks=cust_hooks)
+    return json.JSONEncoder.encode(encoder, encoder._transform(o))
+
+
+def single_pass_encode(o):
+    return EJSONEncoder(custom_type_hooks=cust_hooks).encode(o)
+
+
+def measure(encode, o):
+    tracemalloc.start()
+    start = time.perf_counter()
+    output = encode(o)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return output, elapsed, peak
+
+
+if __name__ == "__main__":
+    for num_tables in [100, 500, 1000]:
+        config = build_config(num_tables)
+        legacy_output, legacy_time, legacy_peak = measure(legacy_encode, config)
+        output, single_pass_time, single_pass_peak = measure(single_pass_encode, config)
+        assert output == legacy_output, "single pass encoder output differs from the previous encoder"
+        print(f"{len(output) / 2 ** 20:.1f} MB config: "
+              f"previous {legacy_time:.3f}s, {legacy_peak / 2 ** 20:.1f} MB peak | "
+              f"single pass {single_pass_time:.3f}s, {single_pass_peak / 2 ** 20:.1f} MB peak")
+    escaped = {"filter": {"$in": [1, 2]}, "nested": [{"$date": datetime.date(2023, 1, 1)}], "data": b"bytes"}
+    assert single_pass_encode(escaped) == legacy_encode(escaped)
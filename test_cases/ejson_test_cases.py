@@ -0,0 +1,74 @@
+import json
+import math
+
+import pytest
+
+from infoworks.sdk import ejson
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.client import InfoworksClientSDK
+from infoworks.sdk.utils import IWUtils
+
+BIG_INTEGERS = [2 ** 63 - 1, 2 ** 64 + 1, 10 ** 25 + 7, -(2 ** 70) - 3]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def parser(request, monkeypatch):
+    """
+    runs the test with the orjson fast path, when it is installed, and with json only
+    """
+    if request.param == "orjson":
+        if ejson.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(ejson, "orjson", None)
+    return request.param
+
+
+class TestEJSONLoads:
+
+    def test_integers_beyond_64_bits_keep_their_value(self, parser):
+        text = json.dumps({"ids": BIG_INTEGERS, "nested": {"row_count": 10 ** 19}})
+        for document in [text, text.encode("utf-8")]:
+            loaded = ejson.loads(document)
+            assert loaded == {"ids": BIG_INTEGERS, "nested": {"row_count": 10 ** 19}}
+            assert all(isinstance(value, int) for value in loaded["ids"])
+
+    def test_long_digit_runs_in_strings_are_kept(self, parser):
+        assert ejson.loads('{"id": "12345678901234567890123", "count": 3}') == {"id": "12345678901234567890123",
+                                                                                 "count": 3}
+
+    def test_values_rejected_by_orjson_are_parsed_by_json(self, parser):
+        loaded = ejson.loads(b'{"ratio": NaN, "max": Infinity, "name": "a"}')
+        assert math.isnan(loaded["ratio"])
+        assert loaded["max"] == float("inf")
+        assert loaded["name"] == "a"
+
+    def test_same_result_as_json_without_markers(self, parser):
+        text = '{"result": [{"id": "a1", "size": 1.5, "tags": ["x", null, true], "unicode": "caf\\u00e9"}]}'
+        assert ejson.loads(text) == json.loads(text)
+        assert ejson.loads(text.encode("utf-8")) == json.loads(text)
+
+    def test_markers_are_decoded(self, parser):
+        document = (b'{"_id": {"$type": "oid", "$value": "5f1d7a5b9e1b2c3d4e5f6a7b"}, '
+                    b'"data": {"$binary": "aGVsbG8="}, "price": "$10"}')
+        loaded = IWUtils.ejson_deserialize(document)
+        assert str(loaded["_id"]) == "5f1d7a5b9e1b2c3d4e5f6a7b"
+        assert loaded["data"] == b"hello"
+        assert loaded["price"] == "$10"
+
+    def test_invalid_document_raises(self, parser):
+        with pytest.raises(ValueError):
+            ejson.loads('{"result": [')
+
+
+class TestEJSONResponses:
+
+    def test_big_integers_of_a_response_keep_their_value(self, parser):
+        users = [{"id": "user1", "profile": {"employee_id": 2 ** 64 + 1}}]
+        client = InfoworksClientSDK()
+        client.client_config.update({"protocol": "http", "ip": "localhost", "port": "3000", "bearer_token": "token",
+                                     "refresh_token": None})
+        replayer = ApiReplayer(fallback=lambda method, url, data=None: (200, {"result": users}))
+        replayer.attach(client)
+        response = client.list_users(params={"limit": 20}, pagination=False)
+        assert response["result"]["response"]["result"] == users
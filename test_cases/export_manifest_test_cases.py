@@ -0,0 +1,137 @@
+import json
+import os
+import re
+from urllib.parse import urlsplit
+
+import pytest
+
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.cicd.download_configurations.export_manifest import ExportManifest
+from infoworks.sdk.client import InfoworksClientSDK
+
+CONFIGURATION = {"configuration": {"entity": {"entity_type": "pipeline", "entity_id": "pipeline1"}, "steps": [1, 2]}}
+
+
+class EntitiesApi(object):
+    """
+    Serves the details of a source, its tables and a pipeline, with the modified_at and versions the manifest reads
+    """
+
+    def __init__(self):
+        self.source = {"id": "src1", "name": "sales", "modified_at": "2023-01-01T10:00:00.000Z"}
+        self.tables = [{"id": "tbl1", "modified_at": "2023-01-01T10:00:00.000Z", "last_merged_watermark": 10}]
+        self.pipeline = {"id": "pipeline1", "modified_at": "2023-01-01T10:00:00.000Z", "active_version_id": "v1"}
+
+    def respond(self, method, url, data=None):
+        path = urlsplit(url).path
+        if path == "/v3/sources/src1":
+            return 200, {"result": self.source}
+        if path == "/v3/sources/src1/tables":
+            return 200, {"result": self.tables}
+        if re.match(r"/v3/domains/[^/]+/pipelines/pipeline1$", path):
+            return 200, {"result": self.pipeline}
+        return 404, {"message": f"Unknown url {url}"}
+
+
+@pytest.fixture
+def api_client():
+    api = EntitiesApi()
+    client = InfoworksClientSDK()
+    client.client_config.update({"protocol": "http", "ip": "localhost", "port": "3000", "bearer_token": "token",
+                                 "refresh_token": None})
+    ApiReplayer(fallback=api.respond).attach(client)
+    return api, client
+
+
+def export_pipeline(manifest, client, file_name="domain1#pipeline1.json"):
+    """
+    writes CONFIGURATION for pipeline1 like the export does and records it in the manifest
+    """
+    modified_at, version = manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1")
+    os.makedirs(os.path.join(manifest.config_file_dump_path, "pipeline"), exist_ok=True)
+    with open(os.path.join(manifest.config_file_dump_path, "pipeline", file_name), "w") as export_file:
+        json.dump(CONFIGURATION, export_file, indent=4)
+    manifest.record("pipeline", "pipeline1", modified_at, version, file_name)
+    manifest.save()
+    return version
+
+
+class TestEntityVersion:
+
+    def test_version_moves_with_modified_at_and_the_active_version(self, api_client, tmp_path):
+        api, client = api_client
+        manifest = ExportManifest(str(tmp_path))
+        modified_at, version = manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1")
+        assert modified_at == "2023-01-01T10:00:00.000Z"
+        assert manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1") == (modified_at, version)
+        api.pipeline["active_version_id"] = "v2"
+        assert manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1")[1] != version
+        api.pipeline["modified_at"] = "2023-01-02T10:00:00.000Z"
+        assert manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1")[0] == "2023-01-02T10:00:00.000Z"
+
+    def test_version_of_a_source_covers_its_tables(self, api_client, tmp_path):
+        api, client = api_client
+        manifest = ExportManifest(str(tmp_path))
+        modified_at, version = manifest.get_entity_version(client, "source", None, "src1")
+        api.tables[0]["last_merged_watermark"] = 20
+        assert manifest.get_entity_version(client, "source", None, "src1") != (modified_at, version)
+        assert manifest.get_entity_version(client, "source", None, "src1")[0] == modified_at
+
+    def test_unknown_entity_has_no_version(self, api_client, tmp_path):
+        api, client = api_client
+        manifest = ExportManifest(str(tmp_path))
+        assert manifest.get_entity_version(client, "pipeline", "domain1", "pipeline2") == (None, None)
+        assert manifest.get_entity_version(client, "table", None, "tbl1") == (None, None)
+        del api.pipeline["modified_at"]
+        assert manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1") == (None, None)
+
+
+class TestExportManifest:
+
+    def test_unchanged_entity_is_skipped(self, api_client, tmp_path):
+        api, client = api_client
+        version = export_pipeline(ExportManifest(str(tmp_path), options={"replace_words": ""}), client)
+        manifest = ExportManifest(str(tmp_path), options={"replace_words": ""})
+        assert manifest.get_unchanged_export("pipeline", "pipeline1", version) == ("domain1#pipeline1.json",
+                                                                                   CONFIGURATION)
+        assert manifest.skipped == 1
+
+    def test_changed_version_is_exported_again(self, api_client, tmp_path):
+        api, client = api_client
+        export_pipeline(ExportManifest(str(tmp_path)), client)
+        api.pipeline["modified_at"] = "2023-01-02T10:00:00.000Z"
+        manifest = ExportManifest(str(tmp_path))
+        modified_at, version = manifest.get_entity_version(client, "pipeline", "domain1", "pipeline1")
+        assert manifest.get_unchanged_export("pipeline", "pipeline1", version) == (None, None)
+        assert manifest.get_unchanged_export("pipeline", "pipeline1", None) == (None, None)
+        assert manifest.skipped == 0
+
+    def test_changed_options_are_exported_again(self, api_client, tmp_path):
+        api, client = api_client
+        version = export_pipeline(ExportManifest(str(tmp_path), options={"replace_words": ""}), client)
+        manifest = ExportManifest(str(tmp_path), options={"replace_words": "dev->prod"})
+        assert manifest.get_unchanged_export("pipeline", "pipeline1", version) == (None, None)
+
+    def test_modified_or_missing_file_is_exported_again(self, api_client, tmp_path):
+        api, client = api_client
+        version = export_pipeline(ExportManifest(str(tmp_path)), client)
+        file_path = str(tmp_path / "pipeline" / "domain1#pipeline1.json")
+        with open(file_path, "a") as export_file:
+            export_file.write("\n")
+        assert ExportManifest(str(tmp_path)).get_unchanged_export("pipeline", "pipeline1", version) == (None, None)
+        os.remove(file_path)
+        assert ExportManifest(str(tmp_path)).get_unchanged_export("pipeline", "pipeline1", version) == (None, None)
+
+    def test_entity_never_exported_is_exported(self, api_client, tmp_path):
+        api, client = api_client
+        manifest = ExportManifest(str(tmp_path))
+        modified_at, version = manifest.get_entity_version(client, "source", None, "src1")
+        assert manifest.get_unchanged_export("source", "src1", version) == (None, None)
+
+    def test_save_keeps_the_manifest_file_when_nothing_changed(self, api_client, tmp_path):
+        api, client = api_client
+        export_pipeline(ExportManifest(str(tmp_path)), client)
+        manifest_path = str(tmp_path / "export_manifest.json")
+        os.utime(manifest_path, (0, 0))
+        ExportManifest(str(tmp_path)).save()
+        assert os.path.getmtime(manifest_path) == 0
@@ -0,0 +1,69 @@
+import csv
+import json
+
+import pytest
+
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.metrics_sinks import CSVMetricsSink, INTEGER, MetricsSink, NDJSONMetricsSink, STRING, \
+    STRING_LIST, coerce_value
+from test_cases.abc_metrics_benchmark import SyntheticInfoworksApi, build_client
+
+
+class TestCoerceValue:
+
+    def test_missing_values_are_none(self):
+        for column_type in [STRING, INTEGER, STRING_LIST]:
+            assert coerce_value(None, column_type) is None
+            assert coerce_value(float("nan"), column_type) is None
+        assert coerce_value("", INTEGER) is None
+
+    def test_integers_above_2_power_53_keep_their_value(self):
+        assert coerce_value(2 ** 53 + 1, INTEGER) == 2 ** 53 + 1
+        assert coerce_value(str(2 ** 53 + 1), INTEGER) == 2 ** 53 + 1
+
+    def test_non_integral_strings_fall_back_to_float(self):
+        assert coerce_value("12.7", INTEGER) == 12
+        assert coerce_value("1e3", INTEGER) == 1000
+        assert coerce_value(3.0, INTEGER) == 3
+
+    def test_invalid_integers_are_none(self):
+        assert coerce_value("x", INTEGER) is None
+        assert coerce_value("inf", INTEGER) is None
+        assert coerce_value("nan", INTEGER) is None
+
+    def test_file_path_records_are_written_as_json(self):
+        value = [{"path": "/data/a.csv", "size": 10}, "/data/b.csv"]
+        assert coerce_value(value, STRING_LIST) == ['{"path": "/data/a.csv", "size": 10}', "/data/b.csv"]
+        assert coerce_value("/data/c.csv", STRING_LIST) == ["/data/c.csv"]
+
+    def test_strings(self):
+        assert coerce_value(10, STRING) == "10"
+        assert coerce_value("a", STRING) == "a"
+
+
+class TestMetricsSink:
+
+    def test_sink_without_write_batch_fails_when_created(self, tmp_path):
+        class IncompleteSink(MetricsSink):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteSink(str(tmp_path / "rows"))
+
+    def test_csv_and_ndjson_sinks_write_all_the_rows(self, tmp_path):
+        api = SyntheticInfoworksApi(10)
+        client = build_client(ApiReplayer(fallback=api.respond))
+        expected = len(client.get_abc_job_metrics())
+        csv_path = str(tmp_path / "abc_metrics.csv")
+        client.write_abc_job_metrics(CSVMetricsSink(csv_path))
+        with open(csv_path, newline="") as csv_file:
+            csv_rows = list(csv.DictReader(csv_file))
+        assert len(csv_rows) == expected
+        assert json.loads(csv_rows[0]["source_file_names"]) == []
+        ndjson_path = str(tmp_path / "partitions")
+        sink = NDJSONMetricsSink(ndjson_path, partition_by="job_start_time", batch_size=7)
+        client.write_abc_job_metrics(sink)
+        partition = tmp_path / "partitions" / "job_start_time_date=2023-01-01"
+        lines = [line for part in partition.iterdir() for line in part.read_text().splitlines()]
+        assert len(lines) == expected == sink.rows_written
+        assert isinstance(json.loads(lines[0])["target_records_count"], (int, type(None)))
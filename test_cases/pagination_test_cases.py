@@ -0,0 +1,133 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from infoworks.error import PaginationError, SourceError
+from infoworks.sdk import local_configurations
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.client import InfoworksClientSDK
+from infoworks.sdk.utils import IWUtils
+
+
+class PagedApi(object):
+    """
+    Serves num_records users by limit and offset, like the paginated listings of the Infoworks api
+    """
+
+    def __init__(self, num_records, missing_result_at=None):
+        self.records = [{"id": f"user{i}"} for i in range(num_records)]
+        self.missing_result_at = missing_result_at
+
+    def respond(self, method, url, data=None):
+        query = parse_qs(urlsplit(url).query)
+        limit = int(query.get("limit", ["20"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        if offset == self.missing_result_at:
+            return 500, {"message": "failed to list the users"}
+        return 200, {"result": self.records[offset:offset + limit]}
+
+
+def get_client(api):
+    client = InfoworksClientSDK()
+    client.client_config.update({"protocol": "http", "ip": "localhost", "port": "3000", "bearer_token": "token",
+                                 "refresh_token": None})
+    replayer = ApiReplayer(fallback=api.respond)
+    replayer.attach(client)
+    return client, replayer
+
+
+def list_records(client, params):
+    url = "http://localhost:3000/v3/admin/users" + IWUtils.get_query_params_string_from_dict(params=params)
+    records = []
+    for result in client.iter_pages(url):
+        records.extend(result)
+    return records
+
+
+class TestIterPages:
+
+    def test_short_first_page_makes_one_call(self):
+        client, replayer = get_client(PagedApi(7))
+        records = list_records(client, {"limit": 20})
+        assert [record["id"] for record in records] == [f"user{i}" for i in range(7)]
+        assert replayer.calls == 1
+
+    def test_empty_first_page_makes_one_call(self):
+        client, replayer = get_client(PagedApi(0))
+        assert list_records(client, {"limit": 20}) == []
+        assert replayer.calls == 1
+
+    def test_full_first_page_prefetches_the_next_pages(self):
+        client, replayer = get_client(PagedApi(45))
+        records = list_records(client, {"limit": 20})
+        assert [record["id"] for record in records] == [f"user{i}" for i in range(45)]
+        # the first page, then one batch of prefetched pages from offset 20 (those not started yet once the short page
+        # is back are cancelled)
+        assert 3 <= replayer.calls <= 1 + local_configurations.PAGINATION_PREFETCH_PAGES
+
+    def test_exact_multiple_of_the_limit(self):
+        client, replayer = get_client(PagedApi(40))
+        records = list_records(client, {"limit": 20})
+        assert len(records) == 40
+        assert len(set(record["id"] for record in records)) == 40
+        # the empty page at offset 40 ends the listing
+        assert 3 <= replayer.calls <= 1 + local_configurations.PAGINATION_PREFETCH_PAGES
+
+    def test_listing_longer_than_a_prefetch_batch(self):
+        num_pages = local_configurations.PAGINATION_PREFETCH_PAGES + 2
+        client, replayer = get_client(PagedApi(10 * num_pages))
+        records = list_records(client, {"limit": 10})
+        assert [record["id"] for record in records] == [f"user{i}" for i in range(10 * num_pages)]
+        assert num_pages + 1 <= replayer.calls <= 1 + 2 * local_configurations.PAGINATION_PREFETCH_PAGES
+
+    def test_offset_of_the_request_is_kept(self):
+        client, replayer = get_client(PagedApi(30))
+        records = list_records(client, {"limit": 10, "offset": 10})
+        assert [record["id"] for record in records] == [f"user{i}" for i in range(10, 30)]
+
+    def test_without_limit_pages_are_read_one_at_a_time(self):
+        client, replayer = get_client(PagedApi(50))
+        records = list_records(client, {"filter": {"name": "x"}})
+        assert len(records) == 50
+        # pages of the default size 20: 0, 20, 40 (short)
+        assert replayer.calls == 3
+
+    def test_no_pagination_reads_the_first_page_only(self):
+        client, replayer = get_client(PagedApi(50))
+        url = "http://localhost:3000/v3/admin/users" + IWUtils.get_query_params_string_from_dict(params={"limit": 20})
+        assert [len(result) for result in client.iter_pages(url, pagination=False)] == [20]
+        assert replayer.calls == 1
+
+    def test_page_without_result_raises(self):
+        client, replayer = get_client(PagedApi(100, missing_result_at=20))
+        with pytest.raises(PaginationError) as error:
+            list_records(client, {"limit": 20})
+        assert error.value.response == {"message": "failed to list the users"}
+
+    def test_listing_method_returns_failed_on_a_page_without_result(self):
+        client, replayer = get_client(PagedApi(100, missing_result_at=20))
+        response = client.list_users(params={"limit": 20})
+        assert response["result"]["status"].upper() == "FAILED"
+
+
+class TestIterMethods:
+
+    def test_invalid_arguments_raise_at_the_call(self):
+        client, replayer = get_client(PagedApi(5))
+        with pytest.raises(Exception, match="source id cannot be None"):
+            client.iter_tables_in_source(source_id=None)
+        with pytest.raises(Exception, match="run_id cannot be None"):
+            client.iter_workflow_run_jobs(run_id=None)
+        assert replayer.calls == 0
+
+    def test_records_are_yielded_one_at_a_time(self):
+        client, replayer = get_client(PagedApi(45))
+        sources = client.iter_sources(params={"limit": 20})
+        assert replayer.calls == 0
+        assert next(sources) == {"id": "user0"}
+        assert len(list(sources)) == 44
+
+    def test_listing_failure_is_raised_as_the_client_error(self):
+        client, replayer = get_client(PagedApi(100, missing_result_at=20))
+        with pytest.raises(SourceError):
+            list(client.iter_tables_in_source(source_id="source1", params={"limit": 20}))
@@ -0,0 +1,42 @@
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.client import InfoworksClientSDK
+from infoworks.sdk.polling import Poller
+
+
+class TestPoller:
+
+    def test_backoff_grows_up_to_the_polling_frequency(self):
+        poller = Poller(polling_frequency=10, min_interval=2, backoff_factor=2, jitter=0)
+        assert [poller.next_interval() for _ in range(5)] == [2, 4, 8, 10, 10]
+
+    def test_failed_reads_wait_the_polling_frequency_and_keep_the_backoff(self):
+        poller = Poller(polling_frequency=15, min_interval=2, backoff_factor=1.5, jitter=0)
+        assert poller.next_interval() == 2
+        assert [poller.next_interval(failed=True) for _ in range(3)] == [15, 15, 15]
+        assert poller.next_interval() == 3
+
+    def test_no_wait_goes_past_the_deadline(self):
+        poller = Poller(poll_timeout=1, polling_frequency=15, min_interval=5, jitter=0)
+        assert poller.next_interval() <= 1
+
+
+class TestPollWorkflowRun:
+
+    def test_percentage_of_the_run_is_passed_to_the_poller(self, monkeypatch):
+        states = [("running", 10), ("running", 40), ("running", 70), ("success", 100)]
+
+        def respond(method, url, data=None):
+            state, percentage = states.pop(0) if len(states) > 1 else states[0]
+            return 200, {"result": {"id": "run1", "workflow_status": {"state": state, "percentage": percentage}}}
+
+        percentages = []
+        monkeypatch.setattr(Poller, "sleep", lambda poller, percentage=None, failed=False: percentages.append(
+            percentage))
+        client = InfoworksClientSDK()
+        client.client_config.update({"protocol": "http", "ip": "localhost", "port": "3000", "bearer_token": "token",
+                                     "refresh_token": None})
+        ApiReplayer(fallback=respond).attach(client)
+        response = client.poll_workflow_run_till_completion(workflow_run_id="run1", workflow_id="workflow1",
+                                                            domain_id="domain1", poll_interval=1)
+        assert response["result"]["status"].upper() == "SUCCESS"
+        assert percentages == [10, 40, 70]
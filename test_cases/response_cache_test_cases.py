@@ -0,0 +1,112 @@
+import json
+import re
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from infoworks.sdk.api_recorder import ApiReplayer
+from infoworks.sdk.client import InfoworksClientSDK
+from infoworks.sdk.response_cache import ResponseCache, SQLiteResponseCache
+
+
+class SourcesApi(object):
+    """
+    Serves the sources and tables listings filtered by name, PATCH of /v3/sources/{id} renames the source
+    """
+
+    def __init__(self):
+        self.sources = {"src1": "sales", "src2": "orders"}
+        self.tables = {"src1": {"tbl1": "customers"}, "src2": {"tbl2": "items"}}
+
+    def respond(self, method, url, data=None):
+        parts = urlsplit(url)
+        name_filter = json.loads(parse_qs(parts.query).get("filter", ["{}"])[0])
+        match = re.match(r"/v3/sources/([^/]+)(/tables)?$", parts.path)
+        if parts.path == "/v3/sources":
+            return 200, {"result": [{"id": source_id, "name": source_name}
+                                    for source_id, source_name in self.sources.items()
+                                    if source_name == name_filter.get("name")]}
+        if match is not None and match.group(2) is not None:
+            return 200, {"result": [{"id": table_id, "name": table_name}
+                                    for table_id, table_name in self.tables[match.group(1)].items()
+                                    if table_name == name_filter.get("table")]}
+        if match is not None and method == "PATCH":
+            self.sources[match.group(1)] = data["name"]
+            return 200, {"result": {"id": match.group(1), "name": data["name"]}}
+        return 200, {"result": {}}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def response_cache(request, tmp_path):
+    if request.param == "memory":
+        return ResponseCache()
+    return SQLiteResponseCache(str(tmp_path / "responses.db"))
+
+
+def get_client(api, response_cache):
+    client = InfoworksClientSDK()
+    client.client_config.update({"protocol": "http", "ip": "localhost", "port": "3000", "bearer_token": "token",
+                                 "refresh_token": None})
+    replayer = ApiReplayer(fallback=api.respond)
+    replayer.attach(client)
+    client.set_response_cache(response_cache)
+    return client, replayer
+
+
+def get_source_id(client, source_name):
+    return client.get_sourceid_from_name(source_name)["result"]["response"]["id"]
+
+
+class TestResponseCache:
+
+    def test_repeated_lookup_is_served_from_the_cache(self, response_cache):
+        client, replayer = get_client(SourcesApi(), response_cache)
+        assert get_source_id(client, "sales") == "src1"
+        assert get_source_id(client, "sales") == "src1"
+        assert get_source_id(client, "orders") == "src2"
+        assert replayer.calls == 2
+        assert response_cache.hits == 1
+
+    def test_write_to_the_resource_drops_its_cached_lookups(self, response_cache):
+        api = SourcesApi()
+        client, replayer = get_client(api, response_cache)
+        assert get_source_id(client, "sales") == "src1"
+        assert client.get_tableid_from_name(source_id="src1", table_name="customers") == "tbl1"
+        client.update_source(source_id="src1", update_body={"name": "old_sales"})
+        api.sources["src2"] = "sales"
+        api.tables["src1"] = {"tbl3": "customers"}
+        calls = replayer.calls
+        # the listing of /v3/sources and the tables nested under the source are both dropped by the write
+        assert get_source_id(client, "sales") == "src2"
+        assert client.get_tableid_from_name(source_id="src1", table_name="customers") == "tbl3"
+        assert replayer.calls == calls + 2
+
+    def test_write_to_an_unrelated_resource_keeps_the_cache(self, response_cache):
+        client, replayer = get_client(SourcesApi(), response_cache)
+        assert get_source_id(client, "sales") == "src1"
+        client.call_api("POST", "http://localhost:3000/v3/pipelines", data={"name": "pipeline1"})
+        client.call_api("DELETE", "http://localhost:3000/v3/sources-archive/src1")
+        calls = replayer.calls
+        assert get_source_id(client, "sales") == "src1"
+        assert replayer.calls == calls
+
+    def test_expired_responses_are_read_again(self, response_cache):
+        response_cache.ttl = 0
+        client, replayer = get_client(SourcesApi(), response_cache)
+        get_source_id(client, "sales")
+        get_source_id(client, "sales")
+        assert replayer.calls == 2
+
+    def test_without_a_cache_every_lookup_calls_the_api(self):
+        client, replayer = get_client(SourcesApi(), None)
+        get_source_id(client, "sales")
+        get_source_id(client, "sales")
+        assert replayer.calls == 2
+
+    def test_sqlite_cache_is_shared_across_clients(self, tmp_path):
+        path = str(tmp_path / "responses.db")
+        client, replayer = get_client(SourcesApi(), SQLiteResponseCache(path))
+        get_source_id(client, "sales")
+        client, replayer = get_client(SourcesApi(), SQLiteResponseCache(path))
+        assert get_source_id(client, "sales") == "src1"
+        assert replayer.calls == 0
@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+
+from infoworks.sdk.cicd.streaming_json import JSONStreamReader, iter_json_file_items, load_json_file, write_json, \
+    write_json_file_if_changed
+
+SOURCE_EXPORT = {
+    "entity": {"entity_type": "source", "entity_id": "src1"},
+    "configuration": {
+        "source_configs": {"name": "sales_dev", "connection": {"url": "jdbc:oracle:thin:@dev:1521"}},
+        "table_configs": [{"entity_id": f"tbl{i}", "name": f"table_{i}", "row_count": 10 ** 20 + i,
+                           "watermark": 1.5 * i, "columns": [{"name": "id", "tags": []}, {"name": "café"}]}
+                          for i in range(5)],
+        "iw_mappings": [],
+    },
+}
+
+VALUES = [
+    SOURCE_EXPORT,
+    {},
+    [],
+    {"a": {}, "b": [], "c": [[]], "d": [{}], "e": [{"x": []}]},
+    {"unicode": "café ☃ \U0001F600", "escaped": "line\nbreak \"quoted\" \\ tab\t"},
+    {1: "int", 2.5: "float", True: "bool", None: "null"},
+    [1, -2.5, 1e100, True, False, None, "", [1, [2, [3]]]],
+    ("tuple", ["inside", ("nested",)]),
+    {"nan": float("nan"), "inf": float("inf")},
+    "scalar",
+    42,
+]
+
+
+def write(value, indent=4):
+    file_obj = io.StringIO()
+    write_json(file_obj, value, indent=indent)
+    return file_obj.getvalue()
+
+
+def dump(value, indent=4):
+    file_obj = io.StringIO()
+    json.dump(value, file_obj, indent=indent)
+    return file_obj.getvalue()
+
+
+class TestWriteJSON:
+
+    @pytest.mark.parametrize("value", VALUES)
+    @pytest.mark.parametrize("indent", [4, 2, 0])
+    def test_same_text_as_json_dump(self, value, indent):
+        assert write(value, indent) == dump(value, indent)
+
+    def test_generators_are_written_as_lists(self):
+        tables = SOURCE_EXPORT["configuration"]["table_configs"]
+        value = {"configuration": {"table_configs": (table for table in tables), "iw_mappings": iter([])}}
+        expected = {"configuration": {"table_configs": tables, "iw_mappings": []}}
+        assert write(value) == dump(expected)
+
+    def test_file_is_written_only_when_its_bytes_change(self, tmp_path):
+        file_path = str(tmp_path / "source.json")
+        assert write_json_file_if_changed(file_path, SOURCE_EXPORT) is True
+        with open(file_path) as file_obj:
+            assert file_obj.read() == dump(SOURCE_EXPORT)
+        assert write_json_file_if_changed(file_path, SOURCE_EXPORT) is False
+        assert not (tmp_path / "source.json.tmp").exists()
+        assert write_json_file_if_changed(file_path, dict(SOURCE_EXPORT, entity={})) is True
+
+
+class TestReadJSON:
+
+    def test_load_json_file_returns_the_written_document(self, tmp_path):
+        file_path = str(tmp_path / "source.json")
+        write_json_file_if_changed(file_path, SOURCE_EXPORT)
+        assert load_json_file(file_path) == SOURCE_EXPORT
+        assert load_json_file(file_path, streamed_paths=()) == SOURCE_EXPORT
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_values_cut_by_the_chunks_are_read_whole(self, chunk_size):
+        reader = JSONStreamReader(io.StringIO(dump(SOURCE_EXPORT)), chunk_size=chunk_size)
+        assert reader.read_document((("configuration", "table_configs"),)) == SOURCE_EXPORT
+
+    def test_items_of_an_array_are_read_one_at_a_time(self, tmp_path):
+        file_path = str(tmp_path / "source.json")
+        write_json_file_if_changed(file_path, SOURCE_EXPORT)
+        tables = iter_json_file_items(file_path, ("configuration", "table_configs"))
+        assert next(tables) == SOURCE_EXPORT["configuration"]["table_configs"][0]
+        assert list(tables) == SOURCE_EXPORT["configuration"]["table_configs"][1:]
+        assert list(iter_json_file_items(file_path, ("configuration", "iw_mappings"))) == []
+        assert list(iter_json_file_items(file_path, ("configuration", "missing"))) == []
+
+    def test_words_are_replaced_and_extended_json_decoded(self, tmp_path):
+        file_path = str(tmp_path / "source.json")
+        with open(file_path, "w") as file_obj:
+            json.dump({"configuration": {"source_configs": {"name": "sales_dev"}, "table_configs": [
+                {"name": "dev_table", "data": {"$binary": "aGVsbG8="}}]}}, file_obj, indent=4)
+        document = load_json_file(file_path, replace_words="dev->prod")
+        assert document["configuration"]["source_configs"] == {"name": "sales_prod"}
+        assert document["configuration"]["table_configs"] == [{"name": "prod_table", "data": b"hello"}]